@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from enum import IntEnum
-from typing import Annotated
+from typing import Annotated, final
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -60,10 +59,16 @@ class Account(BaseModel):
             nonce=nonce if nonce is not None else self.nonce,
             balance=balance if balance is not None else self.balance,
             code=code if code is not None else self.code,
-            storage=storage if storage is not None else deepcopy(self.storage),
+            storage=storage if storage is not None else dict(self.storage),
         )
 
 
+# Returned for missing addresses. Account is frozen and State never writes to
+# an account's storage in place (set_storage copies it), so one instance can be
+# shared instead of building a new model on every lookup.
+_EMPTY_ACCOUNT = Account()
+
+
 class State(BaseModel):
     """EVM world state - mapping of addresses to accounts."""
 
@@ -73,7 +78,8 @@ class State(BaseModel):
 
     def get_account(self, address: bytes) -> Account:
         """Get account at address, or empty account if not exists."""
-        return self.accounts.get(address, Account())
+        account = self.accounts.get(address)
+        return account if account is not None else _EMPTY_ACCOUNT
 
     def set_account(self, address: bytes, account: Account) -> None:
         """Set account at address."""
@@ -105,7 +111,8 @@ class State(BaseModel):
     def set_storage(self, address: bytes, key: int, value: int) -> None:
         """Set storage value at address and key."""
         account = self.get_account(address)
-        new_storage = deepcopy(account.storage)
+        # Keys and values are ints, so a shallow copy is a full copy
+        new_storage = dict(account.storage)
         if value == 0:
             new_storage.pop(key, None)
         else:
@@ -174,7 +181,7 @@ class Log(BaseModel):
 class Message(BaseModel):
     """Call frame context for EVM execution."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
 
     caller: bytes = Field(..., min_length=20, max_length=20)
     target: bytes = Field(..., min_length=20, max_length=20)
@@ -202,8 +209,15 @@ class ExecutionResult(BaseModel):
     created_address: bytes | None = None
 
 
-class Opcode(IntEnum):
-    """EVM opcodes."""
+@final
+class Opcode:
+    """
+    EVM opcodes.
+
+    Plain int constants rather than an IntEnum: the interpreter compares
+    every executed byte against these, and enum member lookup and comparison
+    cost several times more than a class attribute holding an int.
+    """
 
     # Stop and Arithmetic
     STOP = 0x00
@@ -372,20 +386,24 @@ class Opcode(IntEnum):
     SELFDESTRUCT = 0xFF
 
     @classmethod
-    def from_byte(cls, byte: int) -> Opcode | None:
+    def from_byte(cls, byte: int) -> int | None:
         """Get opcode from byte value, or None if invalid."""
-        try:
-            return cls(byte)
-        except ValueError:
-            return None
+        return byte if byte in _OPCODE_NAMES else None
+
+
+# Only the public mnemonics: the class dict also holds int-valued dunders
+# such as __final__ (a bool) and, on newer Pythons, __firstlineno__
+_OPCODE_NAMES: dict[int, str] = {
+    value: name
+    for name, value in vars(Opcode).items()
+    if not name.startswith("_") and type(value) is int
+}
 
 
 def get_opcode_name(opcode: int) -> str:
     """Get the name of an opcode."""
-    try:
-        return Opcode(opcode).name
-    except ValueError:
-        return f"UNKNOWN(0x{opcode:02X})"
+    name = _OPCODE_NAMES.get(opcode)
+    return name if name is not None else f"UNKNOWN(0x{opcode:02X})"
 
 
 def create_address(sender: bytes, nonce: int) -> bytes:
@@ -70,10 +70,9 @@ class GasSchedule:
         if new_words <= current_words:
             return 0
 
-        def cost(words: int) -> int:
-            return cls.G_MEMORY * words + (words * words) // 512
-
-        return cost(new_words) - cost(current_words)
+        new_cost = cls.G_MEMORY * new_words + (new_words * new_words) // 512
+        current_cost = cls.G_MEMORY * current_words + (current_words * current_words) // 512
+        return new_cost - current_cost
 
     @classmethod
     def copy_cost(cls, size: int) -> int:
@@ -148,10 +147,7 @@ class GasSchedule:
         """Calculate intrinsic gas for a transaction."""
         gas = cls.G_TXCREATE if is_create else cls.G_TRANSACTION
 
-        for byte in data:
-            if byte == 0:
-                gas += cls.G_TXDATAZERO
-            else:
-                gas += cls.G_TXDATANONZERO
-
-        return gas
+        # bytes.count scans in C, so large calldata costs no Python loop
+        zero_bytes = data.count(0)
+        nonzero_bytes = len(data) - zero_bytes
+        return gas + cls.G_TXDATAZERO * zero_bytes + cls.G_TXDATANONZERO * nonzero_bytes
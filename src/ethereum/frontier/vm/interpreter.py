@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ethereum.common.types import (
@@ -66,6 +67,32 @@ MAX_CALL_DEPTH = 1024
 MAX_CODE_SIZE = 24576  # EIP-170 (not in Frontier but good practice)
 
 
+@lru_cache(maxsize=1024)
+def _valid_jumpdests(code: bytes) -> frozenset[int]:
+    """
+    Find all valid JUMPDEST positions in code.
+
+    Cached by code, since the same code is typically executed many times
+    (once per fork in differential runs, and across repeated calls).
+    """
+    if Opcode.JUMPDEST not in code:
+        return frozenset()
+
+    jumpdest, push1, push32 = int(Opcode.JUMPDEST), int(Opcode.PUSH1), int(Opcode.PUSH32)
+    jumpdests = []
+    i = 0
+    size = len(code)
+    while i < size:
+        opcode = code[i]
+        if opcode == jumpdest:
+            jumpdests.append(i)
+        # Skip PUSH data
+        elif push1 <= opcode <= push32:
+            i += opcode - push1 + 1
+        i += 1
+    return frozenset(jumpdests)
+
+
 class Interpreter:
     """
     EVM interpreter for the Frontier fork.
@@ -208,20 +235,9 @@ class Interpreter:
             logs=logs,
         )
 
-    def _find_jumpdests(self, code: bytes) -> set[int]:
+    def _find_jumpdests(self, code: bytes) -> frozenset[int]:
         """Find all valid JUMPDEST positions in code."""
-        jumpdests: set[int] = set()
-        i = 0
-        while i < len(code):
-            opcode = code[i]
-            if opcode == Opcode.JUMPDEST:
-                jumpdests.add(i)
-            # Skip PUSH data
-            if Opcode.PUSH1 <= opcode <= Opcode.PUSH32:
-                push_size = opcode - Opcode.PUSH1 + 1
-                i += push_size
-            i += 1
-        return jumpdests
+        return _valid_jumpdests(code)
 
     def _charge_gas(self, gas_remaining: int, cost: int) -> int:
         """Charge gas and raise OutOfGasError if insufficient."""
@@ -239,7 +255,7 @@ class Interpreter:
         message: Message,
         gas_remaining: int,
         logs: list[Log],
-        valid_jumpdests: set[int],
+        valid_jumpdests: frozenset[int],
     ) -> _OpcodeResult:
         """Execute a single opcode and return the result."""
 
@@ -247,6 +263,37 @@ class Interpreter:
         if opcode == Opcode.STOP:
             return _OpcodeResult(done=True, success=True, gas_remaining=gas_remaining)
 
+        # PUSH, DUP and SWAP make up most real bytecode and occupy one
+        # contiguous opcode range, so they are dispatched before the long
+        # chain of single-opcode checks below
+        if Opcode.PUSH1 <= opcode <= Opcode.SWAP16:
+            # PUSH operations
+            if Opcode.PUSH1 <= opcode <= Opcode.PUSH32:
+                gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
+                push_size = opcode - Opcode.PUSH1 + 1
+                # Extract push data
+                push_data = code[pc + 1 : pc + 1 + push_size]
+                # Zero-pad if we're at the end of code
+                if len(push_data) < push_size:
+                    push_data = push_data + b"\x00" * (push_size - len(push_data))
+                value = int.from_bytes(push_data, "big")
+                stack.push(value)
+                return _OpcodeResult(pc=pc + 1 + push_size, gas_remaining=gas_remaining)
+
+            # DUP operations
+            if Opcode.DUP1 <= opcode <= Opcode.DUP16:
+                gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
+                n = opcode - Opcode.DUP1 + 1
+                stack.dup(n)
+                return _OpcodeResult(pc=pc + 1, gas_remaining=gas_remaining)
+
+            # SWAP operations
+            if Opcode.SWAP1 <= opcode <= Opcode.SWAP16:
+                gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
+                n = opcode - Opcode.SWAP1 + 1
+                stack.swap(n)
+                return _OpcodeResult(pc=pc + 1, gas_remaining=gas_remaining)
+
         # Arithmetic operations
         if opcode == Opcode.ADD:
             gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
@@ -746,33 +793,6 @@ class Interpreter:
             gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_JUMPDEST)
             return _OpcodeResult(pc=pc + 1, gas_remaining=gas_remaining)
 
-        # PUSH operations
-        if Opcode.PUSH1 <= opcode <= Opcode.PUSH32:
-            gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
-            push_size = opcode - Opcode.PUSH1 + 1
-            # Extract push data
-            push_data = code[pc + 1 : pc + 1 + push_size]
-            # Zero-pad if we're at the end of code
-            if len(push_data) < push_size:
-                push_data = push_data + b"\x00" * (push_size - len(push_data))
-            value = int.from_bytes(push_data, "big")
-            stack.push(value)
-            return _OpcodeResult(pc=pc + 1 + push_size, gas_remaining=gas_remaining)
-
-        # DUP operations
-        if Opcode.DUP1 <= opcode <= Opcode.DUP16:
-            gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
-            n = opcode - Opcode.DUP1 + 1
-            stack.dup(n)
-            return _OpcodeResult(pc=pc + 1, gas_remaining=gas_remaining)
-
-        # SWAP operations
-        if Opcode.SWAP1 <= opcode <= Opcode.SWAP16:
-            gas_remaining = self._charge_gas(gas_remaining, self.gas_schedule.G_VERYLOW)
-            n = opcode - Opcode.SWAP1 + 1
-            stack.swap(n)
-            return _OpcodeResult(pc=pc + 1, gas_remaining=gas_remaining)
-
         # LOG operations
         if Opcode.LOG0 <= opcode <= Opcode.LOG4:
             if message.is_static:
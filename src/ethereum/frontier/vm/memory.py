@@ -32,19 +32,19 @@ class Memory:
         Returns:
             The number of new words allocated
         """
-        if size == 0:
+        end = offset + size
+        # Memory is always a whole number of words, so accesses inside it
+        # never expand
+        if size == 0 or end <= len(self._data):
             return 0
 
-        end = offset + size
         current_words = self.word_size(len(self._data))
         required_words = self.word_size(end)
 
-        if required_words > current_words:
-            new_size = required_words * 32
-            self._data.extend(b"\x00" * (new_size - len(self._data)))
-            return required_words - current_words
-
-        return 0
+        # bytearray over-allocates as it grows, so repeated expansion is
+        # amortized O(1) per byte
+        self._data.extend(bytes(required_words * 32 - len(self._data)))
+        return required_words - current_words
 
     def expansion_cost(self, offset: int, size: int) -> int:
         """
@@ -56,20 +56,16 @@ class Memory:
         Returns:
             The additional gas cost for this expansion (delta)
         """
-        if size == 0:
+        end = offset + size
+        if size == 0 or end <= len(self._data):
             return 0
 
-        end = offset + size
         current_words = self.word_size(len(self._data))
         required_words = self.word_size(end)
 
-        if required_words <= current_words:
-            return 0
-
-        def memory_cost(words: int) -> int:
-            return 3 * words + (words * words) // 512
-
-        return memory_cost(required_words) - memory_cost(current_words)
+        new_cost = 3 * required_words + (required_words * required_words) // 512
+        current_cost = 3 * current_words + (current_words * current_words) // 512
+        return new_cost - current_cost
 
     def load(self, offset: int, size: int = 32) -> bytes:
         """
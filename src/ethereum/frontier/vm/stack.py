@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ethereum.common.types import u256
+from ethereum.common.types import MAX_U256
 
 
 class StackOverflowError(Exception):
@@ -40,7 +40,7 @@ class Stack:
         if len(self._data) >= self.MAX_DEPTH:
             raise StackOverflowError(f"Stack depth exceeds {self.MAX_DEPTH}")
         # Ensure value is within U256 range
-        self._data.append(u256(value))
+        self._data.append(value & MAX_U256)
 
     def pop(self) -> int:
         """Pop a value from the stack."""
@@ -79,7 +79,7 @@ class Stack:
             raise StackUnderflowError(
                 f"Cannot set at depth {depth}, stack size is {len(self._data)}"
             )
-        self._data[-(depth + 1)] = u256(value)
+        self._data[-(depth + 1)] = value & MAX_U256
 
     def dup(self, n: int) -> None:
         """
@@ -23,12 +23,18 @@ def validate_transaction(tx: Transaction, state: State) -> str | None:
     Returns:
         Error message if invalid, None if valid
     """
+    is_create = tx.to is None
+
+    # EIP-3860: Limit initcode size (Shanghai). Checked first: it depends
+    # only on the transaction, and the intrinsic gas below scans all of data
+    if is_create and len(tx.data) > 49152:  # 2 * MAX_CODE_SIZE
+        return f"Initcode too large: {len(tx.data)} > 49152"
+
     sender_account = state.get_account(tx.sender)
 
     if sender_account.nonce != tx.nonce:
         return f"Invalid nonce: expected {sender_account.nonce}, got {tx.nonce}"
 
-    is_create = tx.to is None
     intrinsic_gas = ShanghaiGasSchedule.transaction_intrinsic_gas(tx.data, is_create)
 
     if tx.gas < intrinsic_gas:
@@ -38,10 +44,6 @@ def validate_transaction(tx: Transaction, state: State) -> str | None:
     if sender_account.balance < required:
         return f"Insufficient balance: {sender_account.balance} < {required}"
 
-    # EIP-3860: Limit initcode size (Shanghai)
-    if is_create and len(tx.data) > 49152:  # 2 * MAX_CODE_SIZE
-        return f"Initcode too large: {len(tx.data)} > 49152"
-
     return None
 
 
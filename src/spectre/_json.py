@@ -0,0 +1,29 @@
+"""JSON encoding helpers with optional orjson acceleration."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """
+    Serialize obj to a JSON string indented by two spaces.
+
+    Uses orjson when installed (``pip install spectre[fast]``), falling back
+    to the standard library otherwise. Dataclasses are always passed to
+    ``default`` so both backends produce the same document.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        encoded: bytes = orjson.dumps(obj, default=default, option=option)
+        return encoded.decode()
+    return json.dumps(obj, default=default, indent=2)
@@ -175,6 +175,8 @@ class EIPAnalyzer:
 
     def __init__(self) -> None:
         self.eips = KNOWN_EIPS.copy()
+        # Boundary values per EIP number, with the spec they were built from
+        self._boundary_values: dict[int, tuple[EIPSpec, tuple[int, ...]]] = {}
 
     def get_eip(self, number: int) -> EIPSpec | None:
         """Get EIP specification by number."""
@@ -186,11 +188,24 @@ class EIPAnalyzer:
         return eip.opcodes if eip else []
 
     def get_boundary_values(self, number: int) -> list[int]:
-        """Get boundary values for testing an EIP."""
+        """
+        Get boundary values for testing an EIP.
+
+        Computed once per EIP spec, so adding or replacing an entry in
+        ``eips`` is picked up; each call returns a new list.
+        """
         eip = self.get_eip(number)
         if not eip:
             return []
-
+        cached = self._boundary_values.get(number)
+        if cached is not None and cached[0] is eip:
+            return list(cached[1])
+        values = tuple(self._compute_boundary_values(eip))
+        self._boundary_values[number] = (eip, values)
+        return list(values)
+
+    def _compute_boundary_values(self, eip: EIPSpec) -> list[int]:
+        """Collect explicit, gas-related and standard EVM boundaries."""
         # Start with explicit boundary values
         values = list(eip.boundary_values)
 
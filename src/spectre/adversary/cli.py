@@ -0,0 +1,175 @@
+"""ADVERSARY command-line interface."""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from spectre.adversary.analyzer import EIPAnalyzer
+from spectre.adversary.generator import TestGenerator
+from spectre.adversary.strategies import StrategyType
+
+console = Console()
+
+
+@click.group()
+def adversary() -> None:
+    """ADVERSARY - Adversarial test case generator.
+
+    Generates comprehensive test cases for EIP validation using
+    multiple strategies: boundary values, opcode interactions,
+    call contexts, gas exhaustion, and more.
+    """
+    pass
+
+
+@adversary.command("generate")
+@click.option(
+    "--eip",
+    type=int,
+    required=True,
+    help="EIP number to generate tests for",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=Path("fixtures"),
+    help="Output directory for test files",
+)
+@click.option(
+    "--format",
+    type=click.Choice(["json", "eest", "both"]),
+    default="both",
+    help="Output format",
+)
+@click.option(
+    "--strategy",
+    type=click.Choice(["boundary", "interaction", "gas", "fork", "all"]),
+    default="all",
+    help="Test generation strategy",
+)
+def adversary_generate(
+    eip: int,
+    output: Path,
+    format: str,
+    strategy: str,
+) -> None:
+    """Generate adversarial test cases for an EIP."""
+    console.print(Panel(f"[bold]ADVERSARY[/bold] - Test Generation (EIP-{eip})", style="yellow"))
+
+    strategy_map = {
+        "boundary": [StrategyType.BOUNDARY],
+        "interaction": [StrategyType.OPCODE_INTERACTION],
+        "gas": [StrategyType.GAS_EXHAUSTION],
+        "fork": [StrategyType.FORK_BOUNDARY],
+        "all": None,
+    }
+
+    generator = TestGenerator()
+    strategy_types = strategy_map[strategy]
+    output = Path(output)
+
+    if format == "json":
+        # Stream straight to disk without holding the whole suite in memory
+        path, strategy_counts = generator.stream_json(eip, output, strategy_types=strategy_types)
+        console.print(f"Generated {strategy_counts.total()} test cases")
+        console.print(f"Saved JSON: {path}")
+    else:
+        suite = generator.generate_for_eip(eip, strategy_types=strategy_types)
+
+        console.print(f"Generated {len(suite.test_cases)} test cases")
+
+        # Save files
+        output.mkdir(parents=True, exist_ok=True)
+
+        if format == "both":
+            path = generator.save_test_suite(suite, output, format="json")
+            console.print(f"Saved JSON: {path}")
+
+        path = generator.save_test_suite(suite, output, format="eest")
+        console.print(f"Saved EEST: {path}")
+
+        strategy_counts = Counter(tc.strategy for tc in suite.test_cases)
+
+    # Print test summary
+    table = Table(title="Generated Tests by Strategy")
+    table.add_column("Strategy", style="cyan")
+    table.add_column("Count", style="green")
+
+    for name, count in sorted((s.name, c) for s, c in strategy_counts.items()):
+        table.add_row(name, str(count))
+
+    console.print(table)
+
+
+@adversary.command("list-eips")
+def adversary_list_eips() -> None:
+    """List known EIPs with test coverage."""
+    analyzer = EIPAnalyzer()
+
+    table = Table(title="Known EIPs")
+    table.add_column("EIP", style="cyan")
+    table.add_column("Title")
+    table.add_column("Category", style="yellow")
+    table.add_column("Opcodes", style="green")
+
+    for eip_num in analyzer.list_all_eips():
+        eip = analyzer.get_eip(eip_num)
+        if eip:
+            opcodes = ", ".join(op.name for op in eip.opcodes) or "-"
+            table.add_row(
+                str(eip.number),
+                eip.title[:40],
+                eip.category.name,
+                opcodes[:30],
+            )
+
+    console.print(table)
+
+
+@adversary.command("analyze")
+@click.option("--eip", type=int, required=True, help="EIP to analyze")
+def adversary_analyze(eip: int) -> None:
+    """Analyze an EIP and show test requirements."""
+    analyzer = EIPAnalyzer()
+    spec = analyzer.get_eip(eip)
+
+    if not spec:
+        console.print(f"[red]EIP {eip} not found[/red]")
+        return
+
+    console.print(Panel(f"[bold]EIP-{eip}:[/bold] {spec.title}", style="cyan"))
+
+    # Opcodes
+    if spec.opcodes:
+        table = Table(title="Affected Opcodes")
+        table.add_column("Opcode", style="cyan")
+        table.add_column("Name", style="yellow")
+        table.add_column("Change Type")
+        table.add_column("Gas Cost", style="green")
+
+        for op in spec.opcodes:
+            table.add_row(
+                f"0x{op.opcode:02X}",
+                op.name,
+                op.change_type.name,
+                str(op.gas_cost) if op.gas_cost else "-",
+            )
+
+        console.print(table)
+
+    # Boundary values
+    boundaries = analyzer.get_boundary_values(eip)[:20]
+    if boundaries:
+        console.print("\n[bold]Key Boundary Values:[/bold]")
+        console.print(", ".join(str(b) for b in boundaries))
+
+    # Related EIPs
+    related = analyzer.get_related_eips(eip)
+    if related:
+        console.print(f"\n[bold]Related EIPs:[/bold] {related}")
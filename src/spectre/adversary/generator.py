@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterator
+import tempfile
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from spectre.adversary.analyzer import EIPAnalyzer
+from spectre._json import dumps
+from spectre.adversary.analyzer import EIPAnalyzer, EIPSpec
 from spectre.adversary.strategies import (
     StrategyType,
     TestCase,
@@ -18,28 +22,77 @@ from spectre.adversary.strategies import (
 )
 
 
+def suite_header(
+    eip_number: int,
+    eip_title: str,
+    generated_at: str,
+    test_count: int,
+) -> dict[str, Any]:
+    """Suite-level fields shared by all serialized forms, in document order."""
+    return {
+        "eip_number": eip_number,
+        "eip_title": eip_title,
+        "generated_at": generated_at,
+        "test_count": test_count,
+    }
+
+
+class _StreamedArray(list[Any]):
+    """
+    Array whose items are produced while json.dump encodes it.
+
+    json.dump only takes the length and iterates, so subclassing list lets
+    the standard encoder lay it out like any other array.
+    """
+
+    def __init__(self, items: Iterable[Any], length: int) -> None:
+        super().__init__()
+        self._items = items
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+
 @dataclass
 class TestSuite:
     """A collection of test cases for an EIP."""
 
+    # Not a pytest test class, despite the name
+    __test__ = False
+
     eip_number: int
     eip_title: str
     test_cases: list[TestCase] = field(default_factory=list)
     generated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    def _header(self) -> dict[str, Any]:
+        """Suite-level fields shared by all serialized forms."""
+        return suite_header(
+            self.eip_number, self.eip_title, self.generated_at, len(self.test_cases)
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
-            "eip_number": self.eip_number,
-            "eip_title": self.eip_title,
-            "generated_at": self.generated_at,
-            "test_count": len(self.test_cases),
+            **self._header(),
             "tests": [tc.to_dict() for tc in self.test_cases],
         }
 
     def to_json(self, indent: int = 2) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        """
+        Convert to JSON string.
+
+        Test cases are handed to the encoder as-is and converted one at a
+        time, so the full list of per-test dicts is never built.
+        """
+        if indent != 2:
+            return json.dumps(self.to_dict(), indent=indent)
+        data = {**self._header(), "tests": self.test_cases}
+        return dumps(data, default=TestCase.to_dict)
 
     def to_eest_format(self) -> dict[str, Any]:
         """
@@ -117,6 +170,15 @@ class TestSuite:
         return pre
 
 
+def _run_strategy(
+    strategy: TestStrategy,
+    eip: EIPSpec,
+    analyzer: EIPAnalyzer,
+) -> list[TestCase]:
+    """Run a strategy to completion (used as a worker process entry point)."""
+    return list(strategy.generate(eip, analyzer))
+
+
 class TestGenerator:
     """
     Generate test cases for EIP validation.
@@ -124,13 +186,26 @@ class TestGenerator:
     Uses multiple strategies to create comprehensive test coverage.
     """
 
+    # Not a pytest test class, despite the name
+    __test__ = False
+
     def __init__(
         self,
         strategies: list[TestStrategy] | None = None,
         analyzer: EIPAnalyzer | None = None,
+        parallel: int = 1,
     ) -> None:
+        """
+        Initialize test generator.
+
+        Args:
+            strategies: Strategies to generate with (default: all)
+            analyzer: EIP analyzer to look up specifications
+            parallel: Number of worker processes running strategies
+        """
         self.strategies = strategies or get_all_strategies()
         self.analyzer = analyzer or EIPAnalyzer()
+        self.parallel = parallel
 
     def generate_for_eip(
         self,
@@ -154,21 +229,84 @@ class TestGenerator:
                 eip_title=f"Unknown EIP {eip_number}",
             )
 
-        test_cases: list[TestCase] = []
-
-        for strategy in self.strategies:
-            if strategy_types and strategy.strategy_type not in strategy_types:
-                continue
-
-            for test_case in strategy.generate(eip, self.analyzer):
-                test_cases.append(test_case)
-
         return TestSuite(
             eip_number=eip.number,
             eip_title=eip.title,
-            test_cases=test_cases,
+            test_cases=list(self._iter_test_cases(eip, strategy_types)),
         )
 
+    def _iter_test_cases(
+        self,
+        eip: EIPSpec,
+        strategy_types: list[StrategyType] | None,
+    ) -> Iterator[TestCase]:
+        """Yield the test cases of the selected strategies, in strategy order."""
+        strategies = [
+            s for s in self.strategies if not strategy_types or s.strategy_type in strategy_types
+        ]
+
+        if self.parallel > 1 and len(strategies) > 1:
+            # Strategies share no mutable state, so each runs in its own process
+            with ProcessPoolExecutor(max_workers=self.parallel) as executor:
+                futures = [
+                    executor.submit(_run_strategy, strategy, eip, self.analyzer)
+                    for strategy in strategies
+                ]
+                for future in futures:
+                    yield from future.result()
+        else:
+            for strategy in strategies:
+                yield from strategy.generate(eip, self.analyzer)
+
+    def stream_json(
+        self,
+        eip_number: int,
+        output_dir: Path,
+        strategy_types: list[StrategyType] | None = None,
+    ) -> tuple[Path, Counter[StrategyType]]:
+        """
+        Generate test cases for an EIP and write them to JSON without a suite.
+
+        Test cases are encoded one at a time into a temporary file as they
+        are generated, so the suite is never held in memory; the document
+        then gets the same layout as ``save_test_suite`` writes. With
+        parallel > 1 each strategy's cases arrive from its worker as a batch.
+
+        Args:
+            eip_number: The EIP number to generate tests for
+            output_dir: Directory to save to
+            strategy_types: Specific strategies to use (default: all)
+
+        Returns:
+            Path to the saved file and the number of tests per strategy
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / f"eip{eip_number}_tests.json"
+
+        eip = self.analyzer.get_eip(eip_number)
+        test_cases = self._iter_test_cases(eip, strategy_types) if eip else iter(())
+
+        counts: Counter[StrategyType] = Counter()
+        with tempfile.TemporaryFile("w+") as spool:
+            # One compact JSON line per test, read back while writing the file
+            for tc in test_cases:
+                spool.write(json.dumps(tc.to_dict()) + "\n")
+                counts[tc.strategy] += 1
+            spool.seek(0)
+
+            header = suite_header(
+                eip.number if eip else eip_number,
+                eip.title if eip else f"Unknown EIP {eip_number}",
+                datetime.now().isoformat(),
+                counts.total(),
+            )
+            tests = _StreamedArray(map(json.loads, spool), counts.total())
+            with output_path.open("w") as f:
+                json.dump({**header, "tests": tests}, f, indent=2)
+
+        return output_path, counts
+
     def generate_for_opcodes(
         self,
         opcodes: list[int],
@@ -218,7 +356,7 @@ class TestGenerator:
             content = suite.to_json()
         elif format == "eest":
             filename = f"eip{suite.eip_number}_tests_eest.json"
-            content = json.dumps(suite.to_eest_format(), indent=2)
+            content = dumps(suite.to_eest_format())
         else:
             raise ValueError(f"Unknown format: {format}")
 
@@ -24,10 +24,42 @@ class StrategyType(Enum):
     MEMORY_EXPANSION = auto()
 
 
+# Pool of generated bytecodes so that equal programs share a single object
+_BYTECODE_POOL: dict[bytes, bytes] = {}
+
+
+def _intern(code: bytes) -> bytes:
+    """Return the pooled instance of a bytecode."""
+    return _BYTECODE_POOL.setdefault(code, code)
+
+
+# PUSH1..PUSH32 as plain ints, indexed by operand length - 1
+_PUSH_OPCODES: tuple[int, ...] = tuple(range(int(Opcode.PUSH1), int(Opcode.PUSH1) + 32))
+
+
+def _encode_push(value: int) -> bytes:
+    """Generate PUSH instruction for value."""
+    if value == 0:
+        return bytes((_PUSH_OPCODES[0], 0))
+    byte_length = (value.bit_length() + 7) // 8
+    byte_length = min(max(byte_length, 1), 32)
+    value_bytes = value.to_bytes(byte_length, "big")
+    return bytes((_PUSH_OPCODES[byte_length - 1],)) + value_bytes
+
+
+# Invariant code fragments, built once at import time
+_PUSH_ZERO = _encode_push(0)
+_PUSH_LOOP_COUNT = _encode_push(100)
+_STACK_FILL_1020 = _PUSH_ZERO * 1020
+
+
 @dataclass
 class TestCase:
     """A generated test case."""
 
+    # Not a pytest test class, despite the name
+    __test__ = False
+
     name: str
     strategy: StrategyType
     bytecode: bytes
@@ -71,13 +103,7 @@ class TestStrategy(ABC):
 
     def _push_value(self, value: int) -> bytes:
         """Generate PUSH instruction for value."""
-        if value == 0:
-            return bytes([Opcode.PUSH1, 0])
-        byte_length = (value.bit_length() + 7) // 8
-        byte_length = min(max(byte_length, 1), 32)
-        opcode = Opcode.PUSH1 + byte_length - 1
-        value_bytes = value.to_bytes(byte_length, "big")
-        return bytes([opcode]) + value_bytes
+        return _encode_push(value)
 
 
 class BoundaryValueStrategy(TestStrategy):
@@ -140,11 +166,10 @@ class OpcodeInteractionStrategy(TestStrategy):
             # Test with stack operations
             yield from self._generate_stack_interactions(opcode_spec)
 
-            # Test with memory operations
-            yield from self._generate_memory_interactions(opcode_spec)
-
-            # Test with control flow
-            yield from self._generate_control_flow_interactions(opcode_spec)
+            # Memory and control flow both consume the result
+            if opcode_spec.stack_output > 0:
+                yield from self._generate_memory_interactions(opcode_spec)
+                yield from self._generate_control_flow_interactions(opcode_spec)
 
     def _generate_stack_interactions(self, opcode_spec: OpcodeSpec) -> Iterator[TestCase]:
         """Generate stack operation interactions."""
@@ -182,46 +207,44 @@ class OpcodeInteractionStrategy(TestStrategy):
             )
 
     def _generate_memory_interactions(self, opcode_spec: OpcodeSpec) -> Iterator[TestCase]:
-        """Generate memory operation interactions."""
-        if opcode_spec.stack_output > 0:
-            # Store result in memory
-            code = bytearray()
-            for _ in range(opcode_spec.stack_input):
-                code.extend(self._push_value(42))
-            code.append(opcode_spec.opcode)
-            code.extend(self._push_value(0))  # offset
-            code.append(Opcode.MSTORE)
-            code.append(Opcode.STOP)
+        """Generate memory operation interactions (needs a stack output)."""
+        # Store result in memory
+        code = bytearray()
+        for _ in range(opcode_spec.stack_input):
+            code.extend(self._push_value(42))
+        code.append(opcode_spec.opcode)
+        code.extend(self._push_value(0))  # offset
+        code.append(Opcode.MSTORE)
+        code.append(Opcode.STOP)
 
-            yield TestCase(
-                name=f"memory_store_{opcode_spec.name}",
-                strategy=self.strategy_type,
-                bytecode=bytes(code),
-                description=f"Test storing {opcode_spec.name} result in memory",
-            )
+        yield TestCase(
+            name=f"memory_store_{opcode_spec.name}",
+            strategy=self.strategy_type,
+            bytecode=bytes(code),
+            description=f"Test storing {opcode_spec.name} result in memory",
+        )
 
     def _generate_control_flow_interactions(self, opcode_spec: OpcodeSpec) -> Iterator[TestCase]:
-        """Generate control flow interactions."""
-        if opcode_spec.stack_output > 0:
-            # Use result in conditional jump
-            code = bytearray()
-            for _ in range(opcode_spec.stack_input):
-                code.extend(self._push_value(1))
-            code.append(opcode_spec.opcode)
-            # JUMPI target
-            jump_target = len(code) + 4
-            code.extend(self._push_value(jump_target))
-            code.append(Opcode.JUMPI)
-            code.append(Opcode.STOP)
-            code.append(Opcode.JUMPDEST)
-            code.append(Opcode.STOP)
+        """Generate control flow interactions (needs a stack output)."""
+        # Use result in conditional jump
+        code = bytearray()
+        for _ in range(opcode_spec.stack_input):
+            code.extend(self._push_value(1))
+        code.append(opcode_spec.opcode)
+        # JUMPI target
+        jump_target = len(code) + 4
+        code.extend(self._push_value(jump_target))
+        code.append(Opcode.JUMPI)
+        code.append(Opcode.STOP)
+        code.append(Opcode.JUMPDEST)
+        code.append(Opcode.STOP)
 
-            yield TestCase(
-                name=f"control_jumpi_{opcode_spec.name}",
-                strategy=self.strategy_type,
-                bytecode=bytes(code),
-                description=f"Test using {opcode_spec.name} result in JUMPI",
-            )
+        yield TestCase(
+            name=f"control_jumpi_{opcode_spec.name}",
+            strategy=self.strategy_type,
+            bytecode=bytes(code),
+            description=f"Test using {opcode_spec.name} result in JUMPI",
+        )
 
 
 class CallContextStrategy(TestStrategy):
@@ -253,7 +276,7 @@ class CallContextStrategy(TestStrategy):
             code.extend(self._push_value(0))
         code.append(opcode_spec.opcode)
         code.append(Opcode.STOP)
-        return bytes(code)
+        return _intern(bytes(code))
 
 
 class GasExhaustionStrategy(TestStrategy):
@@ -299,14 +322,14 @@ class GasExhaustionStrategy(TestStrategy):
             code.extend(self._push_value(1))
         code.append(opcode_spec.opcode)
         code.append(Opcode.STOP)
-        return bytes(code)
+        return _intern(bytes(code))
 
     def _generate_loop_code(self, opcode_spec: OpcodeSpec) -> bytes:
         """Generate code that loops an opcode."""
         code = bytearray()
 
         # Setup: push counter
-        code.extend(self._push_value(100))  # Loop 100 times
+        code.extend(_PUSH_LOOP_COUNT)  # Loop 100 times
 
         # Loop start (JUMPDEST)
         loop_start = len(code)
@@ -330,7 +353,7 @@ class GasExhaustionStrategy(TestStrategy):
         code.append(Opcode.JUMPI)
 
         code.append(Opcode.STOP)
-        return bytes(code)
+        return _intern(bytes(code))
 
 
 class ForkBoundaryStrategy(TestStrategy):
@@ -364,7 +387,7 @@ class ForkBoundaryStrategy(TestStrategy):
             code.extend(self._push_value(0))
         code.append(opcode_spec.opcode)
         code.append(Opcode.STOP)
-        return bytes(code)
+        return _intern(bytes(code))
 
 
 class StackDepthStrategy(TestStrategy):
@@ -384,19 +407,9 @@ class StackDepthStrategy(TestStrategy):
 
     def _generate_stack_limit_code(self, opcode_spec: OpcodeSpec) -> bytes:
         """Generate code that pushes to near stack limit."""
-        code = bytearray()
-
-        # Push many values (but stay under 1024 limit)
-        for _ in range(1020):
-            code.extend(self._push_value(0))
-
-        # Execute target opcode
-        for _ in range(opcode_spec.stack_input):
-            pass  # Already have values on stack
-        code.append(opcode_spec.opcode)
-
-        code.append(Opcode.STOP)
-        return bytes(code)
+        # Push many values (but stay under 1024 limit), then execute the
+        # target opcode; the fill already provides its stack inputs
+        return _intern(_STACK_FILL_1020 + bytes([opcode_spec.opcode, Opcode.STOP]))
 
 
 # All strategies
@@ -410,14 +423,17 @@ ALL_STRATEGIES: list[type[TestStrategy]] = [
 ]
 
 
+# Strategies are stateless, so one shared instance per type is enough
+_STRATEGIES_BY_TYPE: dict[StrategyType, TestStrategy] = {
+    s.strategy_type: s() for s in ALL_STRATEGIES
+}
+
+
 def get_all_strategies() -> list[TestStrategy]:
-    """Get instances of all strategies."""
-    return [s() for s in ALL_STRATEGIES]
+    """Get the shared instances of all strategies, in ALL_STRATEGIES order."""
+    return list(_STRATEGIES_BY_TYPE.values())
 
 
 def get_strategy(strategy_type: StrategyType) -> TestStrategy | None:
     """Get a strategy by type."""
-    for s in ALL_STRATEGIES:
-        if s.strategy_type == strategy_type:
-            return s()
-    return None
+    return _STRATEGIES_BY_TYPE.get(strategy_type)
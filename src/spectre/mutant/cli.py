@@ -0,0 +1,167 @@
+"""MUTANT command-line interface."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from spectre.mutant.engine import MutationEngine, UnmutatedTestsFailedError
+from spectre.mutant.operators import ALL_OPERATORS
+from spectre.mutant.report import MutationReport
+
+console = Console()
+
+
+@click.group()
+def mutant() -> None:
+    """MUTANT - Mutation testing for EVM specifications.
+
+    Tests the quality of the test suite by introducing small changes
+    (mutations) to the code and checking if tests detect them.
+    """
+    pass
+
+
+@mutant.command("run")
+@click.option(
+    "--fork",
+    type=click.Choice(["frontier", "homestead", "shanghai"]),
+    default="frontier",
+    help="Fork to run mutation testing on",
+)
+@click.option(
+    "--source-dir",
+    type=click.Path(exists=True, path_type=Path),
+    default=Path("src/ethereum"),
+    help="Source directory to mutate",
+)
+@click.option(
+    "--test-dir",
+    type=click.Path(exists=True, path_type=Path),
+    default=Path("tests"),
+    help="Test directory",
+)
+@click.option(
+    "--max-mutants",
+    type=int,
+    default=None,
+    help="Maximum number of mutants to test",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Output file for report",
+)
+@click.option(
+    "--parallel",
+    type=int,
+    default=None,
+    help="Number of mutants to test concurrently (default: CPU count)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Reuse results from .spectre_mutcache.json for unchanged files",
+)
+@click.option(
+    "--only-covered",
+    is_flag=True,
+    help="Skip mutants of code no test executes (needs coverage)",
+)
+@click.option(
+    "--skip-surviving-lines",
+    is_flag=True,
+    help="Stop testing a line's mutants once one of them survives",
+)
+@click.option(
+    "--no-plugin-autoload",
+    is_flag=True,
+    help="Don't autoload installed pytest plugins (faster; list needed ones with --pytest-plugin)",
+)
+@click.option(
+    "--pytest-plugin",
+    "pytest_plugins",
+    multiple=True,
+    help="Pytest plugin to load for every mutant run (repeatable)",
+)
+@click.option("--html", is_flag=True, help="Generate HTML report")
+@click.option("--ndjson", is_flag=True, help="Write the JSON report as one result per line")
+@click.option("--quick", is_flag=True, help="Quick mode with sampling")
+def mutant_run(
+    fork: str,
+    source_dir: Path,
+    test_dir: Path,
+    max_mutants: int | None,
+    output: Path | None,
+    parallel: int | None,
+    incremental: bool,
+    only_covered: bool,
+    skip_surviving_lines: bool,
+    no_plugin_autoload: bool,
+    pytest_plugins: tuple[str, ...],
+    html: bool,
+    ndjson: bool,
+    quick: bool,
+) -> None:
+    """Run mutation testing on EVM implementation."""
+    console.print(Panel(f"[bold]MUTANT[/bold] - Mutation Testing ({fork})", style="cyan"))
+
+    # Adjust source directory for fork
+    fork_source = source_dir / fork
+    if not fork_source.exists():
+        fork_source = source_dir
+
+    console.print(f"Source: {fork_source}")
+    console.print(f"Tests: {test_dir}")
+
+    engine = MutationEngine(
+        source_dir=fork_source,
+        test_dir=test_dir,
+        parallel=parallel,
+        cache_path=Path(".spectre_mutcache.json") if incremental else None,
+        only_covered=only_covered,
+        skip_surviving_lines=skip_surviving_lines,
+        pytest_plugins=list(pytest_plugins),
+        autoload_plugins=not no_plugin_autoload,
+    )
+
+    with console.status("Running mutation tests..."):
+        try:
+            if quick:
+                result = engine.run_quick(sample_size=max_mutants or 10)
+            else:
+                result = engine.run(max_mutants=max_mutants, file_filter=fork)
+        except UnmutatedTestsFailedError as e:
+            console.print(str(e), style="red", markup=False)
+            raise SystemExit(1) from e
+
+    # Generate report
+    report = MutationReport(result)
+    report.print_summary()
+    report.print_survivors()
+
+    if output:
+        if html:
+            report.save_html(output.with_suffix(".html"))
+        elif ndjson:
+            report.save_ndjson(output.with_suffix(".ndjson"))
+        else:
+            report.save_json(output.with_suffix(".json"))
+
+
+@mutant.command("list-operators")
+def mutant_list_operators() -> None:
+    """List available mutation operators."""
+    table = Table(title="Mutation Operators")
+    table.add_column("Name", style="cyan")
+    table.add_column("Description")
+
+    for op_class in ALL_OPERATORS:
+        table.add_row(op_class.name, op_class.description)
+
+    console.print(table)
@@ -2,20 +2,36 @@
 
 from __future__ import annotations
 
+import ast
+import atexit
+import hashlib
+import json
+import os
+import random
+import select
 import shutil
 import subprocess
 import sys
 import tempfile
-from collections.abc import Iterator
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from itertools import groupby, islice
 from pathlib import Path
+from typing import Any
 
 from spectre.mutant.operators import (
     Mutation,
     MutationOperator,
+    SyntaxTreeOperator,
+    comment_and_docstring_lines,
     get_all_operators,
+    parse_lines,
 )
+from spectre.mutant.schema import MUTANT_ID_ENV, build_schema
 
 
 class MutantStatus(Enum):
@@ -36,6 +52,7 @@ class MutantResult:
     status: MutantStatus
     test_output: str = ""
     duration: float = 0.0
+    skipped: bool = False  # Status was inferred without running the tests
 
 
 @dataclass
@@ -62,6 +79,284 @@ class MutationTestResult:
         return [r for r in self.results if r.status == MutantStatus.SURVIVED]
 
 
+@dataclass
+class MutationCache:
+    """
+    Outcomes of previously tested mutants, persisted between runs.
+
+    Entries are keyed by a hash of the unmutated file plus the mutation
+    itself, so editing a file invalidates only that file's mutants. The
+    whole cache is discarded when the test suite changes.
+    """
+
+    tests_hash: str = ""
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    # Only deterministic outcomes are reused; timeouts and errors are retried
+    CACHEABLE = (MutantStatus.KILLED, MutantStatus.SURVIVED)
+
+    @staticmethod
+    def _key(file_hash: str, mutation: Mutation) -> str:
+        return "\x1f".join(
+            (
+                file_hash,
+                str(mutation.line_number),
+                mutation.mutation_type.name,
+                mutation.original,
+                mutation.mutated,
+            )
+        )
+
+    def get(self, file_hash: str, mutation: Mutation) -> MutantResult | None:
+        """Look up a cached result for a mutation of a file with this hash."""
+        entry = self.entries.get(self._key(file_hash, mutation))
+        if entry is None:
+            return None
+        return MutantResult(
+            mutation=mutation,
+            status=MutantStatus[entry["status"]],
+            test_output=entry["test_output"],
+            duration=entry["duration"],
+        )
+
+    def put(self, file_hash: str, result: MutantResult) -> None:
+        """Record a result if its outcome was tested and is deterministic."""
+        if result.skipped or result.status not in self.CACHEABLE:
+            return
+        self.entries[self._key(file_hash, result.mutation)] = {
+            "status": result.status.name,
+            "test_output": result.test_output,
+            "duration": result.duration,
+        }
+
+    @classmethod
+    def load(cls, path: Path, tests_hash: str) -> MutationCache:
+        """Load a cache, starting empty if it is missing, unreadable or stale."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return cls(tests_hash=tests_hash)
+        if not isinstance(data, dict) or data.get("tests_hash") != tests_hash:
+            return cls(tests_hash=tests_hash)
+        return cls(tests_hash=tests_hash, entries=data.get("entries", {}))
+
+    def save(self, path: Path) -> None:
+        """Write the cache to disk."""
+        Path(path).write_text(json.dumps({"tests_hash": self.tests_hash, "entries": self.entries}))
+
+
+def _statement_lines(source: str) -> set[int]:
+    """First lines of every statement in a source file."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set()
+    return {node.lineno for node in ast.walk(tree) if isinstance(node, ast.stmt)}
+
+
+def _unique(mutations: Iterable[Mutation]) -> Iterator[Mutation]:
+    """Drop mutants whose mutated line another operator already produced."""
+    seen: set[tuple[str, int, str]] = set()
+    for mutation in mutations:
+        key = (mutation.file_path, mutation.line_number, mutation.mutated)
+        if key not in seen:
+            seen.add(key)
+            yield mutation
+
+
+def stratified_sample(
+    mutations: list[Mutation],
+    sample_size: int,
+    rng: random.Random | None = None,
+) -> list[Mutation]:
+    """
+    Sample mutations with a per-file quota proportional to each file's share.
+
+    Every file with mutations gets at least one slot while the sample size
+    allows. The sample keeps the original order of the mutations.
+
+    Args:
+        mutations: Mutations to sample from
+        sample_size: Number of mutations to return
+        rng: Random generator to use (default: the random module)
+
+    Returns:
+        The sampled mutations
+    """
+    if len(mutations) <= sample_size:
+        return list(mutations)
+    sample = rng.sample if rng else random.sample
+
+    by_file: dict[str, list[int]] = {}
+    for i, mutation in enumerate(mutations):
+        by_file.setdefault(mutation.file_path, []).append(i)
+
+    # One slot per file, then the rest split in proportion to file size
+    spare = sample_size - len(by_file)
+    chosen: list[int] = []
+    for indices in by_file.values():
+        quota = 1 + max(0, spare) * len(indices) // len(mutations)
+        chosen.extend(sample(indices, min(quota, len(indices))))
+
+    if len(chosen) > sample_size:
+        # More files than slots
+        chosen = sample(chosen, sample_size)
+    elif len(chosen) < sample_size:
+        # Hand slots lost to rounding down to random remaining mutations
+        taken = set(chosen)
+        rest = [i for i in range(len(mutations)) if i not in taken]
+        chosen.extend(sample(rest, sample_size - len(chosen)))
+
+    return [mutations[i] for i in sorted(chosen)]
+
+
+def _hash_text(text: str) -> str:
+    """Short content hash used to key cached mutant results."""
+    return hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+def _memory_backed_dir() -> str | None:
+    """Directory on tmpfs for mutant workspaces, if the platform has one."""
+    shm = Path("/dev/shm")
+    if sys.platform == "linux" and shm.is_dir() and os.access(shm, os.W_OK | os.X_OK):
+        return str(shm)
+    return None
+
+
+# Mutant workspaces (and the __pycache__ written inside them) live in memory
+# where possible; elsewhere they go to the default temporary directory
+_WORKSPACE_ROOT = _memory_backed_dir()
+
+# Environment for every pytest run against a mutant. Mutants already run in
+# parallel, so keep each pytest single-process.
+_PYTEST_ENV = {"PYTEST_XDIST_AUTO_NUM_WORKERS": "1"}
+
+_PLUGIN_AUTOLOAD_ENV = "PYTEST_DISABLE_PLUGIN_AUTOLOAD"
+
+# Bytes of pytest output kept from each end; the rest is read and dropped
+_OUTPUT_LIMIT = 8192
+
+
+def _run_capped(args: list[str], timeout: float, **kwargs: Any) -> tuple[int, str]:
+    """
+    Run a command, keeping only the start and end of its combined output.
+
+    The pipe is drained to the end so the command never blocks or sees a
+    broken pipe, but at most 2 * _OUTPUT_LIMIT bytes are held in memory;
+    the tail keeps pytest's summary line.
+
+    Returns:
+        Tuple of (returncode, output)
+
+    Raises:
+        subprocess.TimeoutExpired: If the command outlives timeout
+    """
+    head = bytearray()
+    tail = b""
+    dropped = False
+
+    with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **kwargs) as proc:
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()
+
+        def drain() -> None:
+            nonlocal tail, dropped
+            while chunk := os.read(fd, 65536):
+                room = _OUTPUT_LIMIT - len(head)
+                head.extend(chunk[:room])
+                rest = tail + chunk[room:]
+                dropped = dropped or len(rest) > _OUTPUT_LIMIT
+                tail = rest[-_OUTPUT_LIMIT:]
+
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            # A surviving grandchild may hold the pipe open; don't wait on it
+            reader.join(timeout=1)
+            raise
+        reader.join()
+
+    output = bytes(head) + (b"\n...\n" if dropped else b"") + tail
+    return returncode, output.decode(errors="replace")
+
+
+_DAEMON_SCRIPT = Path(__file__).with_name("pytest_daemon.py")
+
+
+class _PytestDaemon:
+    """Handle on a warm pytest worker process (see pytest_daemon.py)."""
+
+    def __init__(self) -> None:
+        self.process = subprocess.Popen(
+            [sys.executable, str(_DAEMON_SCRIPT)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            env={**os.environ, "PYTHONPATH": "", **_PYTEST_ENV},
+        )
+
+    def run(self, request: dict[str, Any], timeout: float) -> tuple[bool, str]:
+        """
+        Send one test request and wait for its answer.
+
+        Raises:
+            subprocess.TimeoutExpired: If no answer arrives within timeout
+            RuntimeError: If the daemon has exited
+        """
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self.process.stdin.write(json.dumps(request) + "\n")
+        self.process.stdin.flush()
+
+        ready, _, _ = select.select([self.process.stdout], [], [], timeout)
+        if not ready:
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("pytest daemon exited")
+        response = json.loads(line)
+        return bool(response["passed"]), str(response["output"])
+
+    def close(self) -> None:
+        """Stop the daemon."""
+        self.process.kill()
+        self.process.wait()
+
+
+# One daemon per process, so each parallel worker gets its own. The owning
+# pid is recorded because forked workers inherit the parent's handle.
+_daemon: _PytestDaemon | None = None
+_daemon_pid = 0
+
+
+def _get_daemon() -> _PytestDaemon:
+    global _daemon, _daemon_pid
+    if _daemon is None or _daemon_pid != os.getpid():
+        _daemon = _PytestDaemon()
+        _daemon_pid = os.getpid()
+        atexit.register(_daemon.close)
+    return _daemon
+
+
+def _reset_daemon() -> None:
+    global _daemon
+    if _daemon is not None and _daemon_pid == os.getpid():
+        atexit.unregister(_daemon.close)
+        _daemon.close()
+    _daemon = None
+
+
+def _test_mutant(engine: MutationEngine, mutation: Mutation) -> MutantResult:
+    """Test one mutant (used as a worker process entry point)."""
+    return engine.test_mutant(mutation)
+
+
+class UnmutatedTestsFailedError(RuntimeError):
+    """The test suite already fails before any mutation is applied."""
+
+
 class MutationEngine:
     """
     Mutation testing engine for EVM specifications.
@@ -75,7 +370,14 @@ class MutationEngine:
         test_dir: Path,
         operators: list[MutationOperator] | None = None,
         timeout: int = 60,
-        parallel: int = 1,
+        parallel: int | None = None,
+        cache_path: Path | None = None,
+        warm_pytest: bool = True,
+        use_schema: bool = True,
+        only_covered: bool = False,
+        pytest_plugins: list[str] | None = None,
+        skip_surviving_lines: bool = False,
+        autoload_plugins: bool = True,
     ) -> None:
         """
         Initialize mutation engine.
@@ -85,51 +387,130 @@ class MutationEngine:
             test_dir: Directory containing test files
             operators: Mutation operators to use (default: all)
             timeout: Timeout for running tests in seconds
-            parallel: Number of parallel test runs (not yet implemented)
+            parallel: Number of mutants tested concurrently (default: CPU count)
+            cache_path: File to persist results in so unchanged files are
+                not retested on the next run (default: no caching)
+            warm_pytest: Run tests in a long-lived pytest process instead of
+                starting a new interpreter per mutant (POSIX only)
+            use_schema: Encode mutants of simple statements into one shared
+                workspace selected by environment variable, instead of
+                writing a mutated copy per mutant
+            only_covered: Measure test coverage once and mark mutants of
+                statements no test executes as survived without testing
+                them (needs the coverage package)
+            pytest_plugins: Extra plugins to load when testing mutants, passed
+                as -p NAME (e.g. ["hypothesis.extra.pytestplugin"])
+            skip_surviving_lines: Once a mutant of a line survives, report
+                the line's remaining mutants as survived without testing them
+            autoload_plugins: Let pytest load installed entry-point plugins.
+                Turning this off makes each run faster, but the plugins the
+                tests or their configuration need must then be listed in
+                pytest_plugins
         """
         self.source_dir = Path(source_dir)
         self.test_dir = Path(test_dir)
         self.operators = operators or get_all_operators()
         self.timeout = timeout
-        self.parallel = parallel
+        self.parallel = parallel or os.cpu_count() or 1
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.warm_pytest = warm_pytest and os.name == "posix"
+        self.use_schema = use_schema
+        self.only_covered = only_covered
+        self.pytest_plugins = pytest_plugins or []
+        self.skip_surviving_lines = skip_surviving_lines
+        self.autoload_plugins = autoload_plugins
+        # Unmutated text and lines per file, keyed by path relative to source_dir
+        self._source_cache: dict[Path, tuple[str, list[str]]] = {}
+        # Shared schema workspace for the current run and the mutants it encodes
+        self._schema_dir: Path | None = None
+        self._schema_ids: dict[Mutation, str] = {}
 
     def find_source_files(self, pattern: str = "*.py") -> list[Path]:
         """Find all source files to mutate."""
         return list(self.source_dir.rglob(pattern))
 
+    def _source(self, rel_path: Path) -> tuple[str, list[str]]:
+        """Get the unmutated text and lines of a source file, reading it once."""
+        cached = self._source_cache.get(rel_path)
+        if cached is None:
+            text = (self.source_dir / rel_path).read_text()
+            cached = self._source_cache[rel_path] = (text, text.split("\n"))
+        return cached
+
+    def load_sources(self) -> None:
+        """Read every source file into the cache up front."""
+        for file_path in self.find_source_files():
+            self._source(file_path.relative_to(self.source_dir))
+
     def generate_mutations(self, file_path: Path) -> Iterator[Mutation]:
         """Generate all mutations for a single file."""
-        source = file_path.read_text()
-        rel_path = str(file_path.relative_to(self.source_dir))
+        rel_path = file_path.relative_to(self.source_dir)
+        _, lines = self._source(rel_path)
+        # Parsed and tokenized once, shared by every operator
+        tree = parse_lines(lines)
+        skip_lines: set[int] | None = None
 
         for operator in self.operators:
-            yield from operator.generate_mutations(source, rel_path)
+            if isinstance(operator, SyntaxTreeOperator):
+                if tree is not None:
+                    yield from operator.mutate_tree(tree, lines, str(rel_path))
+            else:
+                if skip_lines is None:
+                    skip_lines = comment_and_docstring_lines(lines)
+                yield from operator.mutate_lines(lines, str(rel_path), skip_lines)
 
     def generate_all_mutations(self) -> Iterator[Mutation]:
         """Generate mutations for all source files."""
         for file_path in self.find_source_files():
             yield from self.generate_mutations(file_path)
 
+    def _build_workspace(self, target_dir: Path) -> None:
+        """
+        Mirror the source tree under target_dir using symlinks.
+
+        Directories are created for real and every file is linked back to
+        the original, so setting up a mutant costs one link per file rather
+        than a full copy. Falls back to copying where symlinks are not
+        supported.
+        """
+        source_root = self.source_dir.resolve()
+        for root, dirs, files in os.walk(source_root):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            dest = target_dir / Path(root).relative_to(source_root)
+            dest.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                src = Path(root) / name
+                try:
+                    os.symlink(src, dest / name)
+                except OSError:
+                    shutil.copy2(src, dest / name)
+
     def apply_mutation(self, mutation: Mutation, target_dir: Path) -> Path:
         """
-        Apply a mutation to a copy of the source.
+        Apply a mutation to a linked copy of the source.
 
         Args:
             mutation: The mutation to apply
-            target_dir: Directory to copy sources to
+            target_dir: Directory to mirror sources into
 
         Returns:
             Path to the mutated file
+
+        Raises:
+            ValueError: If the mutation's file path escapes the source tree
         """
-        # Copy source directory to target
+        rel_path = Path(mutation.file_path)
+        if rel_path.is_absolute() or ".." in rel_path.parts:
+            raise ValueError(f"Mutation path escapes source tree: {mutation.file_path}")
+
+        # Mirror source directory into target
         if target_dir.exists():
             shutil.rmtree(target_dir)
-        shutil.copytree(self.source_dir, target_dir)
+        self._build_workspace(target_dir)
 
         # Apply the mutation
-        file_path = target_dir / mutation.file_path
-        source = file_path.read_text()
-        lines = source.split("\n")
+        file_path = target_dir / rel_path
+        lines = self._source(rel_path)[1].copy()
 
         # Replace the mutated line
         line_idx = mutation.line_number - 1
@@ -140,42 +521,75 @@ class MutationEngine:
             indent = len(original_line) - len(original_line.lstrip())
             lines[line_idx] = " " * indent + mutation.mutated
 
+        # Break the link so only the workspace copy is changed
+        file_path.unlink()
         file_path.write_text("\n".join(lines))
         return file_path
 
-    def run_tests(self, source_dir: Path) -> tuple[bool, str]:
+    def run_tests(self, source_dir: Path, mutant_id: str | None = None) -> tuple[bool, str]:
         """
         Run tests against mutated source.
 
         Args:
             source_dir: Directory containing mutated source
+            mutant_id: Mutant to activate in a schema workspace
 
         Returns:
             Tuple of (tests_passed, output)
         """
+        pytest_args = [
+            str(self.test_dir),
+            "-x",  # Stop on first failure
+            "--tb=no",  # No traceback
+            "-q",  # Quiet output
+            "--no-header",
+            "-p",
+            "no:cacheprovider",  # Don't write .pytest_cache per mutant
+            "--assert=plain",  # Skip assertion rewriting of test modules
+            "-o",
+            "console_output_style=classic",
+        ]
+        for plugin in self.pytest_plugins:
+            pytest_args += ["-p", plugin]
+
+        mutant_env = {
+            MUTANT_ID_ENV: mutant_id or "",
+            # Set on every request, as the warm worker keeps its environment
+            _PLUGIN_AUTOLOAD_ENV: (
+                os.environ.get(_PLUGIN_AUTOLOAD_ENV, "") if self.autoload_plugins else "1"
+            ),
+        }
+
+        if self.warm_pytest:
+            request = {
+                "srcdir": str(source_dir),
+                "test_dir": str(self.test_dir.resolve()),
+                "cwd": str(source_dir.parent),
+                "env": mutant_env,
+                "args": pytest_args,
+            }
+            try:
+                return _get_daemon().run(request, self.timeout)
+            except subprocess.TimeoutExpired:
+                _reset_daemon()
+                return False, "TIMEOUT"
+            except (OSError, ValueError, RuntimeError):
+                # Daemon died or spoke garbage; retry in a fresh interpreter
+                _reset_daemon()
+
         try:
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "pytest",
-                    str(self.test_dir),
-                    "-x",  # Stop on first failure
-                    "--tb=no",  # No traceback
-                    "-q",  # Quiet output
-                ],
-                capture_output=True,
-                text=True,
+            returncode, output = _run_capped(
+                [sys.executable, "-m", "pytest", *pytest_args],
                 timeout=self.timeout,
                 cwd=source_dir.parent,
                 env={
-                    **dict(__import__("os").environ),
+                    **os.environ,
                     "PYTHONPATH": str(source_dir),
+                    **_PYTEST_ENV,
+                    **mutant_env,
                 },
             )
-            passed = result.returncode == 0
-            output = result.stdout + result.stderr
-            return passed, output
+            return returncode == 0, output
 
         except subprocess.TimeoutExpired:
             return False, "TIMEOUT"
@@ -188,38 +602,184 @@ class MutationEngine:
 
         start_time = time.time()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            target_dir = Path(tmp_dir) / "src"
+        try:
+            schema_id = self._schema_ids.get(mutation)
+            if schema_id is not None and self._schema_dir is not None:
+                passed, output = self.run_tests(self._schema_dir, mutant_id=schema_id)
+            else:
+                with tempfile.TemporaryDirectory(dir=_WORKSPACE_ROOT) as tmp_dir:
+                    target_dir = Path(tmp_dir) / "src"
+                    self.apply_mutation(mutation, target_dir)
+                    passed, output = self.run_tests(target_dir)
+
+            duration = time.time() - start_time
+
+            if "TIMEOUT" in output:
+                status = MutantStatus.TIMEOUT
+            elif "ERROR" in output:
+                status = MutantStatus.ERROR
+            elif passed:
+                status = MutantStatus.SURVIVED
+            else:
+                status = MutantStatus.KILLED
 
-            try:
-                self.apply_mutation(mutation, target_dir)
-                passed, output = self.run_tests(target_dir)
+            return MutantResult(
+                mutation=mutation,
+                status=status,
+                test_output=output[:500],  # Truncate output
+                duration=duration,
+            )
+
+        except Exception as e:
+            return MutantResult(
+                mutation=mutation,
+                status=MutantStatus.ERROR,
+                test_output=str(e),
+                duration=time.time() - start_time,
+            )
+
+    def _add_to_schema(self, rel_path: Path, mutations: list[Mutation], first_id: int) -> None:
+        """
+        Encode the schema-compatible mutants of one file into the schema workspace.
 
-                duration = time.time() - start_time
+        Mutants that cannot be switched in place are left out of
+        ``_schema_ids`` and fall back to a per-mutant copy.
 
-                if "TIMEOUT" in output:
-                    status = MutantStatus.TIMEOUT
-                elif "ERROR" in output:
-                    status = MutantStatus.ERROR
-                elif passed:
-                    status = MutantStatus.SURVIVED
+        Args:
+            rel_path: File the mutations apply to, relative to source_dir
+            mutations: Mutations of that file still to be tested
+            first_id: Id of the first mutation; ids must not repeat across files
+        """
+        if self._schema_dir is None or not mutations:
+            return
+        file_mutations = {str(first_id + i): m for i, m in enumerate(mutations)}
+        schema, encoded = build_schema(self._source(rel_path)[0], file_mutations)
+        if not encoded:
+            return
+        # Workers may be importing this tree while later files are encoded, so
+        # swap the schema in with a rename: they see the old module or the new
+        # one, never a missing or half-written file
+        file_path = self._schema_dir / rel_path
+        tmp_path = file_path.with_suffix(".tmp")
+        tmp_path.write_text(schema)
+        os.replace(tmp_path, file_path)
+        self._schema_ids.update((file_mutations[i], i) for i in encoded)
+
+    def _test_mutants(self, items: Iterable[Mutation | MutantResult]) -> Iterator[MutantResult]:
+        """
+        Test mutants in order, in worker processes when parallel > 1.
+
+        Items that are already results (cached or inferred outcomes) pass
+        through in their place. Items are consumed lazily, so a generator
+        feeding mutations keeps producing while earlier mutants run.
+        """
+        surviving_lines: set[tuple[str, int]] = set()
+
+        def skip(mutation: Mutation) -> MutantResult | None:
+            if not self.skip_surviving_lines:
+                return None
+            if (mutation.file_path, mutation.line_number) not in surviving_lines:
+                return None
+            return MutantResult(
+                mutation=mutation,
+                status=MutantStatus.SURVIVED,
+                test_output="Skipped: another mutant of this line survived",
+                skipped=True,
+            )
+
+        def record(mutant_result: MutantResult) -> MutantResult:
+            if mutant_result.status == MutantStatus.SURVIVED:
+                mutation = mutant_result.mutation
+                surviving_lines.add((mutation.file_path, mutation.line_number))
+            return mutant_result
+
+        if self.parallel <= 1:
+            for item in items:
+                if isinstance(item, MutantResult):
+                    yield record(item)
+                else:
+                    yield record(skip(item) or self.test_mutant(item))
+            return
+
+        # Workers only read the schema workspace; other mutants get their own
+        # tree. Submitting through a bounded window keeps O(parallel) mutants
+        # in flight and lets survivors reported so far skip later mutants of
+        # the same line.
+        window: deque[MutantResult | Future[MutantResult]] = deque()
+        with ProcessPoolExecutor(max_workers=self.parallel) as executor:
+            for item in items:
+                if isinstance(item, MutantResult):
+                    window.append(item)
                 else:
-                    status = MutantStatus.KILLED
+                    window.append(skip(item) or executor.submit(_test_mutant, self, item))
+                if len(window) >= 2 * self.parallel:
+                    head = window.popleft()
+                    yield record(head.result() if isinstance(head, Future) else head)
+            while window:
+                head = window.popleft()
+                yield record(head.result() if isinstance(head, Future) else head)
+
+    def _tests_hash(self) -> str:
+        """Hash the test suite, which invalidates all cached results when changed."""
+        digest = hashlib.sha256()
+        for path in sorted(self.test_dir.rglob("*.py")):
+            digest.update(str(path.relative_to(self.test_dir)).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()[:12]
+
+    def _uncovered_lines(self) -> dict[Path, set[int]] | None:
+        """
+        Run the tests once under coverage and find unexecuted statements.
 
-                return MutantResult(
-                    mutation=mutation,
-                    status=status,
-                    test_output=output[:500],  # Truncate output
-                    duration=duration,
-                )
+        Returns:
+            Statement lines never executed, keyed by path relative to
+            source_dir, or None if coverage is unavailable or failed
+        """
+        try:
+            import coverage
+        except ImportError:
+            return None
 
-            except Exception as e:
-                return MutantResult(
-                    mutation=mutation,
-                    status=MutantStatus.ERROR,
-                    test_output=str(e),
-                    duration=time.time() - start_time,
+        source_root = self.source_dir.resolve()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_file = Path(tmp_dir) / ".coverage"
+            try:
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "coverage",
+                        "run",
+                        f"--data-file={data_file}",
+                        f"--source={source_root}",
+                        "-m",
+                        "pytest",
+                        str(self.test_dir.resolve()),
+                        "--tb=no",
+                        "-q",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=self.timeout,
+                    cwd=tmp_dir,
+                    env={**os.environ, "PYTHONPATH": str(source_root)},
                 )
+                cov = coverage.Coverage(data_file=str(data_file))
+                cov.load()
+                measured = cov.get_data().measured_files()
+                uncovered: dict[Path, set[int]] = {}
+                for filename in measured:
+                    _, _, _, missing, _ = cov.analysis2(filename)
+                    rel_path = Path(filename).resolve().relative_to(source_root)
+                    uncovered[rel_path] = set(missing)
+            except (OSError, ValueError, subprocess.SubprocessError, coverage.CoverageException):
+                return None
+
+        # Files no test imported at all are entirely unexecuted
+        for rel_path, (text, _) in self._source_cache.items():
+            if rel_path not in uncovered:
+                uncovered[rel_path] = _statement_lines(text)
+        return uncovered
 
     def run(
         self,
@@ -236,31 +796,90 @@ class MutationEngine:
         Returns:
             MutationTestResult with all results
         """
-        result = MutationTestResult()
-        mutations = list(self.generate_all_mutations())
+        self.load_sources()
+        mutations: Iterable[Mutation] = _unique(self.generate_all_mutations())
 
         # Apply file filter
         if file_filter:
-            mutations = [m for m in mutations if file_filter in m.file_path]
+            mutations = (m for m in mutations if file_filter in m.file_path)
 
         # Limit number of mutants
         if max_mutants:
-            mutations = mutations[:max_mutants]
+            mutations = islice(mutations, max_mutants)
 
-        result.total_mutants = len(mutations)
+        return self._run_mutations(mutations)
 
-        for mutation in mutations:
-            mutant_result = self.test_mutant(mutation)
-            result.results.append(mutant_result)
+    def _run_mutations(self, mutations: Iterable[Mutation]) -> MutationTestResult:
+        """
+        Test the given mutants, reusing cached and inferred outcomes.
 
-            if mutant_result.status == MutantStatus.KILLED:
-                result.killed += 1
-            elif mutant_result.status == MutantStatus.SURVIVED:
-                result.survived += 1
-            elif mutant_result.status == MutantStatus.TIMEOUT:
-                result.timeout += 1
-            else:
-                result.errors += 1
+        Mutations are consumed one file at a time, so testing starts as soon
+        as the first file is generated rather than after the whole tree.
+        """
+        result = MutationTestResult()
+
+        # A mutant only counts as killed if the unmutated code passes
+        passed, output = self.run_tests(self.source_dir)
+        if not passed:
+            raise UnmutatedTestsFailedError(f"Tests fail on the unmutated source:\n{output}")
+
+        # Reuse results for mutants of files unchanged since the last run
+        cache: MutationCache | None = None
+        file_hashes: dict[Path, str] = {}
+        if self.cache_path:
+            cache = MutationCache.load(self.cache_path, self._tests_hash())
+            file_hashes = {rel: _hash_text(text) for rel, (text, _) in self._source_cache.items()}
+
+        # Mutants of statements no test executes cannot be killed
+        uncovered = self._uncovered_lines() if self.only_covered else None
+
+        def items() -> Iterator[Mutation | MutantResult]:
+            next_id = 0
+            for file_path, group in groupby(mutations, key=lambda m: m.file_path):
+                rel_path = Path(file_path)
+                file_items: list[Mutation | MutantResult] = []
+                for mutation in group:
+                    hit = cache.get(file_hashes[rel_path], mutation) if cache else None
+                    if hit is None and uncovered is not None:
+                        if mutation.line_number in uncovered.get(rel_path, ()):
+                            hit = MutantResult(
+                                mutation=mutation,
+                                status=MutantStatus.SURVIVED,
+                                test_output="Not executed by any test",
+                                skipped=True,
+                            )
+                    file_items.append(hit or mutation)
+                to_test = [m for m in file_items if isinstance(m, Mutation)]
+                self._add_to_schema(rel_path, to_test, next_id)
+                next_id += len(to_test)
+                yield from file_items
+
+        with tempfile.TemporaryDirectory(dir=_WORKSPACE_ROOT) as schema_root:
+            if self.use_schema:
+                self._schema_dir = Path(schema_root) / "src"
+                self._build_workspace(self._schema_dir)
+            try:
+                for mutant_result in self._test_mutants(items()):
+                    if cache:
+                        rel_path = Path(mutant_result.mutation.file_path)
+                        cache.put(file_hashes[rel_path], mutant_result)
+                    result.results.append(mutant_result)
+
+                    if mutant_result.status == MutantStatus.KILLED:
+                        result.killed += 1
+                    elif mutant_result.status == MutantStatus.SURVIVED:
+                        result.survived += 1
+                    elif mutant_result.status == MutantStatus.TIMEOUT:
+                        result.timeout += 1
+                    else:
+                        result.errors += 1
+            finally:
+                self._schema_dir = None
+                self._schema_ids = {}
+
+        result.total_mutants = len(result.results)
+        if cache and self.cache_path:
+            cache.save(self.cache_path)
 
         return result
 
@@ -271,16 +890,15 @@ class MutationEngine:
         """
         Run a quick mutation test with sampling.
 
+        The sample is stratified by file, so every file is represented
+        rather than only the ones generating the most mutants.
+
         Args:
             sample_size: Number of mutations to sample
 
         Returns:
             MutationTestResult with sampled results
         """
-        import random
-
-        mutations = list(self.generate_all_mutations())
-        if len(mutations) > sample_size:
-            mutations = random.sample(mutations, sample_size)
-
-        return self.run(max_mutants=len(mutations))
+        self.load_sources()
+        mutations = list(_unique(self.generate_all_mutations()))
+        return self._run_mutations(stratified_sample(mutations, sample_size))
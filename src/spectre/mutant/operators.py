@@ -6,7 +6,8 @@ to test whether the test suite can detect these changes.
 
 from __future__ import annotations
 
-import re
+import ast
+import tokenize
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -43,268 +44,65 @@ class Mutation:
         )
 
 
+def comment_and_docstring_lines(lines: list[str]) -> set[int]:
+    """
+    Find the lines holding only a comment or part of a standalone string.
+
+    Standalone strings are docstrings and other string statements, which
+    line-based operators would otherwise mutate as if they were code. The
+    file is tokenized once so every operator can share the result; sources
+    that do not tokenize fall back to skipping comment lines only.
+
+    Args:
+        lines: Source lines
+
+    Returns:
+        1-based numbers of lines to leave unmutated
+    """
+    skip: set[int] = set()
+    try:
+        tokens = list(tokenize.generate_tokens(iter(line + "\n" for line in lines).__next__))
+    except (tokenize.TokenError, SyntaxError):
+        return {i for i, line in enumerate(lines, 1) if line.strip().startswith("#")}
+
+    layout = (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.COMMENT)
+    statement: list[tokenize.TokenInfo] = []
+    for token in tokens:
+        if token.type == tokenize.COMMENT and not token.line[: token.start[1]].strip():
+            skip.add(token.start[0])
+        if token.type == tokenize.NEWLINE:
+            if statement and all(t.type == tokenize.STRING for t in statement):
+                skip.update(range(statement[0].start[0], statement[-1].end[0] + 1))
+            statement = []
+        elif token.type not in layout:
+            statement.append(token)
+    return skip
+
+
 class MutationOperator(ABC):
     """Base class for mutation operators."""
 
     name: str = "base"
     description: str = "Base mutation operator"
 
-    @abstractmethod
     def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
         """Generate mutations for the given source code."""
-        pass
-
-
-class ArithmeticSwapOperator(MutationOperator):
-    """Swap arithmetic operators (+, -, *, /, %)."""
-
-    name = "arithmetic_swap"
-    description = "Swaps arithmetic operators"
-
-    SWAPS = {
-        "+": "-",
-        "-": "+",
-        "*": "/",
-        "/": "*",
-        "%": "/",
-        "//": "*",
-    }
-
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            # Skip comments and strings
-            if line.strip().startswith("#"):
-                continue
-
-            for original, replacement in self.SWAPS.items():
-                # Find operator in arithmetic context
-                pattern = rf"(\w+)\s*{re.escape(original)}\s*(\w+)"
-                for match in re.finditer(pattern, line):
-                    mutated_line = (
-                        line[: match.start()]
-                        + match.group(1)
-                        + f" {replacement} "
-                        + match.group(2)
-                        + line[match.end() :]
-                    )
-                    yield Mutation(
-                        mutation_type=MutationType.ARITHMETIC_SWAP,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=mutated_line.strip(),
-                        description=f"Swap '{original}' with '{replacement}'",
-                    )
-
-
-class ComparisonSwapOperator(MutationOperator):
-    """Swap comparison operators (<, >, <=, >=, ==, !=)."""
-
-    name = "comparison_swap"
-    description = "Swaps comparison operators"
-
-    SWAPS = {
-        "<=": ">",
-        ">=": "<",
-        "<": ">=",
-        ">": "<=",
-        "==": "!=",
-        "!=": "==",
-    }
-
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
-                continue
-
-            for original, replacement in self.SWAPS.items():
-                pattern = rf"(\w+)\s*{re.escape(original)}\s*(\w+)"
-                for match in re.finditer(pattern, line):
-                    mutated_line = (
-                        line[: match.start()]
-                        + match.group(1)
-                        + f" {replacement} "
-                        + match.group(2)
-                        + line[match.end() :]
-                    )
-                    yield Mutation(
-                        mutation_type=MutationType.COMPARISON_SWAP,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=mutated_line.strip(),
-                        description=f"Swap '{original}' with '{replacement}'",
-                    )
-
-
-class OffByOneOperator(MutationOperator):
-    """Introduce off-by-one errors in numeric literals."""
-
-    name = "off_by_one"
-    description = "Introduces off-by-one errors"
-
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
-                continue
-
-            # Find numeric literals
-            for match in re.finditer(r"\b(\d+)\b", line):
-                value = int(match.group(1))
-
-                # Generate +1 mutation
-                mutated_plus = line[: match.start()] + str(value + 1) + line[match.end() :]
-                yield Mutation(
-                    mutation_type=MutationType.OFF_BY_ONE,
-                    file_path=file_path,
-                    line_number=line_num,
-                    original=line.strip(),
-                    mutated=mutated_plus.strip(),
-                    description=f"Change {value} to {value + 1}",
-                )
-
-                # Generate -1 mutation (only if > 0)
-                if value > 0:
-                    mutated_minus = line[: match.start()] + str(value - 1) + line[match.end() :]
-                    yield Mutation(
-                        mutation_type=MutationType.OFF_BY_ONE,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=mutated_minus.strip(),
-                        description=f"Change {value} to {value - 1}",
-                    )
-
-
-class GasCostOperator(MutationOperator):
-    """Modify gas cost constants."""
-
-    name = "gas_cost"
-    description = "Modifies gas cost values"
-
-    GAS_PATTERN = re.compile(r"G_\w+\s*[=:]\s*(\d+)")
-
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
-                continue
-
-            for match in self.GAS_PATTERN.finditer(line):
-                value = int(match.group(1))
-
-                # Double the gas cost
-                mutated_double = line[: match.start(1)] + str(value * 2) + line[match.end(1) :]
-                yield Mutation(
-                    mutation_type=MutationType.GAS_COST,
-                    file_path=file_path,
-                    line_number=line_num,
-                    original=line.strip(),
-                    mutated=mutated_double.strip(),
-                    description=f"Double gas cost from {value} to {value * 2}",
-                )
-
-                # Halve the gas cost
-                if value > 1:
-                    mutated_half = line[: match.start(1)] + str(value // 2) + line[match.end(1) :]
-                    yield Mutation(
-                        mutation_type=MutationType.GAS_COST,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=mutated_half.strip(),
-                        description=f"Halve gas cost from {value} to {value // 2}",
-                    )
-
-
-class LogicNegateOperator(MutationOperator):
-    """Negate boolean conditions."""
-
-    name = "logic_negate"
-    description = "Negates boolean conditions"
-
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
-                continue
-
-            # Find 'if condition:' patterns
-            if_match = re.match(r"(\s*if\s+)(.+)(:)", line)
-            if if_match:
-                prefix = if_match.group(1)
-                condition = if_match.group(2)
-                suffix = if_match.group(3)
-
-                mutated_line = f"{prefix}not ({condition}){suffix}"
-                yield Mutation(
-                    mutation_type=MutationType.LOGIC_NEGATE,
-                    file_path=file_path,
-                    line_number=line_num,
-                    original=line.strip(),
-                    mutated=mutated_line.strip(),
-                    description="Negate condition",
-                )
-
-
-class ReturnValueOperator(MutationOperator):
-    """Modify return values."""
+        return self.mutate_lines(source.split("\n"), file_path)
 
-    name = "return_value"
-    description = "Modifies return values"
-
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
-        for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
-                continue
-
-            # Find 'return value' patterns
-            return_match = re.match(r"(\s*return\s+)(.+)", line)
-            if return_match:
-                prefix = return_match.group(1)
-                value = return_match.group(2).strip()
-
-                # For True/False returns
-                if value == "True":
-                    yield Mutation(
-                        mutation_type=MutationType.RETURN_VALUE,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=f"{prefix}False",
-                        description="Change return True to False",
-                    )
-                elif value == "False":
-                    yield Mutation(
-                        mutation_type=MutationType.RETURN_VALUE,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=f"{prefix}True",
-                        description="Change return False to True",
-                    )
-                elif value == "0":
-                    yield Mutation(
-                        mutation_type=MutationType.RETURN_VALUE,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=f"{prefix}1",
-                        description="Change return 0 to 1",
-                    )
-                elif value == "None":
-                    yield Mutation(
-                        mutation_type=MutationType.RETURN_VALUE,
-                        file_path=file_path,
-                        line_number=line_num,
-                        original=line.strip(),
-                        mutated=f'{prefix}""',
-                        description="Change return None to empty string",
-                    )
+    @abstractmethod
+    def mutate_lines(
+        self, lines: list[str], file_path: str, skip_lines: set[int] | None = None
+    ) -> Iterator[Mutation]:
+        """
+        Generate mutations for source code already split into lines.
+
+        Args:
+            lines: Source lines
+            file_path: Path recorded on each mutation
+            skip_lines: Line numbers never to mutate, as computed by
+                comment_and_docstring_lines (computed here when omitted)
+        """
+        pass
 
 
 class BoundaryChangeOperator(MutationOperator):
@@ -321,10 +119,13 @@ class BoundaryChangeOperator(MutationOperator):
         "2**255": ["2**255 - 1", "2**255 + 1"],
     }
 
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
+    def mutate_lines(
+        self, lines: list[str], file_path: str, skip_lines: set[int] | None = None
+    ) -> Iterator[Mutation]:
+        skip = comment_and_docstring_lines(lines) if skip_lines is None else skip_lines
         for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
+            # Skip comments and docstrings
+            if line_num in skip:
                 continue
 
             for boundary, replacements in self.BOUNDARIES.items():
@@ -352,10 +153,13 @@ class ConstantChangeOperator(MutationOperator):
         "ZERO_ADDRESS": 'b"\\x00" * 19 + b"\\x01"',
     }
 
-    def generate_mutations(self, source: str, file_path: str) -> Iterator[Mutation]:
-        lines = source.split("\n")
+    def mutate_lines(
+        self, lines: list[str], file_path: str, skip_lines: set[int] | None = None
+    ) -> Iterator[Mutation]:
+        skip = comment_and_docstring_lines(lines) if skip_lines is None else skip_lines
         for line_num, line in enumerate(lines, 1):
-            if line.strip().startswith("#"):
+            # Skip comments and docstrings
+            if line_num in skip:
                 continue
 
             for constant, replacement in self.CONSTANTS.items():
@@ -371,19 +175,287 @@ class ConstantChangeOperator(MutationOperator):
                     )
 
 
+# ============================================================================
+# Syntax tree operators
+# ============================================================================
+
+
+def parse_lines(lines: list[str]) -> ast.Module | None:
+    """Parse a file split into lines, or None if it is not valid Python."""
+    try:
+        return ast.parse("\n".join(lines))
+    except SyntaxError:
+        return None
+
+
+def _char_col(line: str, byte_col: int) -> int:
+    """Convert an ast UTF-8 byte offset into a string index."""
+    return len(line.encode()[:byte_col].decode(errors="ignore"))
+
+
+class SyntaxTreeOperator(MutationOperator):
+    """
+    Base class for operators that mutate nodes of the parsed syntax tree.
+
+    Working from the tree never touches strings, docstrings or comments,
+    and only rewrites the exact token of a node, so every mutant still
+    parses. Sources that do not parse yield no mutations.
+    """
+
+    mutation_type: MutationType
+
+    def mutate_lines(
+        self, lines: list[str], file_path: str, skip_lines: set[int] | None = None
+    ) -> Iterator[Mutation]:
+        tree = parse_lines(lines)
+        if tree is None:
+            return iter(())
+        return self.mutate_tree(tree, lines, file_path)
+
+    def mutate_tree(self, tree: ast.Module, lines: list[str], file_path: str) -> Iterator[Mutation]:
+        """Generate mutations from an already parsed file."""
+        skip = {
+            id(child)
+            for node in ast.walk(tree)
+            if isinstance(node, ast.JoinedStr)
+            for child in ast.walk(node)
+        }
+        candidates = [
+            candidate
+            for node in ast.walk(tree)
+            if id(node) not in skip
+            for candidate in self.mutate_node(node, lines)
+        ]
+        candidates.sort(key=lambda c: (c[0], c[1]))
+        for line_number, start, end, replacement, description in candidates:
+            line = lines[line_number - 1]
+            yield Mutation(
+                mutation_type=self.mutation_type,
+                file_path=file_path,
+                line_number=line_number,
+                original=line.strip(),
+                mutated=(line[:start] + replacement + line[end:]).strip(),
+                description=description,
+            )
+
+    @abstractmethod
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        """
+        Propose replacements for one node.
+
+        Yields:
+            (line number, start column, end column, replacement, description)
+        """
+        pass
+
+    @staticmethod
+    def _span(node: ast.expr, lines: list[str]) -> tuple[int, int, int] | None:
+        """Line and string columns of a node that fits on one line."""
+        if node.end_lineno != node.lineno or node.end_col_offset is None:
+            return None
+        line = lines[node.lineno - 1]
+        return node.lineno, _char_col(line, node.col_offset), _char_col(line, node.end_col_offset)
+
+    @staticmethod
+    def _operator_span(
+        left: ast.expr, right: ast.expr, symbol: str, lines: list[str]
+    ) -> tuple[int, int, int] | None:
+        """Locate an operator token between two operands on one line."""
+        if left.end_lineno != right.lineno or left.end_col_offset is None:
+            return None
+        line = lines[right.lineno - 1]
+        gap_start = _char_col(line, left.end_col_offset)
+        gap = line[gap_start : _char_col(line, right.col_offset)]
+        if gap.strip(" \t()") != symbol:
+            return None
+        start = gap_start + gap.index(symbol)
+        return right.lineno, start, start + len(symbol)
+
+
+class TreeArithmeticSwapOperator(SyntaxTreeOperator):
+    """Swap arithmetic operators of binary expressions."""
+
+    name = "arithmetic_swap"
+    description = "Swaps arithmetic operators"
+    mutation_type = MutationType.ARITHMETIC_SWAP
+
+    SWAPS: dict[type[ast.operator], tuple[str, str]] = {
+        ast.Add: ("+", "-"),
+        ast.Sub: ("-", "+"),
+        ast.Mult: ("*", "/"),
+        ast.Div: ("/", "*"),
+        ast.Mod: ("%", "/"),
+        ast.FloorDiv: ("//", "*"),
+    }
+
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        if not isinstance(node, ast.BinOp) or type(node.op) not in self.SWAPS:
+            return
+        original, replacement = self.SWAPS[type(node.op)]
+        span = self._operator_span(node.left, node.right, original, lines)
+        if span:
+            yield (*span, replacement, f"Swap '{original}' with '{replacement}'")
+
+
+class TreeComparisonSwapOperator(SyntaxTreeOperator):
+    """Swap comparison operators."""
+
+    name = "comparison_swap"
+    description = "Swaps comparison operators"
+    mutation_type = MutationType.COMPARISON_SWAP
+
+    SWAPS: dict[type[ast.cmpop], tuple[str, str]] = {
+        ast.LtE: ("<=", ">"),
+        ast.GtE: (">=", "<"),
+        ast.Lt: ("<", ">="),
+        ast.Gt: (">", "<="),
+        ast.Eq: ("==", "!="),
+        ast.NotEq: ("!=", "=="),
+    }
+
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        if not isinstance(node, ast.Compare):
+            return
+        operands = [node.left, *node.comparators]
+        for i, op in enumerate(node.ops):
+            if type(op) not in self.SWAPS:
+                continue
+            original, replacement = self.SWAPS[type(op)]
+            span = self._operator_span(operands[i], operands[i + 1], original, lines)
+            if span:
+                yield (*span, replacement, f"Swap '{original}' with '{replacement}'")
+
+
+class TreeOffByOneOperator(SyntaxTreeOperator):
+    """Introduce off-by-one errors in integer literals."""
+
+    name = "off_by_one"
+    description = "Introduces off-by-one errors"
+    mutation_type = MutationType.OFF_BY_ONE
+
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        if not isinstance(node, ast.Constant) or type(node.value) is not int:
+            return
+        span = self._span(node, lines)
+        if not span:
+            return
+        value = node.value
+        yield (*span, str(value + 1), f"Change {value} to {value + 1}")
+        if value > 0:
+            yield (*span, str(value - 1), f"Change {value} to {value - 1}")
+
+
+class TreeGasCostOperator(SyntaxTreeOperator):
+    """Modify integer constants assigned to G_* gas cost names."""
+
+    name = "gas_cost"
+    description = "Modifies gas cost values"
+    mutation_type = MutationType.GAS_COST
+
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        # Plain and annotated assignments (G_SLOAD: ClassVar[int] = 50) alike
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign):
+            targets = [node.target]
+        else:
+            return
+        value = node.value
+        if not isinstance(value, ast.Constant) or type(value.value) is not int:
+            return
+        if not any(self._is_gas_name(target) for target in targets):
+            return
+        span = self._span(value, lines)
+        if not span:
+            return
+        cost = value.value
+        yield (*span, str(cost * 2), f"Double gas cost from {cost} to {cost * 2}")
+        if cost > 1:
+            yield (*span, str(cost // 2), f"Halve gas cost from {cost} to {cost // 2}")
+
+    @staticmethod
+    def _is_gas_name(target: ast.expr) -> bool:
+        if isinstance(target, ast.Name):
+            return target.id.startswith("G_")
+        return isinstance(target, ast.Attribute) and target.attr.startswith("G_")
+
+
+class TreeLogicNegateOperator(SyntaxTreeOperator):
+    """Negate the conditions of if and elif statements."""
+
+    name = "logic_negate"
+    description = "Negates boolean conditions"
+    mutation_type = MutationType.LOGIC_NEGATE
+
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        if not isinstance(node, ast.If):
+            return
+        span = self._span(node.test, lines)
+        if span:
+            line_number, start, end = span
+            condition = lines[line_number - 1][start:end]
+            yield (*span, f"not ({condition})", "Negate condition")
+
+
+class TreeReturnValueOperator(SyntaxTreeOperator):
+    """Modify constant return values."""
+
+    name = "return_value"
+    description = "Modifies return values"
+    mutation_type = MutationType.RETURN_VALUE
+
+    REPLACEMENTS: dict[object, tuple[str, str]] = {
+        True: ("False", "Change return True to False"),
+        False: ("True", "Change return False to True"),
+        None: ('""', "Change return None to empty string"),
+    }
+
+    def mutate_node(
+        self, node: ast.AST, lines: list[str]
+    ) -> Iterator[tuple[int, int, int, str, str]]:
+        if not isinstance(node, ast.Return) or not isinstance(node.value, ast.Constant):
+            return
+        value = node.value.value
+        if type(value) is int and value == 0:
+            replacement = ("1", "Change return 0 to 1")
+        elif value is None or type(value) is bool:
+            replacement = self.REPLACEMENTS[value]
+        else:
+            return
+        span = self._span(node.value, lines)
+        if span:
+            yield (*span, *replacement)
+
+
 # All available operators
 ALL_OPERATORS: list[type[MutationOperator]] = [
-    ArithmeticSwapOperator,
-    ComparisonSwapOperator,
-    OffByOneOperator,
-    GasCostOperator,
-    LogicNegateOperator,
-    ReturnValueOperator,
+    TreeArithmeticSwapOperator,
+    TreeComparisonSwapOperator,
+    TreeOffByOneOperator,
+    TreeGasCostOperator,
+    TreeLogicNegateOperator,
+    TreeReturnValueOperator,
     BoundaryChangeOperator,
     ConstantChangeOperator,
 ]
 
 
+# Operators keep no per-file state, so one instance of each is shared
+_OPERATORS: tuple[MutationOperator, ...] = tuple(op() for op in ALL_OPERATORS)
+
+
 def get_operator(name: str) -> type[MutationOperator] | None:
     """Get operator class by name."""
     for op in ALL_OPERATORS:
@@ -393,5 +465,5 @@ def get_operator(name: str) -> type[MutationOperator] | None:
 
 
 def get_all_operators() -> list[MutationOperator]:
-    """Get instances of all operators."""
-    return [op() for op in ALL_OPERATORS]
+    """Get the shared instances of all operators."""
+    return list(_OPERATORS)
@@ -0,0 +1,86 @@
+"""Long-lived pytest worker used by the mutation engine.
+
+Run as a script. Reads one JSON request per line on stdin::
+
+    {"srcdir": "...", "test_dir": "...", "cwd": "...", "env": {...}, "args": [...]}
+
+and answers each with one JSON line ``{"passed": bool, "output": str}``.
+Modules imported from the previous request's source and test trees are
+dropped before every run, so each mutant is imported fresh
+while pytest itself and third-party packages stay warm.
+
+This file must not import spectre: it runs with only the mutant workspace
+on its path.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+from typing import Any
+
+
+def _purge_modules(roots: list[str]) -> None:
+    """Forget every imported module whose file lies under one of roots."""
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if file and os.path.abspath(file).startswith(tuple(roots)):
+            del sys.modules[name]
+
+
+def _prepare(request: dict[str, Any], previous: list[str]) -> list[str]:
+    """
+    Point imports at the request's source tree.
+
+    Args:
+        request: The test request
+        previous: Roots returned for the previous request
+
+    Returns:
+        The source and test roots of this request
+    """
+    os.chdir(request["cwd"])
+    os.environ.update(request.get("env", {}))
+    srcdir = os.path.abspath(str(request["srcdir"]))
+    roots = [srcdir + os.sep, os.path.abspath(str(request["test_dir"])) + os.sep]
+
+    _purge_modules(previous + roots)
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") + os.sep not in previous]
+    sys.path.insert(0, srcdir)
+    importlib.invalidate_caches()
+    return roots
+
+
+def main() -> None:
+    """Serve test requests until stdin closes."""
+    import pytest
+
+    # Keep the protocol channel private; stray writes to fd 1 go to stderr
+    channel = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != script_dir]
+
+    roots: list[str] = []
+    for line in sys.stdin:
+        request = json.loads(line)
+        output = io.StringIO()
+        try:
+            roots = _prepare(request, roots)
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                passed = pytest.main(request["args"]) == 0
+        except Exception as e:
+            passed = False
+            output.write(f"ERROR: {e}")
+
+        channel.write(json.dumps({"passed": passed, "output": output.getvalue()}) + "\n")
+        channel.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,117 @@
 
 from __future__ import annotations
 
+import html
 import json
+import textwrap
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from spectre.mutant.engine import MutantStatus, MutationTestResult
+from spectre._json import dumps
+from spectre.mutant.engine import MutantResult, MutantStatus, MutationTestResult
+
+_STATUS_COLORS = {
+    MutantStatus.KILLED: "green",
+    MutantStatus.SURVIVED: "red",
+    MutantStatus.TIMEOUT: "yellow",
+    MutantStatus.ERROR: "red",
+    MutantStatus.PENDING: "grey",
+}
+
+# Status cells for the detailed table, rendered once
+_STATUS_MARKUP = {
+    status: f"[{color}]{status.name}[/{color}]" for status, color in _STATUS_COLORS.items()
+}
+
+
+# Static parts of the HTML report, built once at import
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Mutation Testing Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        table { border-collapse: collapse; width: 100%; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #4CAF50; color: white; }
+        .killed { color: green; }
+        .survived { color: red; font-weight: bold; }
+        .timeout { color: orange; }
+        .error { color: red; }
+        .summary { background-color: #f5f5f5; padding: 20px; border-radius: 5px; }
+        .score { font-size: 24px; font-weight: bold; }
+        h1 { color: #333; }
+    </style>
+</head>
+<body>
+    <h1>Mutation Testing Report</h1>
+"""
+
+_HTML_SUMMARY = """    <p>Generated: {generated}</p>
+
+    <div class="summary">
+        <h2>Summary</h2>
+        <p class="score">Mutation Score: {score:.1f}%</p>
+        <table>
+            <tr><th>Metric</th><th>Value</th></tr>
+            <tr><td>Total Mutants</td><td>{total_mutants}</td></tr>
+            <tr><td>Killed</td><td>{killed}</td></tr>
+            <tr><td>Survived</td><td>{survived}</td></tr>
+            <tr><td>Timeout</td><td>{timeout}</td></tr>
+            <tr><td>Errors</td><td>{errors}</td></tr>
+        </table>
+    </div>
+
+    <h2>All Mutations</h2>
+    <table>
+        <tr>
+            <th>Status</th>
+            <th>File</th>
+            <th>Line</th>
+            <th>Type</th>
+            <th>Description</th>
+            <th>Duration</th>
+        </tr>
+"""
+
+_HTML_RESULT_ROW = """
+        <tr>
+            <td class="{status_class}">{status}</td>
+            <td>{file}</td>
+            <td>{line}</td>
+            <td>{type}</td>
+            <td>{description}</td>
+            <td>{duration:.2f}s</td>
+        </tr>
+"""
+
+_HTML_SURVIVOR_ROW = """
+        <tr>
+            <td>{file}</td>
+            <td>{line}</td>
+            <td><code>{original}</code></td>
+            <td><code>{mutated}</code></td>
+        </tr>
+"""
+
+_HTML_SURVIVORS_HEAD = """
+    </table>
+
+    <h2>Surviving Mutants</h2>
+"""
+
+_HTML_FOOT = """
+</body>
+</html>
+"""
 
 
 class MutationReport:
@@ -61,11 +162,12 @@ class MutationReport:
         table.add_column("Description")
 
         for survivor in survivors:
+            mutation = survivor.mutation
             table.add_row(
-                survivor.mutation.file_path,
-                str(survivor.mutation.line_number),
-                survivor.mutation.mutation_type.name,
-                survivor.mutation.description,
+                mutation.file_path,
+                str(mutation.line_number),
+                mutation.mutation_type.name,
+                mutation.description,
             )
 
         self.console.print(table)
@@ -81,30 +183,22 @@ class MutationReport:
         table.add_column("Description")
         table.add_column("Duration")
 
-        status_colors = {
-            MutantStatus.KILLED: "green",
-            MutantStatus.SURVIVED: "red",
-            MutantStatus.TIMEOUT: "yellow",
-            MutantStatus.ERROR: "red",
-            MutantStatus.PENDING: "grey",
-        }
-
         for result in self.result.results:
-            color = status_colors.get(result.status, "white")
+            mutation = result.mutation
             table.add_row(
-                f"[{color}]{result.status.name}[/{color}]",
-                result.mutation.file_path,
-                str(result.mutation.line_number),
-                result.mutation.mutation_type.name,
-                result.mutation.description[:40],
+                _STATUS_MARKUP[result.status],
+                mutation.file_path,
+                str(mutation.line_number),
+                mutation.mutation_type.name,
+                mutation.description[:40],
                 f"{result.duration:.2f}s",
             )
 
         self.console.print(table)
 
-    def to_json(self) -> str:
-        """Convert report to JSON."""
-        data = {
+    def _header(self) -> dict[str, Any]:
+        """Timestamp and summary fields of the JSON report."""
+        return {
             "timestamp": datetime.now().isoformat(),
             "summary": {
                 "total_mutants": self.result.total_mutants,
@@ -114,121 +208,108 @@ class MutationReport:
                 "errors": self.result.errors,
                 "mutation_score": self.result.mutation_score,
             },
-            "results": [
-                {
-                    "status": r.status.name,
-                    "duration": r.duration,
-                    "mutation": {
-                        "type": r.mutation.mutation_type.name,
-                        "file": r.mutation.file_path,
-                        "line": r.mutation.line_number,
-                        "original": r.mutation.original,
-                        "mutated": r.mutation.mutated,
-                        "description": r.mutation.description,
-                    },
-                }
-                for r in self.result.results
-            ],
         }
-        return json.dumps(data, indent=2)
+
+    @staticmethod
+    def _result_dict(r: MutantResult) -> dict[str, Any]:
+        """JSON form of one mutant result."""
+        return {
+            "status": r.status.name,
+            "duration": r.duration,
+            "mutation": {
+                "type": r.mutation.mutation_type.name,
+                "file": r.mutation.file_path,
+                "line": r.mutation.line_number,
+                "original": r.mutation.original,
+                "mutated": r.mutation.mutated,
+                "description": r.mutation.description,
+            },
+        }
+
+    def to_json(self) -> str:
+        """Convert report to JSON."""
+        data = self._header()
+        data["results"] = [self._result_dict(r) for r in self.result.results]
+        return dumps(data)
 
     def save_json(self, path: Path) -> None:
-        """Save JSON report to file."""
-        path.write_text(self.to_json())
+        """
+        Save JSON report to file.
+
+        Results are encoded and written one at a time, so the whole document
+        is never held in memory. The file matches ``to_json()``.
+        """
+        with path.open("w") as f:
+            header = dumps(self._header())
+            f.write(header[: -len("\n}")])
+            f.write(',\n  "results": [')
+            for i, r in enumerate(self.result.results):
+                f.write(",\n" if i else "\n")
+                f.write(textwrap.indent(dumps(self._result_dict(r)), "    "))
+            f.write("\n  ]\n}" if self.result.results else "]\n}")
         self.console.print(f"Report saved to: {path}")
 
-    def to_html(self) -> str:
-        """Generate HTML report."""
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Mutation Testing Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #4CAF50; color: white; }}
-        .killed {{ color: green; }}
-        .survived {{ color: red; font-weight: bold; }}
-        .timeout {{ color: orange; }}
-        .error {{ color: red; }}
-        .summary {{ background-color: #f5f5f5; padding: 20px; border-radius: 5px; }}
-        .score {{ font-size: 24px; font-weight: bold; }}
-        h1 {{ color: #333; }}
-    </style>
-</head>
-<body>
-    <h1>Mutation Testing Report</h1>
-    <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-
-    <div class="summary">
-        <h2>Summary</h2>
-        <p class="score">Mutation Score: {self.result.mutation_score:.1f}%</p>
-        <table>
-            <tr><th>Metric</th><th>Value</th></tr>
-            <tr><td>Total Mutants</td><td>{self.result.total_mutants}</td></tr>
-            <tr><td>Killed</td><td>{self.result.killed}</td></tr>
-            <tr><td>Survived</td><td>{self.result.survived}</td></tr>
-            <tr><td>Timeout</td><td>{self.result.timeout}</td></tr>
-            <tr><td>Errors</td><td>{self.result.errors}</td></tr>
-        </table>
-    </div>
+    def save_ndjson(self, path: Path) -> None:
+        """
+        Save report as newline-delimited JSON.
+
+        The first line holds the timestamp and summary; each following line
+        holds one mutant result.
+        """
+        with path.open("w") as f:
+            f.write(json.dumps(self._header()) + "\n")
+            for r in self.result.results:
+                f.write(json.dumps(self._result_dict(r)) + "\n")
+        self.console.print(f"Report saved to: {path}")
 
-    <h2>All Mutations</h2>
-    <table>
-        <tr>
-            <th>Status</th>
-            <th>File</th>
-            <th>Line</th>
-            <th>Type</th>
-            <th>Description</th>
-            <th>Duration</th>
-        </tr>
-"""
+    def iter_html(self) -> Iterator[str]:
+        """Generate the HTML report as a sequence of fragments."""
+        yield _HTML_HEAD
+        yield _HTML_SUMMARY.format(
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            score=self.result.mutation_score,
+            total_mutants=self.result.total_mutants,
+            killed=self.result.killed,
+            survived=self.result.survived,
+            timeout=self.result.timeout,
+            errors=self.result.errors,
+        )
         for r in self.result.results:
-            status_class = r.status.name.lower()
-            html += f"""
-        <tr>
-            <td class="{status_class}">{r.status.name}</td>
-            <td>{r.mutation.file_path}</td>
-            <td>{r.mutation.line_number}</td>
-            <td>{r.mutation.mutation_type.name}</td>
-            <td>{r.mutation.description}</td>
-            <td>{r.duration:.2f}s</td>
-        </tr>
-"""
-
-        html += """
-    </table>
+            yield _HTML_RESULT_ROW.format(
+                status_class=r.status.name.lower(),
+                status=r.status.name,
+                file=html.escape(r.mutation.file_path),
+                line=r.mutation.line_number,
+                type=r.mutation.mutation_type.name,
+                description=html.escape(r.mutation.description),
+                duration=r.duration,
+            )
 
-    <h2>Surviving Mutants</h2>
-"""
+        yield _HTML_SURVIVORS_HEAD
         survivors = self.result.survivors
         if survivors:
-            html += "<table><tr><th>File</th><th>Line</th><th>Original</th><th>Mutated</th></tr>"
+            yield "<table><tr><th>File</th><th>Line</th><th>Original</th><th>Mutated</th></tr>"
             for s in survivors:
-                html += f"""
-        <tr>
-            <td>{s.mutation.file_path}</td>
-            <td>{s.mutation.line_number}</td>
-            <td><code>{s.mutation.original}</code></td>
-            <td><code>{s.mutation.mutated}</code></td>
-        </tr>
-"""
-            html += "</table>"
+                yield _HTML_SURVIVOR_ROW.format(
+                    file=html.escape(s.mutation.file_path),
+                    line=s.mutation.line_number,
+                    original=html.escape(s.mutation.original),
+                    mutated=html.escape(s.mutation.mutated),
+                )
+            yield "</table>"
         else:
-            html += "<p class='killed'>All mutants were killed!</p>"
+            yield "<p class='killed'>All mutants were killed!</p>"
 
-        html += """
-</body>
-</html>
-"""
-        return html
+        yield _HTML_FOOT
+
+    def to_html(self) -> str:
+        """Generate HTML report."""
+        return "".join(self.iter_html())
 
     def save_html(self, path: Path) -> None:
-        """Save HTML report to file."""
-        path.write_text(self.to_html())
+        """Save HTML report to file, writing fragments as they are generated."""
+        with path.open("w") as f:
+            f.writelines(self.iter_html())
         self.console.print(f"HTML report saved to: {path}")
 
 
@@ -0,0 +1,111 @@
+"""Mutation schemata: many mutants of a file compiled into one copy.
+
+Instead of writing one mutated copy of a file per mutant, a schema wraps
+each mutated line in a switch on the ``SPECTRE_MUTANT_ID`` environment
+variable::
+
+    if __import__("os").environ.get("SPECTRE_MUTANT_ID") == "7":
+        result = a - b
+    else:
+        result = a + b
+
+The schema file is written once and each mutant is selected by setting the
+variable before running the tests.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Mapping
+
+from spectre.mutant.operators import Mutation
+
+MUTANT_ID_ENV = "SPECTRE_MUTANT_ID"
+
+# Compound statements cannot be wrapped line by line
+_COMPOUND = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.If,
+    ast.For,
+    ast.AsyncFor,
+    ast.While,
+    ast.With,
+    ast.AsyncWith,
+    ast.Try,
+    ast.TryStar,
+    ast.Match,
+)
+
+
+def _simple_statement_lines(source: str, lines: list[str]) -> set[int]:
+    """Line numbers holding exactly one complete, single-line simple statement."""
+    result: set[int] = set()
+    for node in ast.walk(ast.parse(source)):
+        if not isinstance(node, ast.stmt) or isinstance(node, _COMPOUND):
+            continue
+        if node.end_lineno != node.lineno or node.end_col_offset is None:
+            continue
+        line = lines[node.lineno - 1]
+        indent = len(line) - len(line.lstrip())
+        if node.col_offset == indent and node.end_col_offset == len(line.rstrip()):
+            result.add(node.lineno)
+    return result
+
+
+def _parses_as_statement(code: str) -> bool:
+    """Check that a line is valid as a statement inside a function body."""
+    try:
+        ast.parse(f"def _f():\n    while True:\n        {code}\n")
+    except SyntaxError:
+        return False
+    return True
+
+
+def build_schema(source: str, mutations: Mapping[str, Mutation]) -> tuple[str, set[str]]:
+    """
+    Encode mutations of one file into a single schema source.
+
+    Only mutations of lines holding one simple statement (assignments,
+    returns, expressions, ...) can be switched this way; others must be
+    tested with a separately mutated copy.
+
+    Args:
+        source: Unmutated file contents
+        mutations: Mutations of this file, keyed by mutant id
+
+    Returns:
+        The schema source and the ids of the mutations it encodes
+    """
+    lines = source.split("\n")
+    try:
+        simple = _simple_statement_lines(source, lines)
+    except SyntaxError:
+        return source, set()
+
+    by_line: dict[int, list[tuple[str, Mutation]]] = {}
+    for mutant_id, mutation in mutations.items():
+        if mutation.line_number in simple and _parses_as_statement(mutation.mutated):
+            by_line.setdefault(mutation.line_number, []).append((mutant_id, mutation))
+
+    for line_number, variants in by_line.items():
+        line = lines[line_number - 1]
+        pad = " " * (len(line) - len(line.lstrip()))
+        switched: list[str] = []
+        for i, (mutant_id, mutation) in enumerate(variants):
+            keyword = "if" if i == 0 else "elif"
+            switched.append(
+                f'{pad}{keyword} __import__("os").environ.get("{MUTANT_ID_ENV}") == "{mutant_id}":'
+            )
+            switched.append(f"{pad}    {mutation.mutated}")
+        switched.append(f"{pad}else:")
+        switched.append(f"{pad}    {line.strip()}")
+        lines[line_number - 1] = "\n".join(switched)
+
+    schema = "\n".join(lines)
+    try:
+        ast.parse(schema)
+    except SyntaxError:
+        return source, set()
+    return schema, {mutant_id for variants in by_line.values() for mutant_id, _ in variants}
@@ -0,0 +1,180 @@
+"""PHANTOM command-line interface."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+from spectre._json import dumps
+from spectre.phantom.executor import DifferentialExecutor, Fork
+from spectre.phantom.generator import BytecodeGenerator, GeneratorStrategy
+from spectre.phantom.minimizer import DeltaDebugger
+
+console = Console()
+
+
+@click.group()
+def phantom() -> None:
+    """PHANTOM - Differential fuzzing for EVM implementations.
+
+    Generates bytecode and compares execution across different forks
+    to find divergences in behavior.
+    """
+    pass
+
+
+@phantom.command("run")
+@click.option(
+    "--fork-a",
+    type=click.Choice(["frontier", "homestead", "shanghai"]),
+    default="frontier",
+    help="First fork to compare",
+)
+@click.option(
+    "--fork-b",
+    type=click.Choice(["frontier", "homestead", "shanghai"]),
+    default="shanghai",
+    help="Second fork to compare",
+)
+@click.option(
+    "--count",
+    type=int,
+    default=100,
+    help="Number of test cases to generate",
+)
+@click.option(
+    "--strategy",
+    type=click.Choice(["random", "grammar", "boundary", "all"]),
+    default="all",
+    help="Bytecode generation strategy",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=None,
+    help="Random seed for reproducibility",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Output file for divergences",
+)
+@click.option(
+    "--parallel",
+    type=int,
+    default=None,
+    help="Number of worker processes (default: CPU count)",
+)
+def phantom_run(
+    fork_a: str,
+    fork_b: str,
+    count: int,
+    strategy: str,
+    seed: int | None,
+    output: Path | None,
+    parallel: int | None,
+) -> None:
+    """Run differential fuzzing between two forks."""
+    console.print(
+        Panel(
+            f"[bold]PHANTOM[/bold] - Differential Fuzzing ({fork_a} vs {fork_b})", style="magenta"
+        )
+    )
+
+    # Map fork names to enums
+    fork_map = {
+        "frontier": Fork.FRONTIER,
+        "homestead": Fork.HOMESTEAD,
+        "shanghai": Fork.SHANGHAI,
+    }
+
+    executor = DifferentialExecutor(
+        fork_a=fork_map[fork_a],
+        fork_b=fork_map[fork_b],
+        parallel=parallel,
+    )
+
+    # Setup generator
+    strategies = None
+    if strategy != "all":
+        strategy_map = {
+            "random": GeneratorStrategy.RANDOM,
+            "grammar": GeneratorStrategy.GRAMMAR,
+            "boundary": GeneratorStrategy.BOUNDARY,
+        }
+        strategies = [strategy_map[strategy]]
+
+    generator = BytecodeGenerator(strategies=strategies)
+    bytecodes = generator.generate(count=count, seed=seed)
+
+    divergences = []
+
+    def on_divergence(div):
+        divergences.append(div)
+        console.print(f"[red]Divergence found:[/red] {div.description}")
+
+    with console.status(f"Fuzzing {count} test cases..."):
+        result = executor.run(bytecodes, callback=on_divergence)
+
+    # Print summary
+    table = Table(title="Fuzzing Results")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="green")
+
+    table.add_row("Total Executions", str(result.total_executions))
+    table.add_row("Unexpected Divergences", str(result.unexpected_divergences))
+    table.add_row("Expected Divergences", str(result.expected_divergences))
+    table.add_row("Divergence Rate", f"{result.divergence_rate:.2f}%")
+
+    console.print(table)
+
+    if output and divergences:
+        data = [
+            {
+                "type": d.divergence_type.name,
+                "bytecode": d.bytecode.code.hex(),
+                "description": d.description,
+            }
+            for d in divergences
+        ]
+        output.write_text(dumps(data))
+        console.print(f"Divergences saved to: {output}")
+
+
+@phantom.command("minimize")
+@click.argument("bytecode", type=str)
+@click.option(
+    "--fork-a",
+    type=click.Choice(["frontier", "homestead", "shanghai"]),
+    default="frontier",
+)
+@click.option(
+    "--fork-b",
+    type=click.Choice(["frontier", "homestead", "shanghai"]),
+    default="shanghai",
+)
+def phantom_minimize(bytecode: str, fork_a: str, fork_b: str) -> None:
+    """Minimize a divergent bytecode case."""
+    fork_map = {
+        "frontier": Fork.FRONTIER,
+        "homestead": Fork.HOMESTEAD,
+        "shanghai": Fork.SHANGHAI,
+    }
+
+    console.print("[bold]Minimizing bytecode...[/bold]")
+
+    code = bytes.fromhex(bytecode.replace("0x", ""))
+    debugger = DeltaDebugger(fork_a=fork_map[fork_a], fork_b=fork_map[fork_b])
+
+    result = debugger.minimize(code)
+
+    console.print(f"Original: {result.original_size} bytes")
+    console.print(f"Minimized: {result.minimized_size} bytes")
+    console.print(f"Reduction: {result.reduction_percent:.1f}%")
+    console.print(f"Iterations: {result.iterations}")
+    console.print(f"\nMinimized bytecode: 0x{result.minimized.hex()}")
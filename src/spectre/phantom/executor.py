@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from itertools import islice
 
 from ethereum.common.types import (
     ZERO_ADDRESS,
@@ -19,6 +25,11 @@ from ethereum.homestead.vm.interpreter import HomesteadInterpreter
 from ethereum.shanghai.vm.interpreter import ShanghaiInterpreter
 from spectre.phantom.generator import GeneratedBytecode
 
+# Accounts set up for every execution
+CALLER_ADDRESS = b"\x00" * 19 + b"\x01"
+CONTRACT_ADDRESS = b"\x00" * 19 + b"\x02"
+COINBASE_ADDRESS = b"\x00" * 19 + b"\xff"
+
 
 class Fork(Enum):
     """Supported EVM forks."""
@@ -39,7 +50,7 @@ class DivergenceType(Enum):
     STATE_MISMATCH = auto()  # Different final state
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionTrace:
     """Trace of a single execution."""
 
@@ -48,7 +59,7 @@ class ExecutionTrace:
     final_state: State
 
 
-@dataclass
+@dataclass(slots=True)
 class Divergence:
     """A divergence found between implementations."""
 
@@ -61,14 +72,12 @@ class Divergence:
     def is_expected(self) -> bool:
         """Check if this divergence is expected based on EIP changes."""
         # PUSH0 is only available in Shanghai
-        if b"\x5f" in self.bytecode.code:
-            if self.trace_a.fork != Fork.SHANGHAI or self.trace_b.fork != Fork.SHANGHAI:
-                return True
-
-        return False
+        return self.bytecode.has_push0 and not (
+            self.trace_a.fork == self.trace_b.fork == Fork.SHANGHAI
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class DifferentialResult:
     """Result of differential fuzzing."""
 
@@ -97,10 +106,25 @@ class DifferentialExecutor:
         fork_a: Fork = Fork.FRONTIER,
         fork_b: Fork = Fork.SHANGHAI,
         gas_limit: int = 1_000_000,
+        parallel: int | None = None,
     ) -> None:
+        """
+        Initialize differential executor.
+
+        Args:
+            fork_a: First fork to execute on
+            fork_b: Second fork to execute on
+            gas_limit: Gas limit for each execution
+            parallel: Number of worker processes used by run (default: CPU count)
+        """
         self.fork_a = fork_a
         self.fork_b = fork_b
         self.gas_limit = gas_limit
+        self.parallel = parallel or os.cpu_count() or 1
+        # Built once: Environment is frozen and shared, and State only ever
+        # replaces its frozen Accounts, so a shallow copy isolates each run
+        self._state_template = self._create_initial_state()
+        self._env = self._create_environment()
 
     def _create_interpreter(
         self, fork: Fork, state: State, env: Environment
@@ -124,11 +148,11 @@ class DifferentialExecutor:
             Account(balance=10**18),
         )
         state.set_account(
-            b"\x00" * 19 + b"\x01",
+            CALLER_ADDRESS,
             Account(balance=10**18),
         )
         state.set_account(
-            b"\x00" * 19 + b"\x02",
+            CONTRACT_ADDRESS,
             Account(balance=10**18),
         )
         return state
@@ -136,9 +160,9 @@ class DifferentialExecutor:
     def _create_environment(self) -> Environment:
         """Create execution environment."""
         return Environment(
-            caller=b"\x00" * 19 + b"\x01",
-            origin=b"\x00" * 19 + b"\x01",
-            coinbase=b"\x00" * 19 + b"\xff",
+            caller=CALLER_ADDRESS,
+            origin=CALLER_ADDRESS,
+            coinbase=COINBASE_ADDRESS,
             number=1000000,
             gas_limit=self.gas_limit,
             gas_price=1,
@@ -149,18 +173,17 @@ class DifferentialExecutor:
 
     def execute_single(self, code: bytes, fork: Fork) -> ExecutionTrace:
         """Execute bytecode on a single fork."""
-        state = self._create_initial_state()
-        env = self._create_environment()
+        state = State(accounts=dict(self._state_template.accounts))
+        env = self._env
 
         # Deploy code to test contract
-        contract_addr = b"\x00" * 19 + b"\x02"
-        state.set_code(contract_addr, code)
+        state.set_code(CONTRACT_ADDRESS, code)
 
         interpreter = self._create_interpreter(fork, state, env)
 
         message = Message(
-            caller=b"\x00" * 19 + b"\x01",
-            target=contract_addr,
+            caller=CALLER_ADDRESS,
+            target=CONTRACT_ADDRESS,
             value=0,
             data=b"",
             gas=self.gas_limit,
@@ -181,67 +204,102 @@ class DifferentialExecutor:
         trace_a: ExecutionTrace,
         trace_b: ExecutionTrace,
         bytecode: GeneratedBytecode,
+        find_any: bool = False,
     ) -> list[Divergence]:
-        """Compare two execution traces for divergences."""
+        """
+        Compare two execution traces for divergences.
+
+        Args:
+            trace_a: Execution on fork_a
+            trace_b: Execution on fork_b
+            bytecode: The bytecode both traces executed
+            find_any: Stop at the first divergence found, for callers that
+                only need to know whether the traces diverge at all
+
+        Returns:
+            Divergences found, in check order
+        """
+        ra = trace_a.result
+        rb = trace_b.result
+
+        # Nearly every pair agrees; settle that with one comparison before
+        # running the individual checks
+        if (ra.success, ra.gas_used, len(ra.logs), ra.return_data) == (
+            rb.success,
+            rb.gas_used,
+            len(rb.logs),
+            rb.return_data,
+        ):
+            return []
+
         divergences: list[Divergence] = []
+        add = divergences.append
 
         # Compare success status
-        if trace_a.result.success != trace_b.result.success:
-            divergences.append(
+        if ra.success != rb.success:
+            add(
                 Divergence(
                     divergence_type=DivergenceType.SUCCESS_MISMATCH,
                     bytecode=bytecode,
                     trace_a=trace_a,
                     trace_b=trace_b,
-                    description=f"Success mismatch: {trace_a.result.success} vs {trace_b.result.success}",
+                    description=f"Success mismatch: {ra.success} vs {rb.success}",
                 )
             )
+            if find_any:
+                return divergences
 
         # Compare return data
-        if trace_a.result.return_data != trace_b.result.return_data:
-            divergences.append(
+        if ra.return_data != rb.return_data:
+            add(
                 Divergence(
                     divergence_type=DivergenceType.RETURN_DATA_MISMATCH,
                     bytecode=bytecode,
                     trace_a=trace_a,
                     trace_b=trace_b,
-                    description=f"Return data mismatch: {len(trace_a.result.return_data)} vs {len(trace_b.result.return_data)} bytes",
+                    description=f"Return data mismatch: {len(ra.return_data)} vs {len(rb.return_data)} bytes",
                 )
             )
+            if find_any:
+                return divergences
 
         # Compare gas used (allow small variations)
-        gas_diff = abs(trace_a.result.gas_used - trace_b.result.gas_used)
-        if gas_diff > 0 and trace_a.result.success == trace_b.result.success:
-            divergences.append(
+        gas_diff = abs(ra.gas_used - rb.gas_used)
+        if gas_diff > 0 and ra.success == rb.success:
+            add(
                 Divergence(
                     divergence_type=DivergenceType.GAS_USED_MISMATCH,
                     bytecode=bytecode,
                     trace_a=trace_a,
                     trace_b=trace_b,
-                    description=f"Gas mismatch: {trace_a.result.gas_used} vs {trace_b.result.gas_used} (diff: {gas_diff})",
+                    description=f"Gas mismatch: {ra.gas_used} vs {rb.gas_used} (diff: {gas_diff})",
                 )
             )
+            if find_any:
+                return divergences
 
         # Compare logs
-        if len(trace_a.result.logs) != len(trace_b.result.logs):
-            divergences.append(
+        if len(ra.logs) != len(rb.logs):
+            add(
                 Divergence(
                     divergence_type=DivergenceType.LOGS_MISMATCH,
                     bytecode=bytecode,
                     trace_a=trace_a,
                     trace_b=trace_b,
-                    description=f"Log count mismatch: {len(trace_a.result.logs)} vs {len(trace_b.result.logs)}",
+                    description=f"Log count mismatch: {len(ra.logs)} vs {len(rb.logs)}",
                 )
             )
 
         return divergences
 
-    def execute_differential(self, bytecode: GeneratedBytecode) -> list[Divergence]:
-        """Execute bytecode on both forks and compare."""
+    def execute_differential(
+        self, bytecode: GeneratedBytecode, find_any: bool = False
+    ) -> list[Divergence]:
+        """Execute bytecode on both forks and compare (see compare_executions)."""
         trace_a = self.execute_single(bytecode.code, self.fork_a)
         trace_b = self.execute_single(bytecode.code, self.fork_b)
 
-        return self.compare_executions(trace_a, trace_b, bytecode)
+        return self.compare_executions(trace_a, trace_b, bytecode, find_any)
 
     def run(
         self,
@@ -262,26 +320,70 @@ class DifferentialExecutor:
         """
         result = DifferentialResult()
 
-        for bytecode in bytecodes:
-            result.total_executions += 1
+        # Closed explicitly so an early return stops the workers right away
+        with closing(self._execute_all(bytecodes)) as executions:
+            for divergences in executions:
+                result.total_executions += 1
 
-            divergences = self.execute_differential(bytecode)
+                for div in divergences:
+                    if div.is_expected():
+                        result.expected_divergences += 1
+                    else:
+                        result.unexpected_divergences += 1
+                        result.divergences.append(div)
 
-            for div in divergences:
-                if div.is_expected():
-                    result.expected_divergences += 1
-                else:
-                    result.unexpected_divergences += 1
-                    result.divergences.append(div)
+                        if callback:
+                            callback(div)
 
-                    if callback:
-                        callback(div)
-
-                    if max_divergences and result.unexpected_divergences >= max_divergences:
-                        return result
+                        if max_divergences and result.unexpected_divergences >= max_divergences:
+                            return result
 
         return result
 
+    def _execute_all(
+        self, bytecodes: Iterable[GeneratedBytecode]
+    ) -> Generator[list[Divergence], None, None]:
+        """
+        Execute bytecodes differentially, yielding results in input order.
+
+        With parallel > 1, batches of bytecodes run in worker processes
+        through a bounded window, so only a few batches are in flight.
+        Input that fits in one batch runs serially, as starting the workers
+        would cost more than it saves. Closing the iterator early cancels
+        queued batches and signals the running ones to stop after their
+        current bytecode.
+        """
+        if self.parallel <= 1:
+            for bytecode in bytecodes:
+                yield self.execute_differential(bytecode)
+            return
+
+        # A single execution takes well under a millisecond, so bytecodes
+        # are shipped in batches to amortise the inter-process overhead
+        it = iter(bytecodes)
+        batch = list(islice(it, _BATCH_SIZE))
+        if len(batch) < _BATCH_SIZE:
+            for bytecode in batch:
+                yield self.execute_differential(bytecode)
+            return
+
+        window: deque[Future[list[list[Divergence]]]] = deque()
+        cancelled = multiprocessing.Event()
+        pool = ProcessPoolExecutor(
+            max_workers=self.parallel, initializer=_init_worker, initargs=(cancelled,)
+        )
+        try:
+            while batch:
+                window.append(pool.submit(_execute_batch, self, batch))
+                if len(window) >= 2 * self.parallel:
+                    yield from window.popleft().result()
+                batch = list(islice(it, _BATCH_SIZE))
+            while window:
+                yield from window.popleft().result()
+        finally:
+            cancelled.set()
+            pool.shutdown(cancel_futures=True)
+
     def find_divergence(
         self,
         bytecodes: Iterator[GeneratedBytecode],
@@ -291,6 +393,35 @@ class DifferentialExecutor:
         return result.divergences[0] if result.divergences else None
 
 
+# Bytecodes executed per worker task when running in parallel
+_BATCH_SIZE = 256
+
+# Set by the parent once it no longer wants results (worker processes only)
+_cancelled: multiprocessing.synchronize.Event | None = None
+
+
+def _init_worker(cancelled: multiprocessing.synchronize.Event) -> None:
+    """Remember the parent's cancel flag in a freshly started worker."""
+    global _cancelled
+    _cancelled = cancelled
+
+
+def _execute_batch(
+    executor: DifferentialExecutor, bytecodes: list[GeneratedBytecode]
+) -> list[list[Divergence]]:
+    """
+    Execute a batch of bytecodes (used as a worker process entry point).
+
+    Stops early, returning a partial batch, once the cancel flag is set.
+    """
+    results = []
+    for bytecode in bytecodes:
+        if _cancelled is not None and _cancelled.is_set():
+            break
+        results.append(executor.execute_differential(bytecode))
+    return results
+
+
 def compare_forks(
     fork_a: Fork,
     fork_b: Fork,
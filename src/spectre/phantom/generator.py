@@ -7,6 +7,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cached_property
 
 from ethereum.common.types import Opcode
 
@@ -30,6 +31,11 @@ class GeneratedBytecode:
     description: str
     seed: int | None = None
 
+    @cached_property
+    def has_push0(self) -> bool:
+        """Whether the code contains a PUSH0 byte (checked once per sample)."""
+        return b"\x5f" in self.code
+
 
 class BytecodeGeneratorBase(ABC):
     """Base class for bytecode generators."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -13,7 +14,14 @@ from spectre.phantom.executor import (
 from spectre.phantom.generator import GeneratedBytecode, GeneratorStrategy
 
 
-@dataclass
+def _cache_key(bytecode: bytes) -> bytes:
+    """Key a candidate by its bytes, or by a 16-byte digest if not shorter than that."""
+    if len(bytecode) < 16:
+        return bytecode
+    return hashlib.blake2b(bytecode, digest_size=16).digest()
+
+
+@dataclass(slots=True)
 class MinimizationResult:
     """Result of minimizing a test case."""
 
@@ -61,35 +69,28 @@ class DeltaDebugger:
         self.executor = executor or DifferentialExecutor(fork_a, fork_b)
         self.fork_a = fork_a
         self.fork_b = fork_b
+        # ddmin retests the same candidates; remember each outcome
+        self._cache: dict[bytes, bool] = {}
 
     def _test_bytecode(self, bytecode: bytes) -> bool:
         """Test if bytecode produces a divergence."""
+        key = _cache_key(bytecode)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
         generated = GeneratedBytecode(
             code=bytecode,
             strategy=GeneratorStrategy.RANDOM,
             description="Minimization candidate",
         )
-        divergences = self.executor.execute_differential(generated)
+        # Whether a divergence is expected depends only on the bytecode and
+        # forks, so the first divergence found decides for all of them
+        divergences = self.executor.execute_differential(generated, find_any=True)
         # Return True if we find unexpected divergences
-        return any(not d.is_expected() for d in divergences)
-
-    def _split(self, bytecode: bytes, n: int) -> list[bytes]:
-        """Split bytecode into n roughly equal parts."""
-        if n <= 0:
-            return [bytecode]
-
-        chunk_size = max(1, len(bytecode) // n)
-        chunks = []
-
-        for i in range(0, len(bytecode), chunk_size):
-            chunks.append(bytecode[i : i + chunk_size])
-
-        return chunks
-
-    def _complement(self, bytecode: bytes, chunk: bytes, start: int) -> bytes:
-        """Return bytecode with chunk removed."""
-        end = start + len(chunk)
-        return bytecode[:start] + bytecode[end:]
+        failed = any(not d.is_expected() for d in divergences)
+        self._cache[key] = failed
+        return failed
 
     def minimize_ddmin(
         self,
@@ -118,22 +119,27 @@ class DeltaDebugger:
         n = 2  # Start with 2 chunks
         iterations = 0
         current = bytecode
+        first = 0  # Chunk to try first
 
         while len(current) > 1 and iterations < max_iterations:
             iterations += 1
-            chunks = self._split(current, n)
+            chunk_size = max(1, len(current) // n)
+            starts = range(0, len(current), chunk_size)
 
             found_reduction = False
 
-            # Try each chunk
-            for i, chunk in enumerate(chunks):
-                # Calculate start position
-                start = sum(len(chunks[j]) for j in range(i))
-                candidate = self._complement(current, chunk, start)
+            # Try removing each chunk (all but the last are chunk_size long),
+            # resuming where the last removal succeeded rather than at the
+            # front, whose chunks were just tested
+            for k in range(len(starts)):
+                index = (first + k) % len(starts)
+                start = starts[index]
+                candidate = current[:start] + current[start + chunk_size :]
 
                 if len(candidate) > 0 and self._test_bytecode(candidate):
                     current = candidate
                     n = max(2, n - 1)  # Reduce chunk count
+                    first = index
                     found_reduction = True
                     break
 
@@ -142,6 +148,7 @@ class DeltaDebugger:
                     # Can't split any further
                     break
                 n = min(n * 2, len(current))  # Try smaller chunks
+                first = 0
 
         return MinimizationResult.from_bytecodes(bytecode, current, iterations)
 
@@ -151,9 +158,14 @@ class DeltaDebugger:
         max_iterations: int = 1000,
     ) -> MinimizationResult:
         """
-        Simple linear minimization - try removing each byte.
-
-        Slower than ddmin but may find smaller results.
+        Linear minimization - walk the input removing bytes.
+
+        At each position a run of bytes is removed; the run doubles after
+        each successful removal and halves after a failed one, down to a
+        single byte before moving on. Long removable stretches thus cost a
+        logarithmic number of tests. Passes repeat until nothing changes, so
+        the result is still 1-minimal. Slower than ddmin but may find
+        smaller results.
         """
         if not self._test_bytecode(bytecode):
             return MinimizationResult.from_bytecodes(bytecode, bytecode, 0)
@@ -165,15 +177,19 @@ class DeltaDebugger:
         while changed and iterations < max_iterations:
             changed = False
             i = 0
+            run = 1
 
             while i < len(current) and iterations < max_iterations:
                 iterations += 1
-                candidate = current[:i] + current[i + 1 :]
+                candidate = current[:i] + current[i + run :]
 
                 if len(candidate) > 0 and self._test_bytecode(candidate):
                     current = candidate
                     changed = True
-                    # Don't increment i, as we removed a byte
+                    # Don't advance i, as we removed the run; try a longer one
+                    run *= 2
+                elif run > 1:
+                    run //= 2
                 else:
                     i += 1
 
@@ -225,6 +241,15 @@ class CustomMinimizer:
                      (i.e., exhibits the behavior we're trying to minimize)
         """
         self.test_fn = test_fn
+        self._cache: dict[bytes, bool] = {}
+
+    def _test(self, bytecode: bytes) -> bool:
+        """Call test_fn, at most once per distinct candidate."""
+        key = _cache_key(bytecode)
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = self._cache[key] = self.test_fn(bytecode)
+        return cached
 
     def minimize(
         self,
@@ -232,26 +257,29 @@ class CustomMinimizer:
         max_iterations: int = 1000,
     ) -> MinimizationResult:
         """Minimize bytecode using ddmin algorithm."""
-        if not self.test_fn(bytecode):
+        if not self._test(bytecode):
             return MinimizationResult.from_bytecodes(bytecode, bytecode, 0)
 
         n = 2
         iterations = 0
         current = bytecode
+        first = 0  # Chunk to try first, as in DeltaDebugger.minimize_ddmin
 
         while len(current) > 1 and iterations < max_iterations:
             iterations += 1
             chunk_size = max(1, len(current) // n)
             found_reduction = False
 
-            for i in range(n):
+            for k in range(n):
+                i = (first + k) % n
                 start = i * chunk_size
                 end = start + chunk_size if i < n - 1 else len(current)
                 candidate = current[:start] + current[end:]
 
-                if len(candidate) > 0 and self.test_fn(candidate):
+                if len(candidate) > 0 and self._test(candidate):
                     current = candidate
                     n = max(2, n - 1)
+                    first = i % n
                     found_reduction = True
                     break
 
@@ -259,5 +287,6 @@ class CustomMinimizer:
                 if n >= len(current):
                     break
                 n = min(n * 2, len(current))
+                first = 0
 
         return MinimizationResult.from_bytecodes(bytecode, current, iterations)
@@ -0,0 +1 @@
+"""Tests for definitions shared by all forks."""
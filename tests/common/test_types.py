@@ -0,0 +1,33 @@
+"""Tests for the shared EVM types."""
+
+import pytest
+
+from ethereum.common.types import _OPCODE_NAMES, Opcode, get_opcode_name
+
+
+class TestOpcodeNames:
+    """Tests for opcode name lookup."""
+
+    @pytest.mark.parametrize(
+        "opcode,name",
+        [
+            pytest.param(Opcode.STOP, "STOP", id="stop"),
+            pytest.param(Opcode.ADD, "ADD", id="add"),
+            pytest.param(Opcode.PUSH0, "PUSH0", id="push0"),
+            pytest.param(Opcode.SELFDESTRUCT, "SELFDESTRUCT", id="selfdestruct"),
+        ],
+    )
+    def test_get_opcode_name(self, opcode, name):
+        """Test that opcodes map back to their mnemonic."""
+        assert get_opcode_name(opcode) == name
+
+    def test_unknown_opcode(self):
+        """Test that unassigned bytes are reported as unknown."""
+        assert get_opcode_name(0x0C) == "UNKNOWN(0x0C)"
+        assert Opcode.from_byte(0x0C) is None
+
+    def test_names_are_mnemonics(self):
+        """Test that only the public mnemonics end up in the name table."""
+        for value, name in _OPCODE_NAMES.items():
+            assert name.isupper() and name.isalnum(), name
+            assert getattr(Opcode, name) == value
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import pytest
 
 from ethereum.common.types import (
@@ -17,6 +19,10 @@ from ethereum.frontier.vm.stack import Stack
 from ethereum.homestead.vm.interpreter import HomesteadInterpreter
 from ethereum.shanghai.vm.interpreter import ShanghaiInterpreter
 
+SENDER_ADDRESS = b"\x00" * 19 + b"\x01"
+CONTRACT_ADDRESS = b"\x00" * 19 + b"\x02"
+COINBASE_ADDRESS = b"\x00" * 19 + b"\xff"
+
 
 @pytest.fixture
 def empty_state() -> State:
@@ -25,12 +31,15 @@ def empty_state() -> State:
 
 
 @pytest.fixture
-def simple_state() -> State:
-    """Create a state with a funded account."""
+def funded_state() -> State:
+    """
+    Create a state with a funded sender account.
+
+    Built fresh for every test, since state transitions mutate it.
+    """
     state = State()
-    sender = b"\x00" * 19 + b"\x01"
     state.set_account(
-        sender,
+        SENDER_ADDRESS,
         Account(
             nonce=0,
             balance=10**18,  # 1 ETH
@@ -41,14 +50,18 @@ def simple_state() -> State:
     return state
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_env() -> Environment:
-    """Create a default block environment."""
+    """
+    Create a default block environment.
+
+    Environment is frozen, so one instance is shared by the whole session.
+    """
     return Environment(
         caller=ZERO_ADDRESS,
         origin=ZERO_ADDRESS,
         block_hashes={},
-        coinbase=b"\x00" * 19 + b"\xff",
+        coinbase=COINBASE_ADDRESS,
         number=1000,
         gas_limit=10_000_000,
         gas_price=1,
@@ -59,6 +72,12 @@ def default_env() -> Environment:
     )
 
 
+@pytest.fixture(scope="session")
+def shared_env() -> Environment:
+    """Create an all-defaults block environment shared by the whole session."""
+    return Environment()
+
+
 @pytest.fixture
 def stack() -> Stack:
     """Create an empty stack."""
@@ -89,6 +108,7 @@ def shanghai_interpreter(empty_state: State, default_env: Environment) -> Shangh
     return ShanghaiInterpreter(empty_state, default_env)
 
 
+@lru_cache(maxsize=4096)
 def create_message(
     code: bytes,
     data: bytes = b"",
@@ -97,9 +117,13 @@ def create_message(
     caller: bytes = ZERO_ADDRESS,
     target: bytes | None = None,
 ) -> Message:
-    """Helper to create a message for testing."""
+    """
+    Helper to create a message for testing.
+
+    Message is frozen, so identical messages are built once and shared.
+    """
     if target is None:
-        target = b"\x00" * 19 + b"\x02"
+        target = CONTRACT_ADDRESS
     return Message(
         caller=caller,
         target=target,
@@ -111,10 +135,13 @@ def create_message(
     )
 
 
+@lru_cache(maxsize=4096)
 def assemble(*opcodes: int | bytes) -> bytes:
     """
     Assemble opcodes into bytecode.
 
+    Results are memoized by the opcode tuple, like push().
+
     Args:
         *opcodes: Opcode bytes or integers
 
@@ -130,10 +157,13 @@ def assemble(*opcodes: int | bytes) -> bytes:
     return bytes(result)
 
 
+@lru_cache(maxsize=4096)
 def push(value: int, size: int = 0) -> bytes:
     """
     Create a PUSH instruction.
 
+    Results are memoized; the returned bytes are immutable and safe to share.
+
     Args:
         value: Value to push
         size: Size in bytes (0 = auto)
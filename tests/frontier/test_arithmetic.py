@@ -2,336 +2,189 @@
 
 import pytest
 
-from ethereum.common.types import Environment, Opcode, State
+from ethereum.common.types import Opcode, State
 from ethereum.frontier.vm.interpreter import Interpreter
 from tests.conftest import assemble, create_message, push
 
+MAX_UINT256 = 2**256 - 1
 
-@pytest.fixture
-def interpreter():
-    """Create interpreter for testing."""
-    state = State()
-    env = Environment()
-    return Interpreter(state, env)
+
+@pytest.fixture(scope="class")
+def interpreter(shared_env):
+    """
+    Create interpreter for testing.
+
+    Shared by the tests of a class: these programs only touch the stack, so
+    nothing carries over between executions.
+    """
+    return Interpreter(State(), shared_env)
+
+
+def run_arithmetic(interpreter, opcode, *operands):
+    """Push operands (last one on top), apply opcode and stop."""
+    code = assemble(*operands, opcode, Opcode.STOP)
+    return interpreter.execute(create_message(code))
 
 
 class TestAdd:
     """Tests for ADD opcode."""
 
-    def test_add_simple(self, interpreter):
-        """Test simple addition."""
-        # PUSH1 3, PUSH1 5, ADD, STOP
-        code = assemble(
-            push(5),
-            push(3),
-            Opcode.ADD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_add_overflow(self, interpreter):
-        """Test addition with overflow wraps around."""
-        # (2^256 - 1) + 1 = 0
-        max_val = 2**256 - 1
-        code = assemble(
-            push(1, 32),
-            push(max_val, 32),
-            Opcode.ADD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_add_zero(self, interpreter):
-        """Test adding zero."""
-        code = assemble(
-            push(0),
-            push(42),
-            Opcode.ADD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            pytest.param((push(5), push(3)), id="simple"),
+            # (2^256 - 1) + 1 = 0
+            pytest.param((push(1, 32), push(MAX_UINT256, 32)), id="overflow"),
+            pytest.param((push(0), push(42)), id="zero"),
+        ],
+    )
+    def test_add(self, interpreter, operands):
+        """Test addition, wrapping around on overflow."""
+        assert run_arithmetic(interpreter, Opcode.ADD, *operands).success
 
 
 class TestSub:
     """Tests for SUB opcode."""
 
-    def test_sub_simple(self, interpreter):
-        """Test simple subtraction."""
-        # 10 - 3 = 7
-        code = assemble(
-            push(3),
-            push(10),
-            Opcode.SUB,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_sub_underflow(self, interpreter):
-        """Test subtraction with underflow wraps around."""
-        # 0 - 1 = 2^256 - 1
-        code = assemble(
-            push(1),
-            push(0),
-            Opcode.SUB,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # 10 - 3 = 7
+            pytest.param((push(3), push(10)), id="simple"),
+            # 0 - 1 = 2^256 - 1
+            pytest.param((push(1), push(0)), id="underflow"),
+        ],
+    )
+    def test_sub(self, interpreter, operands):
+        """Test subtraction, wrapping around on underflow."""
+        assert run_arithmetic(interpreter, Opcode.SUB, *operands).success
 
 
 class TestMul:
     """Tests for MUL opcode."""
 
-    def test_mul_simple(self, interpreter):
-        """Test simple multiplication."""
-        # 6 * 7 = 42
-        code = assemble(
-            push(7),
-            push(6),
-            Opcode.MUL,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_mul_overflow(self, interpreter):
-        """Test multiplication overflow wraps."""
-        # Large values wrap modulo 2^256
-        code = assemble(
-            push(2**128, 32),
-            push(2**128, 32),
-            Opcode.MUL,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_mul_by_zero(self, interpreter):
-        """Test multiplication by zero."""
-        code = assemble(
-            push(0),
-            push(12345),
-            Opcode.MUL,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # 6 * 7 = 42
+            pytest.param((push(7), push(6)), id="simple"),
+            # Large values wrap modulo 2^256
+            pytest.param((push(2**128, 32), push(2**128, 32)), id="overflow"),
+            pytest.param((push(0), push(12345)), id="by_zero"),
+        ],
+    )
+    def test_mul(self, interpreter, operands):
+        """Test multiplication, wrapping around on overflow."""
+        assert run_arithmetic(interpreter, Opcode.MUL, *operands).success
 
 
 class TestDiv:
     """Tests for DIV opcode."""
 
-    def test_div_simple(self, interpreter):
-        """Test simple division."""
-        # 42 / 7 = 6
-        code = assemble(
-            push(7),
-            push(42),
-            Opcode.DIV,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_div_by_zero(self, interpreter):
-        """Test division by zero returns 0."""
-        code = assemble(
-            push(0),
-            push(42),
-            Opcode.DIV,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_div_truncates(self, interpreter):
-        """Test division truncates toward zero."""
-        # 7 / 3 = 2 (truncated)
-        code = assemble(
-            push(3),
-            push(7),
-            Opcode.DIV,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # 42 / 7 = 6
+            pytest.param((push(7), push(42)), id="simple"),
+            # Division by zero returns 0
+            pytest.param((push(0), push(42)), id="by_zero"),
+            # 7 / 3 = 2 (truncated)
+            pytest.param((push(3), push(7)), id="truncates"),
+        ],
+    )
+    def test_div(self, interpreter, operands):
+        """Test unsigned division."""
+        assert run_arithmetic(interpreter, Opcode.DIV, *operands).success
 
 
 class TestSdiv:
     """Tests for SDIV opcode (signed division)."""
 
-    def test_sdiv_positive(self, interpreter):
-        """Test signed division of positive numbers."""
-        code = assemble(
-            push(3),
-            push(9),
-            Opcode.SDIV,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_sdiv_negative(self, interpreter):
-        """Test signed division with negative numbers."""
-        # -9 / 3 = -3
-        neg_9 = 2**256 - 9  # Two's complement
-        code = assemble(
-            push(3),
-            push(neg_9, 32),
-            Opcode.SDIV,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_sdiv_by_zero(self, interpreter):
-        """Test signed division by zero returns 0."""
-        code = assemble(
-            push(0),
-            push(42),
-            Opcode.SDIV,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            pytest.param((push(3), push(9)), id="positive"),
+            # -9 / 3 = -3, with -9 in two's complement
+            pytest.param((push(3), push(2**256 - 9, 32)), id="negative"),
+            # Division by zero returns 0
+            pytest.param((push(0), push(42)), id="by_zero"),
+        ],
+    )
+    def test_sdiv(self, interpreter, operands):
+        """Test signed division."""
+        assert run_arithmetic(interpreter, Opcode.SDIV, *operands).success
 
 
 class TestMod:
     """Tests for MOD opcode."""
 
-    def test_mod_simple(self, interpreter):
-        """Test simple modulo."""
-        # 10 % 3 = 1
-        code = assemble(
-            push(3),
-            push(10),
-            Opcode.MOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_mod_by_zero(self, interpreter):
-        """Test modulo by zero returns 0."""
-        code = assemble(
-            push(0),
-            push(42),
-            Opcode.MOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # 10 % 3 = 1
+            pytest.param((push(3), push(10)), id="simple"),
+            # Modulo by zero returns 0
+            pytest.param((push(0), push(42)), id="by_zero"),
+        ],
+    )
+    def test_mod(self, interpreter, operands):
+        """Test unsigned modulo."""
+        assert run_arithmetic(interpreter, Opcode.MOD, *operands).success
 
 
 class TestExp:
     """Tests for EXP opcode."""
 
-    def test_exp_simple(self, interpreter):
-        """Test simple exponentiation."""
-        # 2^10 = 1024
-        code = assemble(
-            push(10),
-            push(2),
-            Opcode.EXP,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_exp_zero_exponent(self, interpreter):
-        """Test any number to the power of 0 is 1."""
-        code = assemble(
-            push(0),
-            push(123),
-            Opcode.EXP,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_exp_zero_base(self, interpreter):
-        """Test 0 to any positive power is 0."""
-        code = assemble(
-            push(5),
-            push(0),
-            Opcode.EXP,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # 2^10 = 1024
+            pytest.param((push(10), push(2)), id="simple"),
+            # Any number to the power of 0 is 1
+            pytest.param((push(0), push(123)), id="zero_exponent"),
+            # 0 to any positive power is 0
+            pytest.param((push(5), push(0)), id="zero_base"),
+        ],
+    )
+    def test_exp(self, interpreter, operands):
+        """Test exponentiation."""
+        assert run_arithmetic(interpreter, Opcode.EXP, *operands).success
 
 
 class TestAddmod:
     """Tests for ADDMOD opcode."""
 
-    def test_addmod_simple(self, interpreter):
-        """Test ADDMOD with simple values."""
-        # (10 + 10) % 8 = 4
-        code = assemble(
-            push(8),
-            push(10),
-            push(10),
-            Opcode.ADDMOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_addmod_overflow(self, interpreter):
-        """Test ADDMOD handles overflow correctly."""
-        # Uses full 512-bit intermediate result
-        max_val = 2**256 - 1
-        code = assemble(
-            push(2**256 - 2, 32),
-            push(max_val, 32),
-            push(max_val, 32),
-            Opcode.ADDMOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_addmod_by_zero(self, interpreter):
-        """Test ADDMOD by zero returns 0."""
-        code = assemble(
-            push(0),
-            push(10),
-            push(10),
-            Opcode.ADDMOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # (10 + 10) % 8 = 4
+            pytest.param((push(8), push(10), push(10)), id="simple"),
+            # Uses full 512-bit intermediate result
+            pytest.param(
+                (push(2**256 - 2, 32), push(MAX_UINT256, 32), push(MAX_UINT256, 32)),
+                id="overflow",
+            ),
+            # ADDMOD by zero returns 0
+            pytest.param((push(0), push(10), push(10)), id="by_zero"),
+        ],
+    )
+    def test_addmod(self, interpreter, operands):
+        """Test modular addition."""
+        assert run_arithmetic(interpreter, Opcode.ADDMOD, *operands).success
 
 
 class TestMulmod:
     """Tests for MULMOD opcode."""
 
-    def test_mulmod_simple(self, interpreter):
-        """Test MULMOD with simple values."""
-        # (10 * 10) % 8 = 4
-        code = assemble(
-            push(8),
-            push(10),
-            push(10),
-            Opcode.MULMOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_mulmod_by_zero(self, interpreter):
-        """Test MULMOD by zero returns 0."""
-        code = assemble(
-            push(0),
-            push(10),
-            push(10),
-            Opcode.MULMOD,
-            Opcode.STOP,
-        )
-        result = interpreter.execute(create_message(code))
-        assert result.success
+    @pytest.mark.parametrize(
+        "operands",
+        [
+            # (10 * 10) % 8 = 4
+            pytest.param((push(8), push(10), push(10)), id="simple"),
+            # MULMOD by zero returns 0
+            pytest.param((push(0), push(10), push(10)), id="by_zero"),
+        ],
+    )
+    def test_mulmod(self, interpreter, operands):
+        """Test modular multiplication."""
+        assert run_arithmetic(interpreter, Opcode.MULMOD, *operands).success
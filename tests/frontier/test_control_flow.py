@@ -2,14 +2,14 @@
 
 import pytest
 
-from ethereum.common.types import Environment, Opcode, State
+from ethereum.common.types import Opcode, State
 from ethereum.frontier.vm.interpreter import Interpreter
 from tests.conftest import assemble, create_message, push
 
 
 @pytest.fixture
-def interpreter():
-    return Interpreter(State(), Environment())
+def interpreter(shared_env):
+    return Interpreter(State(), shared_env)
 
 
 class TestJump:
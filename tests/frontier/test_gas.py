@@ -2,7 +2,7 @@
 
 import pytest
 
-from ethereum.common.types import Environment, Opcode, State
+from ethereum.common.types import Opcode, State
 from ethereum.frontier.vm.gas import GasSchedule
 from ethereum.frontier.vm.interpreter import Interpreter
 from ethereum.frontier.vm.memory import Memory
@@ -118,8 +118,8 @@ class TestGasConsumption:
     """Tests for gas consumption during execution."""
 
     @pytest.fixture
-    def interpreter(self):
-        return Interpreter(State(), Environment())
+    def interpreter(self, shared_env):
+        return Interpreter(State(), shared_env)
 
     def test_add_gas(self, interpreter):
         """Test ADD consumes correct gas."""
@@ -2,11 +2,25 @@
 
 import pytest
 
-from ethereum.common.types import Environment, Opcode, State
+from ethereum.common.types import MAX_U256, Opcode, State
 from ethereum.frontier.vm.interpreter import Interpreter
 from ethereum.frontier.vm.stack import Stack, StackOverflowError, StackUnderflowError
 from tests.conftest import assemble, create_message, push
 
+# Sixteen PUSH1s; the first n (2 bytes each) set up DUPn, plus one more push for SWAPn
+PUSH_0_TO_15 = b"".join(push(i) for i in range(16))
+
+
+@pytest.fixture(scope="module")
+def interpreter(shared_env):
+    """
+    Create interpreter for testing.
+
+    Shared by the whole module: these programs only touch the stack, so
+    nothing carries over between executions.
+    """
+    return Interpreter(State(), shared_env)
+
 
 class TestStack:
     """Tests for the Stack class directly."""
@@ -73,20 +87,10 @@ class TestStack:
 class TestPushOpcodes:
     """Tests for PUSH1-PUSH32 opcodes."""
 
-    @pytest.fixture
-    def interpreter(self):
-        return Interpreter(State(), Environment())
-
-    def test_push1(self, interpreter):
-        """Test PUSH1 opcode."""
-        code = assemble(push(0xFF), Opcode.STOP)
-        result = interpreter.execute(create_message(code))
-        assert result.success
-
-    def test_push32(self, interpreter):
-        """Test PUSH32 with max value."""
-        max_val = 2**256 - 1
-        code = assemble(push(max_val, 32), Opcode.STOP)
+    @pytest.mark.parametrize("size", range(1, 33), ids=lambda size: f"PUSH{size}")
+    def test_push(self, interpreter, size):
+        """Test PUSHn with the largest n-byte value."""
+        code = assemble(push(MAX_U256 >> (256 - 8 * size), size), Opcode.STOP)
         result = interpreter.execute(create_message(code))
         assert result.success
 
@@ -101,31 +105,13 @@ class TestPushOpcodes:
 class TestDupOpcodes:
     """Tests for DUP1-DUP16 opcodes."""
 
-    @pytest.fixture
-    def interpreter(self):
-        return Interpreter(State(), Environment())
-
-    def test_dup1(self, interpreter):
-        """Test DUP1 duplicates top of stack."""
-        code = assemble(
-            push(42),
-            Opcode.DUP1,
-            Opcode.STOP,
-        )
+    @pytest.mark.parametrize("n", range(1, 17), ids=lambda n: f"DUP{n}")
+    def test_dup(self, interpreter, n):
+        """Test DUPn duplicates the nth item."""
+        code = assemble(PUSH_0_TO_15[: 2 * n], Opcode.DUP1 + n - 1, Opcode.STOP)
         result = interpreter.execute(create_message(code))
         assert result.success
 
-    def test_dup16(self, interpreter):
-        """Test DUP16 duplicates 16th item."""
-        # Push 16 values, then DUP16
-        code = bytearray()
-        for i in range(16):
-            code.extend(push(i))
-        code.append(Opcode.DUP16)
-        code.append(Opcode.STOP)
-        result = interpreter.execute(create_message(bytes(code)))
-        assert result.success
-
     def test_dup_underflow(self, interpreter):
         """Test DUP with insufficient stack depth fails."""
         code = assemble(
@@ -141,31 +127,13 @@ class TestDupOpcodes:
 class TestSwapOpcodes:
     """Tests for SWAP1-SWAP16 opcodes."""
 
-    @pytest.fixture
-    def interpreter(self):
-        return Interpreter(State(), Environment())
-
-    def test_swap1(self, interpreter):
-        """Test SWAP1 swaps top two items."""
-        code = assemble(
-            push(1),
-            push(2),
-            Opcode.SWAP1,
-            Opcode.STOP,
-        )
+    @pytest.mark.parametrize("n", range(1, 17), ids=lambda n: f"SWAP{n}")
+    def test_swap(self, interpreter, n):
+        """Test SWAPn swaps the top with the (n+1)th item."""
+        code = assemble(PUSH_0_TO_15[: 2 * n], push(n), Opcode.SWAP1 + n - 1, Opcode.STOP)
         result = interpreter.execute(create_message(code))
         assert result.success
 
-    def test_swap16(self, interpreter):
-        """Test SWAP16 swaps top with 17th item."""
-        code = bytearray()
-        for i in range(17):
-            code.extend(push(i))
-        code.append(Opcode.SWAP16)
-        code.append(Opcode.STOP)
-        result = interpreter.execute(create_message(bytes(code)))
-        assert result.success
-
     def test_swap_underflow(self, interpreter):
         """Test SWAP with insufficient stack depth fails."""
         code = assemble(
@@ -180,10 +148,6 @@ class TestSwapOpcodes:
 class TestPopOpcode:
     """Tests for POP opcode."""
 
-    @pytest.fixture
-    def interpreter(self):
-        return Interpreter(State(), Environment())
-
     def test_pop(self, interpreter):
         """Test POP removes top item."""
         code = assemble(
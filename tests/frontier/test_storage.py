@@ -2,16 +2,16 @@
 
 import pytest
 
-from ethereum.common.types import Account, Environment, Opcode, State
+from ethereum.common.types import Account, Opcode, State
 from ethereum.frontier.vm.interpreter import Interpreter
-from tests.conftest import assemble, create_message, push
+from tests.conftest import CONTRACT_ADDRESS, assemble, create_message, push
 
 
 @pytest.fixture
 def state_with_contract():
     """Create state with a contract that has storage."""
     state = State()
-    contract_addr = b"\x00" * 19 + b"\x02"
+    contract_addr = CONTRACT_ADDRESS
     state.set_account(
         contract_addr,
         Account(
@@ -25,8 +25,8 @@ def state_with_contract():
 
 
 @pytest.fixture
-def interpreter(state_with_contract):
-    return Interpreter(state_with_contract, Environment())
+def interpreter(state_with_contract, shared_env):
+    return Interpreter(state_with_contract, shared_env)
 
 
 class TestSload:
@@ -77,7 +77,7 @@ class TestSstore:
         result = interpreter.execute(create_message(code))
         assert result.success
         # Verify storage was updated
-        assert interpreter.state.get_storage(b"\x00" * 19 + b"\x02", 100) == 42
+        assert interpreter.state.get_storage(CONTRACT_ADDRESS, 100) == 42
 
     def test_sstore_overwrite(self, interpreter):
         """Test overwriting existing value."""
@@ -89,7 +89,7 @@ class TestSstore:
         )
         result = interpreter.execute(create_message(code))
         assert result.success
-        assert interpreter.state.get_storage(b"\x00" * 19 + b"\x02", 0) == 999
+        assert interpreter.state.get_storage(CONTRACT_ADDRESS, 0) == 999
 
     def test_sstore_zero_clears(self, interpreter):
         """Test storing 0 clears the storage slot."""
@@ -101,7 +101,7 @@ class TestSstore:
         )
         result = interpreter.execute(create_message(code))
         assert result.success
-        assert interpreter.state.get_storage(b"\x00" * 19 + b"\x02", 0) == 0
+        assert interpreter.state.get_storage(CONTRACT_ADDRESS, 0) == 0
 
     def test_sstore_gas_cost_new(self, interpreter):
         """Test SSTORE gas cost for new storage."""
@@ -147,7 +147,7 @@ class TestStorageEdgeCases:
         result = interpreter.execute(create_message(code))
         assert result.success
         # Original value was 100, should now be 101
-        assert interpreter.state.get_storage(b"\x00" * 19 + b"\x02", 0) == 101
+        assert interpreter.state.get_storage(CONTRACT_ADDRESS, 0) == 101
 
     def test_multiple_sstores(self, interpreter):
         """Test multiple SSTORE operations."""
@@ -165,7 +165,7 @@ class TestStorageEdgeCases:
         )
         result = interpreter.execute(create_message(code))
         assert result.success
-        target = b"\x00" * 19 + b"\x02"
+        target = CONTRACT_ADDRESS
         assert interpreter.state.get_storage(target, 10) == 1
         assert interpreter.state.get_storage(target, 11) == 2
         assert interpreter.state.get_storage(target, 12) == 3
@@ -7,29 +7,27 @@ EIP-2: Homestead Hard-fork Changes
 
 import pytest
 
-from ethereum.common.types import Account, Environment, Opcode, State, Transaction
+from ethereum.common.types import Environment, Opcode, Transaction
 from ethereum.homestead.fork import state_transition
 from ethereum.homestead.vm.interpreter import HomesteadGasSchedule, HomesteadInterpreter
-from tests.conftest import create_message
+from tests.conftest import COINBASE_ADDRESS, CONTRACT_ADDRESS, SENDER_ADDRESS, create_message
 
-
-@pytest.fixture
-def funded_state():
-    """Create state with funded sender."""
-    state = State()
-    sender = b"\x00" * 19 + b"\x01"
-    state.set_account(
-        sender,
-        Account(nonce=0, balance=10**18, code=b"", storage={}),
-    )
-    return state
+# Init code used by the contract creation tests
+# PUSH1 0x42, PUSH1 0, MSTORE8, PUSH1 1, PUSH1 0, RETURN: deploys the single byte 0x42
+INIT_CODE_RETURN_42 = bytes.fromhex("6042 6000 53 6001 6000 f3")
+# STOP: deploys empty code
+INIT_CODE_EMPTY = bytes.fromhex("00")
+# PUSH1 255, PUSH1 0, RETURN: deploys 255 zero bytes
+INIT_CODE_RETURN_255_BYTES = bytes.fromhex("60ff 6000 f3")
+# PUSH1 0, PUSH1 0, REVERT
+INIT_CODE_REVERT = bytes.fromhex("6000 6000 fd")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def env():
-    """Create default environment."""
+    """Create a Homestead block environment, shared by the module since it is frozen."""
     return Environment(
-        coinbase=b"\x00" * 19 + b"\xff",
+        coinbase=COINBASE_ADDRESS,
         number=1150000,  # Homestead block
         gas_limit=10_000_000,
         gas_price=1,
@@ -66,29 +64,13 @@ class TestEIP2ContractCreation:
 
     def test_successful_create(self, funded_state, env):
         """Test successful contract creation."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Simple contract that returns 0x42
-        init_code = bytes(
-            [
-                0x60,
-                0x42,  # PUSH1 0x42
-                0x60,
-                0x00,  # PUSH1 0
-                0x53,  # MSTORE8
-                0x60,
-                0x01,  # PUSH1 1
-                0x60,
-                0x00,  # PUSH1 0
-                0xF3,  # RETURN
-            ]
-        )
+        sender = SENDER_ADDRESS
 
         tx = Transaction(
             sender=sender,
             to=None,
             value=0,
-            data=init_code,
+            data=INIT_CODE_RETURN_42,
             gas=100000,
             gas_price=1,
             nonce=0,
@@ -104,16 +86,13 @@ class TestEIP2ContractCreation:
 
     def test_create_with_value(self, funded_state, env):
         """Test contract creation with value transfer."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Empty contract
-        init_code = bytes([0x00])  # STOP
+        sender = SENDER_ADDRESS
 
         tx = Transaction(
             sender=sender,
             to=None,
             value=1000,
-            data=init_code,
+            data=INIT_CODE_EMPTY,
             gas=100000,
             gas_price=1,
             nonce=0,
@@ -128,24 +107,13 @@ class TestEIP2ContractCreation:
 
     def test_create_out_of_gas_deployment(self, funded_state, env):
         """Test CREATE fails when out of gas for code deployment."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Contract that returns large code
-        init_code = bytes(
-            [
-                0x60,
-                0xFF,  # PUSH1 255
-                0x60,
-                0x00,  # PUSH1 0
-                0xF3,  # RETURN (returns 255 zero bytes)
-            ]
-        )
+        sender = SENDER_ADDRESS
 
         tx = Transaction(
             sender=sender,
             to=None,
             value=0,
-            data=init_code,
+            data=INIT_CODE_RETURN_255_BYTES,
             gas=53000 + 100,  # Just enough for intrinsic + init, not deployment
             gas_price=1,
             nonce=0,
@@ -159,24 +127,13 @@ class TestEIP2ContractCreation:
 
     def test_create_revert_in_constructor(self, funded_state, env):
         """Test CREATE with reverting constructor."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Constructor that reverts
-        init_code = bytes(
-            [
-                0x60,
-                0x00,  # PUSH1 0
-                0x60,
-                0x00,  # PUSH1 0
-                0xFD,  # REVERT
-            ]
-        )
+        sender = SENDER_ADDRESS
 
         tx = Transaction(
             sender=sender,
             to=None,
             value=0,
-            data=init_code,
+            data=INIT_CODE_REVERT,
             gas=100000,
             gas_price=1,
             nonce=0,
@@ -193,8 +150,8 @@ class TestHomesteadStateTransition:
 
     def test_simple_transfer(self, funded_state, env):
         """Test simple value transfer works."""
-        sender = b"\x00" * 19 + b"\x01"
-        recipient = b"\x00" * 19 + b"\x02"
+        sender = SENDER_ADDRESS
+        recipient = CONTRACT_ADDRESS
 
         tx = Transaction(
             sender=sender,
@@ -213,11 +170,11 @@ class TestHomesteadStateTransition:
 
     def test_nonce_increment(self, funded_state, env):
         """Test sender nonce is incremented."""
-        sender = b"\x00" * 19 + b"\x01"
+        sender = SENDER_ADDRESS
 
         tx = Transaction(
             sender=sender,
-            to=b"\x00" * 19 + b"\x02",
+            to=CONTRACT_ADDRESS,
             value=0,
             data=b"",
             gas=21000,
@@ -232,12 +189,12 @@ class TestHomesteadStateTransition:
 
     def test_contract_call(self, funded_state, env):
         """Test calling a contract."""
-        sender = b"\x00" * 19 + b"\x01"
-        contract = b"\x00" * 19 + b"\x02"
+        sender = SENDER_ADDRESS
+        contract = CONTRACT_ADDRESS
 
         # Contract that returns caller
         # CALLER, PUSH1 0, MSTORE, PUSH1 32, PUSH1 0, RETURN
-        code = bytes([0x33, 0x60, 0x00, 0x52, 0x60, 0x20, 0x60, 0x00, 0xF3])
+        code = bytes.fromhex("33 6000 52 6020 6000 f3")
         funded_state.set_code(contract, code)
 
         tx = Transaction(
@@ -8,35 +8,33 @@ EIP-3855: PUSH0 Instruction
 
 import pytest
 
-from ethereum.common.types import Account, Environment, Opcode, State, Transaction
+from ethereum.common.types import Environment, Opcode, State, Transaction
 from ethereum.shanghai.fork import state_transition
 from ethereum.shanghai.vm.interpreter import ShanghaiGasSchedule, ShanghaiInterpreter
-from tests.conftest import assemble, create_message, push
-
-
-@pytest.fixture
-def state():
-    """Create empty state."""
-    return State()
-
-
-@pytest.fixture
-def funded_state():
-    """Create state with funded sender."""
-    state = State()
-    sender = b"\x00" * 19 + b"\x01"
-    state.set_account(
-        sender,
-        Account(nonce=0, balance=10**18, code=b"", storage={}),
-    )
-    return state
-
-
-@pytest.fixture
+from tests.conftest import (
+    COINBASE_ADDRESS,
+    CONTRACT_ADDRESS,
+    SENDER_ADDRESS,
+    assemble,
+    create_message,
+    push,
+)
+
+# PUSH0, PUSH0, MSTORE, PUSH1 32, PUSH0, RETURN: returns a zero word
+CODE_RETURN_ZERO_WORD = bytes.fromhex("5f 5f 52 6020 5f f3")
+# STOP
+INIT_CODE_STOP = bytes.fromhex("00")
+# PUSH2 25000, PUSH1 0, RETURN: deploys more than the EIP-170 limit of 24576 bytes
+INIT_CODE_RETURN_25000_BYTES = bytes.fromhex("61 61a8 6000 f3")
+# Initcode larger than the EIP-3860 limit of 49152 bytes (2 * MAX_CODE_SIZE)
+INIT_CODE_OVERSIZED = bytes(50000)
+
+
+@pytest.fixture(scope="module")
 def env():
-    """Create default environment."""
+    """Create a Shanghai block environment, shared by the module since it is frozen."""
     return Environment(
-        coinbase=b"\x00" * 19 + b"\xff",
+        coinbase=COINBASE_ADDRESS,
         number=17000000,  # Shanghai block
         gas_limit=10_000_000,
         gas_price=1,
@@ -45,13 +43,22 @@ def env():
     )
 
 
+@pytest.fixture(scope="class")
+def interpreter(env):
+    """
+    Create a Shanghai interpreter over an empty state.
+
+    Shared by the tests of a class: only the storage key test writes to the
+    state, and no other test reads storage.
+    """
+    return ShanghaiInterpreter(State(), env)
+
+
 class TestPush0Opcode:
     """Tests for PUSH0 opcode behavior."""
 
-    def test_push0_pushes_zero(self, state, env):
+    def test_push0_pushes_zero(self, interpreter):
         """Test PUSH0 pushes 0 onto the stack."""
-        interpreter = ShanghaiInterpreter(state, env)
-
         # PUSH0, PUSH1 1, ADD, STOP
         # Result should be 0 + 1 = 1
         code = assemble(
@@ -64,60 +71,28 @@ class TestPush0Opcode:
         result = interpreter.execute(create_message(code))
         assert result.success
 
-    def test_push0_gas_cost(self, state, env):
-        """Test PUSH0 costs 2 gas (G_BASE)."""
-        interpreter = ShanghaiInterpreter(state, env)
-
-        # Just PUSH0 and STOP
-        code = bytes([Opcode.PUSH0, Opcode.STOP])
-
-        result = interpreter.execute(create_message(code, gas=100))
-        assert result.success
-        # PUSH0 costs 2
-        assert result.gas_used == 2
-
-    def test_push0_cheaper_than_push1(self, state, env):
-        """Test PUSH0 is cheaper than PUSH1 0."""
-        interpreter = ShanghaiInterpreter(state, env)
-
-        # Using PUSH0
-        code_push0 = bytes([Opcode.PUSH0, Opcode.STOP])
-        result_push0 = interpreter.execute(create_message(code_push0, gas=100))
-
-        # Using PUSH1 0
-        code_push1 = bytes([0x60, 0x00, Opcode.STOP])  # PUSH1 0x00
-        result_push1 = interpreter.execute(create_message(code_push1, gas=100))
-
-        assert result_push0.success
-        assert result_push1.success
-        # PUSH0 (2) < PUSH1 (3)
-        assert result_push0.gas_used < result_push1.gas_used
-        assert result_push0.gas_used == 2
-        assert result_push1.gas_used == 3
-
-    def test_push0_multiple(self, state, env):
-        """Test multiple PUSH0 operations."""
-        interpreter = ShanghaiInterpreter(state, env)
-
-        # Push three zeros
-        code = bytes(
-            [
-                Opcode.PUSH0,
-                Opcode.PUSH0,
-                Opcode.PUSH0,
-                Opcode.STOP,
-            ]
-        )
-
+    @pytest.mark.parametrize(
+        "code,expected_gas",
+        [
+            # PUSH0 costs G_BASE (2)
+            pytest.param(bytes([Opcode.PUSH0, Opcode.STOP]), 2, id="push0_single"),
+            # PUSH1 0 costs G_VERYLOW (3), so PUSH0 is the cheaper way to push zero
+            pytest.param(bytes([Opcode.PUSH1, 0x00, Opcode.STOP]), 3, id="push1_zero"),
+            pytest.param(
+                bytes([Opcode.PUSH0, Opcode.PUSH0, Opcode.PUSH0, Opcode.STOP]),
+                6,
+                id="push0_multiple",
+            ),
+        ],
+    )
+    def test_push0_gas_cost(self, interpreter, code, expected_gas):
+        """Test PUSH0 gas cost against PUSH1 0."""
         result = interpreter.execute(create_message(code, gas=100))
         assert result.success
-        # 3 * PUSH0 (2) = 6
-        assert result.gas_used == 6
+        assert result.gas_used == expected_gas
 
-    def test_push0_in_arithmetic(self, state, env):
+    def test_push0_in_arithmetic(self, interpreter):
         """Test PUSH0 works correctly in arithmetic operations."""
-        interpreter = ShanghaiInterpreter(state, env)
-
         # 5 + 0 = 5, then 5 * 0 = 0
         code = assemble(
             Opcode.PUSH0,  # Push 0
@@ -131,10 +106,8 @@ class TestPush0Opcode:
         result = interpreter.execute(create_message(code))
         assert result.success
 
-    def test_push0_as_memory_offset(self, state, env):
+    def test_push0_as_memory_offset(self, interpreter):
         """Test PUSH0 can be used as memory offset."""
-        interpreter = ShanghaiInterpreter(state, env)
-
         # Store 0x42 at memory[0] using PUSH0 for offset
         code = assemble(
             push(0x42),  # value
@@ -150,10 +123,8 @@ class TestPush0Opcode:
         assert len(result.return_data) == 32
         assert result.return_data[-1] == 0x42
 
-    def test_push0_as_storage_key(self, state, env):
+    def test_push0_as_storage_key(self, interpreter):
         """Test PUSH0 can be used as storage key."""
-        interpreter = ShanghaiInterpreter(state, env)
-        target = b"\x00" * 19 + b"\x02"
 
         # Store value 123 at storage[0] using PUSH0
         code = assemble(
@@ -163,9 +134,9 @@ class TestPush0Opcode:
             Opcode.STOP,
         )
 
-        result = interpreter.execute(create_message(code, target=target))
+        result = interpreter.execute(create_message(code, target=CONTRACT_ADDRESS))
         assert result.success
-        assert interpreter.state.get_storage(target, 0) == 123
+        assert interpreter.state.get_storage(CONTRACT_ADDRESS, 0) == 123
 
 
 class TestPush0InContractCreation:
@@ -173,27 +144,11 @@ class TestPush0InContractCreation:
 
     def test_push0_in_init_code(self, funded_state, env):
         """Test PUSH0 works in contract init code."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Init code using PUSH0
-        # PUSH0, PUSH0, MSTORE, PUSH1 32, PUSH0, RETURN
-        init_code = bytes(
-            [
-                Opcode.PUSH0,  # Push 0 (value)
-                Opcode.PUSH0,  # Push 0 (offset)
-                0x52,  # MSTORE
-                0x60,
-                0x20,  # PUSH1 32
-                Opcode.PUSH0,  # Push 0 (offset)
-                0xF3,  # RETURN
-            ]
-        )
-
         tx = Transaction(
-            sender=sender,
+            sender=SENDER_ADDRESS,
             to=None,
             value=0,
-            data=init_code,
+            data=CODE_RETURN_ZERO_WORD,
             gas=100000,
             gas_price=1,
             nonce=0,
@@ -209,26 +164,11 @@ class TestPush0InContractCreation:
 
     def test_push0_in_deployed_code(self, funded_state, env):
         """Test calling contract with PUSH0 in deployed code."""
-        contract = b"\x00" * 19 + b"\x02"
-
-        # Contract code using PUSH0: returns 0
-        # PUSH0, PUSH0, MSTORE, PUSH1 32, PUSH0, RETURN
-        code = bytes(
-            [
-                Opcode.PUSH0,
-                Opcode.PUSH0,
-                0x52,  # MSTORE
-                0x60,
-                0x20,  # PUSH1 32
-                Opcode.PUSH0,
-                0xF3,  # RETURN
-            ]
-        )
-        funded_state.set_code(contract, code)
+        funded_state.set_code(CONTRACT_ADDRESS, CODE_RETURN_ZERO_WORD)
 
         tx = Transaction(
-            sender=b"\x00" * 19 + b"\x01",
-            to=contract,
+            sender=SENDER_ADDRESS,
+            to=CONTRACT_ADDRESS,
             value=0,
             data=b"",
             gas=100000,
@@ -256,16 +196,11 @@ class TestShanghaiStateTransition:
 
     def test_eip3860_initcode_limit(self, funded_state, env):
         """Test EIP-3860 initcode size limit."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Initcode larger than 49152 bytes (2 * MAX_CODE_SIZE)
-        large_initcode = b"\x00" * 50000
-
         tx = Transaction(
-            sender=sender,
+            sender=SENDER_ADDRESS,
             to=None,
             value=0,
-            data=large_initcode,
+            data=INIT_CODE_OVERSIZED,
             gas=10_000_000,
             gas_price=1,
             nonce=0,
@@ -275,19 +210,16 @@ class TestShanghaiStateTransition:
 
         assert not result.success
         assert "initcode" in result.error.lower() or "large" in result.error.lower()
+        # Rejected during validation, before any gas is charged
+        assert result.gas_used == 0
 
     def test_eip3860_initcode_gas(self, funded_state, env):
         """Test EIP-3860 initcode gas metering."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Small initcode that just returns
-        init_code = bytes([0x00])  # STOP
-
         tx = Transaction(
-            sender=sender,
+            sender=SENDER_ADDRESS,
             to=None,
             value=0,
-            data=init_code,
+            data=INIT_CODE_STOP,
             gas=100000,
             gas_price=1,
             nonce=0,
@@ -302,27 +234,11 @@ class TestShanghaiStateTransition:
 
     def test_code_size_limit(self, funded_state, env):
         """Test EIP-170 code size limit is enforced."""
-        sender = b"\x00" * 19 + b"\x01"
-
-        # Init code that returns code larger than 24576 bytes
-        # PUSH2 size, PUSH1 0, RETURN
-        large_size = 25000
-        init_code = bytes(
-            [
-                0x61,  # PUSH2
-                (large_size >> 8) & 0xFF,  # size high byte
-                large_size & 0xFF,  # size low byte
-                0x60,
-                0x00,  # PUSH1 0
-                0xF3,  # RETURN
-            ]
-        )
-
         tx = Transaction(
-            sender=sender,
+            sender=SENDER_ADDRESS,
             to=None,
             value=0,
-            data=init_code,
+            data=INIT_CODE_RETURN_25000_BYTES,
             gas=10_000_000,
             gas_price=1,
             nonce=0,
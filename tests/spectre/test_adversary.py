@@ -1,8 +1,15 @@
 """Tests for ADVERSARY test generator."""
 
+import json
+from collections import Counter
+from dataclasses import replace
+
+import pytest
+
 from spectre.adversary.analyzer import (
     EIPAnalyzer,
     EIPCategory,
+    EIPSpec,
     OpcodeChange,
 )
 from spectre.adversary.generator import TestGenerator, TestSuite
@@ -12,16 +19,44 @@ from spectre.adversary.strategies import (
     GasExhaustionStrategy,
     OpcodeInteractionStrategy,
     StrategyType,
+    TestCase,
     get_all_strategies,
 )
 
 
+@pytest.fixture(scope="module")
+def analyzer():
+    """
+    Create an EIP analyzer.
+
+    Shared by the whole module: strategies only read the EIP table.
+    """
+    return EIPAnalyzer()
+
+
+@pytest.fixture(scope="module")
+def eip_3855(analyzer):
+    """Look up the PUSH0 specification."""
+    return analyzer.get_eip(3855)
+
+
+@pytest.fixture(scope="module")
+def push0_suite():
+    """Generate the EIP-3855 suite once; tests only read it."""
+    return TestGenerator().generate_for_eip(3855)
+
+
+@pytest.fixture(scope="module")
+def shift_suite():
+    """Generate the EIP-145 (SHL/SHR/SAR) suite once; tests only read it."""
+    return TestGenerator().generate_for_eip(145)
+
+
 class TestEIPAnalyzer:
     """Tests for EIP analyzer."""
 
-    def test_get_known_eip(self):
+    def test_get_known_eip(self, analyzer):
         """Test getting a known EIP."""
-        analyzer = EIPAnalyzer()
         eip = analyzer.get_eip(3855)
 
         assert eip is not None
@@ -29,16 +64,14 @@ class TestEIPAnalyzer:
         assert eip.title == "PUSH0 instruction"
         assert eip.category == EIPCategory.CORE
 
-    def test_get_unknown_eip(self):
+    def test_get_unknown_eip(self, analyzer):
         """Test getting an unknown EIP returns None."""
-        analyzer = EIPAnalyzer()
         eip = analyzer.get_eip(99999)
 
         assert eip is None
 
-    def test_get_opcodes_for_eip(self):
+    def test_get_opcodes_for_eip(self, analyzer):
         """Test getting opcodes for an EIP."""
-        analyzer = EIPAnalyzer()
         opcodes = analyzer.get_opcodes_for_eip(3855)
 
         assert len(opcodes) == 1
@@ -46,35 +79,50 @@ class TestEIPAnalyzer:
         assert opcodes[0].opcode == 0x5F
         assert opcodes[0].gas_cost == 2
 
-    def test_get_boundary_values(self):
+    def test_get_boundary_values(self, analyzer):
         """Test getting boundary values for EIP."""
-        analyzer = EIPAnalyzer()
         boundaries = analyzer.get_boundary_values(3855)
 
         # Should include standard EVM boundaries plus EIP-specific
         assert 0 in boundaries
         assert 2**256 - 1 in boundaries
 
-    def test_list_all_eips(self):
-        """Test listing all known EIPs."""
+    def test_boundary_values_follow_eips_changes(self):
+        """Test that cached boundary values notice added or replaced EIPs."""
         analyzer = EIPAnalyzer()
+        assert analyzer.get_boundary_values(9999) == []
+
+        analyzer.eips[9999] = EIPSpec(
+            number=9999,
+            title="Test",
+            category=EIPCategory.CORE,
+            status="Draft",
+            boundary_values=[12345],
+        )
+        assert 12345 in analyzer.get_boundary_values(9999)
+
+        analyzer.eips[9999] = replace(analyzer.eips[9999], boundary_values=[54321])
+        boundaries = analyzer.get_boundary_values(9999)
+        assert 54321 in boundaries
+        assert 12345 not in boundaries
+
+    def test_list_all_eips(self, analyzer):
+        """Test listing all known EIPs."""
         eips = analyzer.list_all_eips()
 
         assert len(eips) > 0
         assert 3855 in eips
         assert 145 in eips
 
-    def test_get_gas_changes(self):
+    def test_get_gas_changes(self, analyzer):
         """Test getting gas changes from EIP."""
-        analyzer = EIPAnalyzer()
         gas = analyzer.get_gas_changes(3855)
 
         assert "PUSH0" in gas
         assert gas["PUSH0"] == 2
 
-    def test_get_new_opcodes(self):
+    def test_get_new_opcodes(self, analyzer):
         """Test getting only new opcodes."""
-        analyzer = EIPAnalyzer()
         new_ops = analyzer.get_new_opcodes(145)
 
         assert len(new_ops) == 3  # SHL, SHR, SAR
@@ -82,124 +130,62 @@ class TestEIPAnalyzer:
             assert op.change_type == OpcodeChange.NEW_OPCODE
 
 
-class TestBoundaryValueStrategy:
-    """Tests for boundary value test generation."""
+# (strategy, EIP, substring that some generated test names must contain)
+STRATEGY_CASES = [
+    pytest.param(BoundaryValueStrategy, 3855, "boundary", id="boundary"),
+    pytest.param(OpcodeInteractionStrategy, 3855, "dup", id="interaction_dup"),
+    pytest.param(OpcodeInteractionStrategy, 145, "swap", id="interaction_swap"),
+    pytest.param(GasExhaustionStrategy, 3855, "exact", id="gas_exact"),
+    pytest.param(GasExhaustionStrategy, 3855, "insufficient", id="gas_insufficient"),
+    pytest.param(ForkBoundaryStrategy, 3855, "pre", id="fork_pre"),
+    pytest.param(ForkBoundaryStrategy, 3855, "post", id="fork_post"),
+]
 
-    def test_generates_tests(self):
-        """Test that strategy generates tests."""
-        strategy = BoundaryValueStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
 
-        tests = list(strategy.generate(eip, analyzer))
+class TestStrategies:
+    """Tests for the individual test generation strategies."""
 
-        assert len(tests) > 0
-        for test in tests:
-            assert test.strategy == StrategyType.BOUNDARY
+    @pytest.mark.parametrize("strategy_cls,eip_number,tag", STRATEGY_CASES)
+    def test_generates_tagged_tests(self, analyzer, strategy_cls, eip_number, tag):
+        """Test that a strategy generates tests of its own type with bytecode."""
+        strategy = strategy_cls()
+
+        tests = list(strategy.generate(analyzer.get_eip(eip_number), analyzer))
+
+        tagged = [t for t in tests if tag in t.name]
+        assert len(tagged) > 0
+        for test in tagged:
+            assert test.strategy == strategy.strategy_type
             assert len(test.bytecode) > 0
 
-    def test_test_names_unique(self):
+    def test_boundary_test_names_unique(self, analyzer, eip_3855):
         """Test that generated test names are unique."""
-        strategy = BoundaryValueStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
-
-        tests = list(strategy.generate(eip, analyzer))
+        tests = list(BoundaryValueStrategy().generate(eip_3855, analyzer))
         names = [t.name for t in tests]
 
-        # All names should be unique
         assert len(names) == len(set(names))
 
+    def test_insufficient_gas_tests_fail(self, analyzer, eip_3855):
+        """Test that insufficient gas tests expect failure."""
+        tests = list(GasExhaustionStrategy().generate(eip_3855, analyzer))
 
-class TestOpcodeInteractionStrategy:
-    """Tests for opcode interaction test generation."""
-
-    def test_generates_stack_tests(self):
-        """Test generation of stack interaction tests."""
-        strategy = OpcodeInteractionStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
-
-        tests = list(strategy.generate(eip, analyzer))
-
-        # Should have DUP tests
-        dup_tests = [t for t in tests if "dup" in t.name]
-        assert len(dup_tests) > 0
-
-    def test_generates_swap_tests(self):
-        """Test generation of swap interaction tests."""
-        strategy = OpcodeInteractionStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(145)  # SHL/SHR/SAR
-
-        tests = list(strategy.generate(eip, analyzer))
-
-        # Should have SWAP tests
-        swap_tests = [t for t in tests if "swap" in t.name]
-        assert len(swap_tests) > 0
-
-
-class TestGasExhaustionStrategy:
-    """Tests for gas exhaustion test generation."""
-
-    def test_generates_exact_gas_tests(self):
-        """Test generation of exact gas tests."""
-        strategy = GasExhaustionStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
-
-        tests = list(strategy.generate(eip, analyzer))
-
-        exact_tests = [t for t in tests if "exact" in t.name]
-        assert len(exact_tests) > 0
-
-    def test_generates_insufficient_gas_tests(self):
-        """Test generation of insufficient gas tests."""
-        strategy = GasExhaustionStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
-
-        tests = list(strategy.generate(eip, analyzer))
-
-        insufficient_tests = [t for t in tests if "insufficient" in t.name]
-        assert len(insufficient_tests) > 0
-        for test in insufficient_tests:
-            assert not test.expected_success
-
-
-class TestForkBoundaryStrategy:
-    """Tests for fork boundary test generation."""
-
-    def test_generates_pre_fork_tests(self):
-        """Test generation of pre-fork tests."""
-        strategy = ForkBoundaryStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
-
-        tests = list(strategy.generate(eip, analyzer))
-
-        pre_tests = [t for t in tests if "pre" in t.name]
-        assert len(pre_tests) > 0
-
-    def test_generates_post_fork_tests(self):
-        """Test generation of post-fork tests."""
-        strategy = ForkBoundaryStrategy()
-        analyzer = EIPAnalyzer()
-        eip = analyzer.get_eip(3855)
+        for test in tests:
+            if "insufficient" in test.name:
+                assert not test.expected_success
 
-        tests = list(strategy.generate(eip, analyzer))
+    def test_pre_and_post_share_bytecode(self, analyzer, eip_3855):
+        """Test that identical bytecodes are interned to one object."""
+        pre, post = list(ForkBoundaryStrategy().generate(eip_3855, analyzer))
 
-        post_tests = [t for t in tests if "post" in t.name]
-        assert len(post_tests) > 0
+        assert pre.bytecode is post.bytecode
 
 
 class TestTestGenerator:
     """Tests for main test generator."""
 
-    def test_generate_for_known_eip(self):
+    def test_generate_for_known_eip(self, push0_suite):
         """Test generating tests for known EIP."""
-        generator = TestGenerator()
-        suite = generator.generate_for_eip(3855)
+        suite = push0_suite
 
         assert suite.eip_number == 3855
         assert len(suite.test_cases) > 0
@@ -223,6 +209,41 @@ class TestTestGenerator:
         for test in suite.test_cases:
             assert test.strategy == StrategyType.BOUNDARY
 
+    def test_generate_parallel_matches_serial(self, shift_suite):
+        """Test that parallel generation yields the same tests in order."""
+        serial = shift_suite
+        parallel = TestGenerator(parallel=2).generate_for_eip(145)
+
+        assert [t.name for t in parallel.test_cases] == [t.name for t in serial.test_cases]
+        assert [t.bytecode for t in parallel.test_cases] == [t.bytecode for t in serial.test_cases]
+
+    def test_stream_json_matches_suite(self, tmp_path, shift_suite):
+        """Test that streamed JSON holds the same tests as a built suite."""
+        suite = shift_suite
+
+        path, counts = TestGenerator().stream_json(145, tmp_path)
+        data = json.loads(path.read_text())
+
+        assert list(data) == list(suite.to_dict())
+        assert data["test_count"] == len(suite.test_cases)
+        assert data["tests"] == suite.to_dict()["tests"]
+        assert counts == Counter(tc.strategy for tc in suite.test_cases)
+
+    def test_stream_json_parallel_matches_serial(self, tmp_path, shift_suite):
+        """Test that streaming from worker processes keeps the test order."""
+        path, _ = TestGenerator(parallel=2).stream_json(145, tmp_path)
+
+        assert json.loads(path.read_text())["tests"] == shift_suite.to_dict()["tests"]
+
+    def test_stream_json_unknown_eip(self, tmp_path):
+        """Test streaming an unknown EIP writes an empty suite."""
+        path, counts = TestGenerator().stream_json(99999, tmp_path)
+        data = json.loads(path.read_text())
+
+        assert data["tests"] == []
+        assert data["test_count"] == 0
+        assert not counts
+
     def test_generate_all(self):
         """Test generating tests for all known EIPs."""
         generator = TestGenerator()
@@ -259,15 +280,17 @@ class TestTestSuite:
 
         json_str = suite.to_json()
 
-        import json
-
         data = json.loads(json_str)
         assert data["eip_number"] == 3855
 
+    def test_to_json_matches_to_dict(self, shift_suite):
+        """Test that streamed JSON encodes the same document as to_dict."""
+        suite = shift_suite
+
+        assert json.loads(suite.to_json()) == suite.to_dict()
+
     def test_to_eest_format(self):
         """Test conversion to EEST format."""
-        from spectre.adversary.strategies import TestCase
-
         suite = TestSuite(
             eip_number=3855,
             eip_title="PUSH0",
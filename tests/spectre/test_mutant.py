@@ -1,14 +1,44 @@
 """Tests for MUTANT mutation testing engine."""
 
+import json
+import re
+import subprocess
+import sys
+from dataclasses import replace
+
+import pytest
+
+from spectre.mutant.engine import (
+    MutantResult,
+    MutantStatus,
+    MutationEngine,
+    MutationTestResult,
+    UnmutatedTestsFailedError,
+    _run_capped,
+    stratified_sample,
+)
 from spectre.mutant.operators import (
-    ArithmeticSwapOperator,
-    ComparisonSwapOperator,
-    GasCostOperator,
-    LogicNegateOperator,
+    Mutation,
     MutationType,
-    OffByOneOperator,
+    SyntaxTreeOperator,
+    TreeArithmeticSwapOperator,
+    TreeComparisonSwapOperator,
+    TreeGasCostOperator,
+    TreeLogicNegateOperator,
+    TreeOffByOneOperator,
+    TreeReturnValueOperator,
+    comment_and_docstring_lines,
     get_all_operators,
+    parse_lines,
 )
+from spectre.mutant.report import MutationReport
+from spectre.mutant.schema import build_schema
+
+# Parsed and tokenized once for the operator collection tests, as the engine does
+SHARED_SOURCE = "G_SLOAD = 50\nif x < 10:\n    result = a + b\n    return True\n"
+SHARED_LINES = SHARED_SOURCE.split("\n")
+SHARED_TREE = parse_lines(SHARED_LINES)
+SHARED_SKIP_LINES = comment_and_docstring_lines(SHARED_LINES)
 
 
 class TestArithmeticSwapOperator:
@@ -16,7 +46,7 @@ class TestArithmeticSwapOperator:
 
     def test_swap_add_to_sub(self):
         """Test swapping + to -."""
-        op = ArithmeticSwapOperator()
+        op = TreeArithmeticSwapOperator()
         source = "result = a + b"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -30,7 +60,7 @@ class TestArithmeticSwapOperator:
 
     def test_swap_mul_to_div(self):
         """Test swapping * to /."""
-        op = ArithmeticSwapOperator()
+        op = TreeArithmeticSwapOperator()
         source = "result = x * y"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -42,19 +72,26 @@ class TestArithmeticSwapOperator:
 
     def test_ignores_comments(self):
         """Test that comments are not mutated."""
-        op = ArithmeticSwapOperator()
+        op = TreeArithmeticSwapOperator()
         source = "# result = a + b"
         mutations = list(op.generate_mutations(source, "test.py"))
         assert len(mutations) == 0
 
+    def test_ignores_docstrings(self):
+        """Test that docstring lines are not mutated but code is."""
+        op = TreeArithmeticSwapOperator()
+        source = 'def f(a, b):\n    """\n    Return a + b.\n    """\n    return a + b\n'
+        mutations = list(op.generate_mutations(source, "test.py"))
+        assert [m.line_number for m in mutations] == [5]
+
 
 class TestComparisonSwapOperator:
     """Tests for comparison swap mutations."""
 
     def test_swap_lt_to_gte(self):
         """Test swapping < to >=."""
-        op = ComparisonSwapOperator()
-        source = "if x < y:"
+        op = TreeComparisonSwapOperator()
+        source = "if x < y:\n    pass"
         mutations = list(op.generate_mutations(source, "test.py"))
 
         swap_mutation = next(
@@ -66,8 +103,8 @@ class TestComparisonSwapOperator:
 
     def test_swap_eq_to_neq(self):
         """Test swapping == to !=."""
-        op = ComparisonSwapOperator()
-        source = "if a == b:"
+        op = TreeComparisonSwapOperator()
+        source = "if a == b:\n    pass"
         mutations = list(op.generate_mutations(source, "test.py"))
 
         swap_mutation = next(
@@ -82,7 +119,7 @@ class TestOffByOneOperator:
 
     def test_increment_constant(self):
         """Test incrementing numeric constant."""
-        op = OffByOneOperator()
+        op = TreeOffByOneOperator()
         source = "limit = 1024"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -95,7 +132,7 @@ class TestOffByOneOperator:
 
     def test_decrement_constant(self):
         """Test decrementing numeric constant."""
-        op = OffByOneOperator()
+        op = TreeOffByOneOperator()
         source = "depth = 10"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -107,7 +144,7 @@ class TestOffByOneOperator:
 
     def test_no_decrement_zero(self):
         """Test that 0 is not decremented to -1."""
-        op = OffByOneOperator()
+        op = TreeOffByOneOperator()
         source = "start = 0"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -124,7 +161,7 @@ class TestGasCostOperator:
 
     def test_double_gas_cost(self):
         """Test doubling gas cost constants."""
-        op = GasCostOperator()
+        op = TreeGasCostOperator()
         source = "G_SLOAD = 50"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -137,7 +174,7 @@ class TestGasCostOperator:
 
     def test_halve_gas_cost(self):
         """Test halving gas cost constants."""
-        op = GasCostOperator()
+        op = TreeGasCostOperator()
         source = "G_CREATE = 32000"
         mutations = list(op.generate_mutations(source, "test.py"))
 
@@ -153,8 +190,8 @@ class TestLogicNegateOperator:
 
     def test_negate_condition(self):
         """Test negating if condition."""
-        op = LogicNegateOperator()
-        source = "if x > 0:"
+        op = TreeLogicNegateOperator()
+        source = "if x > 0:\n    pass"
         mutations = list(op.generate_mutations(source, "test.py"))
 
         negate = next(
@@ -165,6 +202,105 @@ class TestLogicNegateOperator:
         assert negate.mutation_type == MutationType.LOGIC_NEGATE
 
 
+class TestSyntaxTreeOperators:
+    """Tests for operators that mutate the parsed syntax tree."""
+
+    def test_ignores_strings_and_comments(self):
+        """Test that operators inside strings and comments are untouched."""
+        source = 'def f(a, b):\n    label = "a + b"  # a + b\n    return a + b\n'
+        mutations = list(TreeArithmeticSwapOperator().generate_mutations(source, "f.py"))
+
+        assert [m.line_number for m in mutations] == [3]
+        assert mutations[0].mutated == "return a - b"
+
+    def test_floor_division_swapped_whole(self):
+        """Test that '//' is swapped as one token."""
+        source = "x = a // b\n"
+        mutations = list(TreeArithmeticSwapOperator().generate_mutations(source, "f.py"))
+
+        assert [m.mutated for m in mutations] == ["x = a * b"]
+
+    def test_comparison_chain(self):
+        """Test that each comparison in a chain is swapped separately."""
+        source = "ok = 0 <= x < limit\n"
+        mutations = list(TreeComparisonSwapOperator().generate_mutations(source, "f.py"))
+
+        assert [m.mutated for m in mutations] == ["ok = 0 > x < limit", "ok = 0 <= x >= limit"]
+
+    def test_gas_cost_annotated_constants(self):
+        """Test that annotated G_* constants are mutated and other names are not."""
+        source = (
+            "class Schedule:\n"
+            "    G_SLOAD: ClassVar[int] = 50\n"
+            "    G_BASE = 1\n"
+            "    LIMIT: int = 1024\n"
+            '    NOTE = "G_X = 3"\n'
+        )
+        mutations = list(TreeGasCostOperator().generate_mutations(source, "gas.py"))
+
+        assert [m.mutated for m in mutations] == [
+            "G_SLOAD: ClassVar[int] = 100",
+            "G_SLOAD: ClassVar[int] = 25",
+            "G_BASE = 2",
+        ]
+
+    def test_all_mutants_parse(self):
+        """Test that every tree mutant is valid Python."""
+        import ast
+
+        source = (
+            "def f(x, y):\n"
+            "    if x > (y + 1) and x != 3:\n"
+            "        return True\n"
+            "    elif x % 2 == 0:\n"
+            "        return 0\n"
+            "    return None\n"
+        )
+        operators = [
+            TreeArithmeticSwapOperator(),
+            TreeComparisonSwapOperator(),
+            TreeOffByOneOperator(),
+            TreeLogicNegateOperator(),
+            TreeReturnValueOperator(),
+        ]
+        lines = source.split("\n")
+
+        for op in operators:
+            mutations = list(op.generate_mutations(source, "f.py"))
+            assert mutations, op.name
+            for m in mutations:
+                mutated = lines.copy()
+                indent = len(lines[m.line_number - 1]) - len(lines[m.line_number - 1].lstrip())
+                mutated[m.line_number - 1] = " " * indent + m.mutated
+                ast.parse("\n".join(mutated))
+
+
+class TestCommentAndDocstringLines:
+    """Tests for the lines line-based operators leave alone."""
+
+    def test_finds_comments_and_standalone_strings(self):
+        """Test comment-only lines and string statements are skipped, code is not."""
+        lines = [
+            '"""Module docstring."""',
+            "# comment",
+            "x = 1  # trailing comment",
+            'y = """',
+            "a + b",
+            '"""',
+            "def f():",
+            '    """',
+            "    Docs.",
+            '    """',
+            "    return x",
+        ]
+        assert comment_and_docstring_lines(lines) == {1, 2, 8, 9, 10}
+
+    def test_falls_back_to_comments_when_untokenizable(self):
+        """Test unterminated sources still skip comment lines."""
+        lines = ["# comment", 'x = """', "a + b"]
+        assert comment_and_docstring_lines(lines) == {1}
+
+
 class TestOperatorCollection:
     """Tests for operator collection functions."""
 
@@ -180,16 +316,341 @@ class TestOperatorCollection:
             assert hasattr(op, "name")
             assert op.name is not None
 
-    def test_all_operators_generate(self):
-        """Test all operators can generate mutations."""
-        operators = get_all_operators()
-        source = """
-        G_SLOAD = 50
-        if x < 10:
-            result = a + b
-            return True
-        """
+    @pytest.mark.parametrize("op", get_all_operators(), ids=lambda op: op.name)
+    def test_all_operators_generate(self, op):
+        """Test every operator can generate mutations from one shared parse."""
+        if isinstance(op, SyntaxTreeOperator):
+            mutations = op.mutate_tree(SHARED_TREE, SHARED_LINES, "test.py")
+        else:
+            mutations = op.mutate_lines(SHARED_LINES, "test.py", SHARED_SKIP_LINES)
+
+        # Should not raise
+        list(mutations)
+
+
+def _write_project(root):
+    """Create a tiny source tree with a test that pins its behaviour."""
+    src = root / "src"
+    tests = root / "tests"
+    src.mkdir()
+    tests.mkdir()
+    (src / "calc.py").write_text(
+        "def add(a, b):\n    return a + b\n\n\ndef less(a, b):\n    return a < b\n"
+    )
+    (tests / "test_calc.py").write_text(
+        "from calc import add, less\n\n\n"
+        "def test_calc():\n"
+        "    assert add(2, 3) == 5\n"
+        "    assert less(1, 2) and not less(2, 2)\n"
+    )
+    return src, tests
+
+
+class TestMutationEngine:
+    """Tests for the mutation engine."""
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Test that parallel runs report the same outcome per mutant."""
+        src, tests = _write_project(tmp_path)
+
+        serial = MutationEngine(src, tests, parallel=1).run()
+        parallel = MutationEngine(src, tests, parallel=2).run()
+
+        assert serial.total_mutants > 1
+        assert [r.mutation for r in parallel.results] == [r.mutation for r in serial.results]
+        assert [r.status for r in parallel.results] == [r.status for r in serial.results]
+        assert parallel.killed == serial.killed
+        assert all(r.status == MutantStatus.KILLED for r in serial.results)
+
+    def test_warm_pytest_matches_subprocess(self, tmp_path):
+        """Test that the long-lived pytest worker sees each mutant fresh."""
+        src, tests = _write_project(tmp_path)
+
+        cold = MutationEngine(src, tests, parallel=1, warm_pytest=False).run()
+        warm = MutationEngine(src, tests, parallel=1, warm_pytest=True).run()
+
+        assert [r.status for r in warm.results] == [r.status for r in cold.results]
+
+    def test_schema_matches_per_mutant_copies(self, tmp_path):
+        """Test that schema-switched mutants get the same outcome as copies."""
+        src, tests = _write_project(tmp_path)
+
+        copies = MutationEngine(src, tests, parallel=1, use_schema=False).run()
+        schema = MutationEngine(src, tests, parallel=1, use_schema=True).run()
+
+        assert [r.status for r in schema.results] == [r.status for r in copies.results]
+
+    def test_mutations_are_consumed_lazily(self, tmp_path):
+        """Test that mutants are tested while later ones are still being generated."""
+        src, tests = _write_project(tmp_path)
+        (src / "more.py").write_text(
+            "def sub(a, b):\n    return a - b\n\n\ndef mul(a, b):\n    return a * b\n"
+        )
+        engine = MutationEngine(src, tests, parallel=1)
+        engine.load_sources()
+        events = []
+
+        def generate():
+            for mutation in engine.generate_all_mutations():
+                events.append("generated")
+                yield mutation
+
+        test_mutant = engine.test_mutant
+        engine.test_mutant = lambda m: events.append("tested") or test_mutant(m)
+        result = engine._run_mutations(generate())
+
+        assert result.total_mutants == events.count("tested") > 1
+        # The first file's mutants run before the last file is generated
+        assert events.index("tested") < len(events) - 1 - events[::-1].index("generated")
+
+    def test_only_covered_skips_unexecuted_code(self, tmp_path):
+        """Test that mutants of code no test runs are survived untested."""
+        pytest.importorskip("coverage")
+        src, tests = _write_project(tmp_path)
+        (src / "calc.py").write_text(
+            (src / "calc.py").read_text() + "\n\ndef unused(a, b):\n    return a * b\n"
+        )
 
-        for op in operators:
-            # Should not raise
-            list(op.generate_mutations(source, "test.py"))
+        result = MutationEngine(src, tests, parallel=1, only_covered=True).run()
+
+        skipped = [r for r in result.results if r.test_output == "Not executed by any test"]
+        assert [r.mutation.original for r in skipped] == ["return a * b"]
+        assert all(r.status == MutantStatus.SURVIVED for r in skipped)
+
+    def test_duplicate_mutants_tested_once(self, tmp_path):
+        """Test that operators producing the same mutated line share one run."""
+        src, tests = _write_project(tmp_path)
+        (src / "calc.py").write_text("def zero():\n    return 0\n")
+        (tests / "test_calc.py").write_text(
+            "from calc import zero\n\n\ndef test_zero():\n    assert zero() == 0\n"
+        )
+
+        result = MutationEngine(src, tests, parallel=1).run()
+
+        # off_by_one and return_value both turn 'return 0' into 'return 1'
+        assert [r.mutation.mutated for r in result.results] == ["return 1"]
+        assert result.total_mutants == 1
+
+    def test_skip_surviving_lines(self, tmp_path):
+        """Test that later mutants of a line with a survivor are not tested."""
+        src, tests = _write_project(tmp_path)
+        (src / "calc.py").write_text("def scale(x):\n    return x * 10 + 4\n")
+        (tests / "test_calc.py").write_text(
+            "from calc import scale\n\n\ndef test_scale():\n    assert scale(0) > 0\n"
+        )
+
+        result = MutationEngine(src, tests, parallel=1, skip_surviving_lines=True).run()
+
+        first_survivor = next(
+            i for i, r in enumerate(result.results) if r.status == MutantStatus.SURVIVED
+        )
+        assert not result.results[first_survivor].skipped
+        assert len(result.results) > first_survivor + 1
+        assert all(r.skipped for r in result.results[first_survivor + 1 :])
+        assert result.survived == len(result.results) - result.killed
+
+    @pytest.mark.parametrize("warm_pytest", [False, True], ids=["subprocess", "warm"])
+    def test_entry_point_plugins_autoload(self, tmp_path, warm_pytest):
+        """Test that options from autoloaded plugins work in the project config."""
+        src, tests = _write_project(tmp_path)
+        (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = --hypothesis-show-statistics\n")
+
+        result = MutationEngine(src, tests, parallel=1, warm_pytest=warm_pytest).run()
+
+        assert result.total_mutants > 0
+        assert all(r.status == MutantStatus.KILLED for r in result.results)
+
+    def test_failing_unmutated_suite_aborts(self, tmp_path):
+        """Test that nothing is reported when the tests fail without mutation."""
+        src, tests = _write_project(tmp_path)
+        (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = --hypothesis-show-statistics\n")
+        engine = MutationEngine(src, tests, parallel=1, autoload_plugins=False)
+
+        with pytest.raises(UnmutatedTestsFailedError):
+            engine.run()
+
+    def test_stratified_sample_covers_every_file(self):
+        """Test that a small sample still draws from minority files."""
+        import random
+
+        def mutation(file_path, line):
+            return Mutation(MutationType.OFF_BY_ONE, file_path, line, "x = 1", "x = 2", "")
+
+        mutations = [mutation("big.py", i) for i in range(90)]
+        mutations += [mutation(f"small{n}.py", 1) for n in range(5)]
+
+        sample = stratified_sample(mutations, 10, rng=random.Random(0))
+
+        assert len(sample) == 10
+        assert {m.file_path for m in sample} >= {f"small{n}.py" for n in range(5)}
+        assert sample == sorted(sample, key=mutations.index)
+
+    def test_apply_mutation_leaves_source_untouched(self, tmp_path):
+        """Test that only the workspace copy of the mutated file changes."""
+        src, tests = _write_project(tmp_path)
+        (src / "pkg").mkdir()
+        (src / "pkg" / "util.py").write_text("X = 1\n")
+        engine = MutationEngine(src, tests, parallel=1)
+        mutation = next(engine.generate_all_mutations())
+        original = (src / mutation.file_path).read_text()
+
+        workspace = tmp_path / "workspace"
+        mutated_path = engine.apply_mutation(mutation, workspace)
+
+        assert (src / mutation.file_path).read_text() == original
+        assert not mutated_path.is_symlink()
+        assert mutation.mutated in mutated_path.read_text()
+        assert (workspace / "pkg" / "util.py").read_text() == "X = 1\n"
+
+    def test_apply_mutation_rejects_path_traversal(self, tmp_path):
+        """Test that mutations cannot write outside the workspace."""
+        src, tests = _write_project(tmp_path)
+        engine = MutationEngine(src, tests, parallel=1)
+        mutation = replace(next(engine.generate_all_mutations()), file_path="../escape.py")
+
+        with pytest.raises(ValueError):
+            engine.apply_mutation(mutation, tmp_path / "workspace")
+
+    def test_cache_skips_unchanged_files(self, tmp_path, monkeypatch):
+        """Test that a second run reuses cached results instead of retesting."""
+        src, tests = _write_project(tmp_path)
+        cache_path = tmp_path / "cache.json"
+
+        first = MutationEngine(src, tests, parallel=1, cache_path=cache_path).run()
+        assert cache_path.exists()
+
+        def fail(self, mutation):
+            raise AssertionError("mutant should have come from the cache")
+
+        monkeypatch.setattr(MutationEngine, "test_mutant", fail)
+        second = MutationEngine(src, tests, parallel=1, cache_path=cache_path).run()
+
+        assert [r.status for r in second.results] == [r.status for r in first.results]
+        assert second.killed == first.killed
+
+
+class TestRunCapped:
+    """Tests for bounded output capture."""
+
+    def test_keeps_start_and_end_of_long_output(self):
+        """Test huge output is cut in the middle and the exit code survives."""
+        code = "print('first'); print('x' * 1_000_000); print('last'); raise SystemExit(3)"
+        returncode, output = _run_capped([sys.executable, "-c", code], timeout=30)
+
+        assert returncode == 3
+        assert output.startswith("first")
+        assert output.rstrip().endswith("last")
+        assert len(output) < 20_000
+
+    def test_timeout(self):
+        """Test a command outliving its timeout is killed."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            _run_capped([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.5)
+
+
+class TestBuildSchema:
+    """Tests for mutation schema generation."""
+
+    def test_switches_simple_statements(self):
+        """Test that mutants of one line share an if/elif switch."""
+        source = "def f(a, b):\n    return a + b\n"
+        mutations = {
+            str(i): m
+            for i, m in enumerate(TreeArithmeticSwapOperator().generate_mutations(source, "f.py"))
+        }
+
+        schema, encoded = build_schema(source, mutations)
+
+        assert encoded == set(mutations)
+        assert 'environ.get("SPECTRE_MUTANT_ID") == "0"' in schema
+        assert "        return a + b" in schema
+        compile(schema, "f.py", "exec")
+
+    def test_skips_compound_statement_headers(self):
+        """Test that 'if' headers are left for per-mutant copies."""
+        source = "def f(x):\n    if x < 3:\n        return 1\n    return 0\n"
+        mutations = {
+            str(i): m
+            for i, m in enumerate(TreeComparisonSwapOperator().generate_mutations(source, "f.py"))
+        }
+
+        schema, encoded = build_schema(source, mutations)
+
+        assert mutations
+        assert not encoded
+        assert schema == source
+
+
+def _sample_result(count):
+    """Build a result holding count mutants, every other one surviving."""
+    result = MutationTestResult()
+    for i in range(count):
+        mutation = Mutation(
+            mutation_type=MutationType.ARITHMETIC_SWAP,
+            file_path="calc.py",
+            line_number=i + 1,
+            original="return a + b",
+            mutated="return a - b",
+            description="Swap '+' with '-'",
+        )
+        status = MutantStatus.SURVIVED if i % 2 else MutantStatus.KILLED
+        result.results.append(MutantResult(mutation=mutation, status=status, duration=0.25))
+    result.total_mutants = count
+    result.killed = (count + 1) // 2
+    result.survived = count // 2
+    return result
+
+
+class TestMutationReport:
+    """Tests for mutation report output."""
+
+    @pytest.mark.parametrize("count", [0, 3])
+    def test_save_json_matches_to_json(self, tmp_path, count):
+        """Test that the streamed file is the same document as to_json."""
+        report = MutationReport(_sample_result(count))
+        path = tmp_path / "report.json"
+
+        report.save_json(path)
+        saved = path.read_text()
+        expected = report.to_json()
+
+        # Only the timestamps differ
+        assert saved.split("\n")[2:] == expected.split("\n")[2:]
+        assert json.loads(saved)["results"] == json.loads(expected)["results"]
+
+    def test_save_ndjson(self, tmp_path):
+        """Test one summary line followed by one line per result."""
+        report = MutationReport(_sample_result(3))
+        path = tmp_path / "report.ndjson"
+
+        report.save_ndjson(path)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+        assert lines[0]["summary"]["total_mutants"] == 3
+        assert [line["status"] for line in lines[1:]] == ["KILLED", "SURVIVED", "KILLED"]
+
+    def test_html_escapes_source_text(self):
+        """Test that code shown in the HTML report cannot inject markup."""
+        result = _sample_result(2)
+        result.results[1] = replace(
+            result.results[1],
+            mutation=replace(result.results[1].mutation, mutated="return a < b"),
+        )
+
+        page = MutationReport(result).to_html()
+
+        assert "<code>return a &lt; b</code>" in page
+        assert "return a < b" not in page
+
+    def test_save_html_matches_to_html(self, tmp_path):
+        """Test that the streamed HTML file is the same page as to_html."""
+        report = MutationReport(_sample_result(3))
+        path = tmp_path / "report.html"
+
+        report.save_html(path)
+        saved = path.read_text()
+        expected = report.to_html()
+
+        # Only the generation time differs
+        assert re.sub("Generated: .*", "", saved) == re.sub("Generated: .*", "", expected)
+        assert saved.count("<td>calc.py</td>") == 3 + 1
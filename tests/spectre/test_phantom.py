@@ -1,7 +1,10 @@
 """Tests for PHANTOM differential fuzzer."""
 
+import pytest
+
 from ethereum.common.types import Opcode
 from spectre.phantom.executor import (
+    CONTRACT_ADDRESS,
     DifferentialExecutor,
     DivergenceType,
     Fork,
@@ -9,11 +12,14 @@ from spectre.phantom.executor import (
 from spectre.phantom.generator import (
     BoundaryBytecodeGenerator,
     BytecodeGenerator,
+    GeneratedBytecode,
     GeneratorStrategy,
     GrammarBytecodeGenerator,
     RandomBytecodeGenerator,
 )
-from spectre.phantom.minimizer import CustomMinimizer
+from spectre.phantom.minimizer import CustomMinimizer, DeltaDebugger, MinimizationResult
+
+MAJOR_DIVERGENCES = {DivergenceType.SUCCESS_MISMATCH, DivergenceType.RETURN_DATA_MISMATCH}
 
 
 class TestRandomBytecodeGenerator:
@@ -28,22 +34,21 @@ class TestRandomBytecodeGenerator:
         assert 10 <= len(result.code) <= 20
         assert result.strategy == GeneratorStrategy.RANDOM
 
-    def test_deterministic_with_seed(self):
-        """Test that same seed produces same output."""
-        gen = RandomBytecodeGenerator()
-        result1 = gen.generate(seed=42)
-        result2 = gen.generate(seed=42)
-
-        assert result1.code == result2.code
-
-    def test_different_seeds_different_output(self):
-        """Test that different seeds produce different output."""
+    @pytest.mark.parametrize(
+        "seed_a,seed_b,expect_equal",
+        [
+            pytest.param(42, 42, True, id="same_seed"),
+            # Very unlikely to be the same
+            pytest.param(1, 2, False, id="different_seeds"),
+        ],
+    )
+    def test_seed_determines_output(self, seed_a, seed_b, expect_equal):
+        """Test that the seed alone decides the output."""
         gen = RandomBytecodeGenerator()
-        result1 = gen.generate(seed=1)
-        result2 = gen.generate(seed=2)
+        result1 = gen.generate(seed=seed_a)
+        result2 = gen.generate(seed=seed_b)
 
-        # Very unlikely to be the same
-        assert result1.code != result2.code
+        assert (result1.code == result2.code) == expect_equal
 
 
 class TestGrammarBytecodeGenerator:
@@ -130,6 +135,18 @@ class TestDifferentialExecutor:
         assert trace.fork == Fork.FRONTIER
         assert trace.result.success
 
+    def test_executions_do_not_share_state(self):
+        """Test that storage written by one execution is not seen by the next."""
+        executor = DifferentialExecutor()
+
+        # PUSH1 1, PUSH1 0, SSTORE, STOP
+        code = bytes([Opcode.PUSH1, 0x01, Opcode.PUSH1, 0x00, Opcode.SSTORE, Opcode.STOP])
+        first = executor.execute_single(code, Fork.FRONTIER)
+        second = executor.execute_single(bytes([Opcode.STOP]), Fork.FRONTIER)
+
+        assert first.final_state.get_storage(CONTRACT_ADDRESS, 0) == 1
+        assert second.final_state.get_storage(CONTRACT_ADDRESS, 0) == 0
+
     def test_detects_push0_divergence(self):
         """Test that PUSH0 divergence is detected between forks."""
         executor = DifferentialExecutor(
@@ -147,6 +164,22 @@ class TestDifferentialExecutor:
         assert not trace_a.result.success
         assert trace_b.result.success
 
+    def test_find_any_stops_at_first_divergence(self):
+        """Test that find_any reports only the first divergence."""
+        executor = DifferentialExecutor(fork_a=Fork.FRONTIER, fork_b=Fork.SHANGHAI)
+        bytecode = GeneratedBytecode(
+            # PUSH0, PUSH1 32, PUSH1 0, RETURN: fails on Frontier, returns data on Shanghai
+            code=bytes([Opcode.PUSH0, Opcode.PUSH1, 0x20, Opcode.PUSH1, 0x00, Opcode.RETURN]),
+            strategy=GeneratorStrategy.RANDOM,
+            description="Test",
+        )
+
+        everything = executor.execute_differential(bytecode)
+        first = executor.execute_differential(bytecode, find_any=True)
+
+        assert len(everything) > 1
+        assert [d.divergence_type for d in first] == [everything[0].divergence_type]
+
     def test_compare_identical_execution(self):
         """Test that identical executions show no divergence."""
         executor = DifferentialExecutor(
@@ -157,8 +190,6 @@ class TestDifferentialExecutor:
         # Code that works the same in both forks
         code = bytes([Opcode.PUSH1, 0x01, Opcode.PUSH1, 0x02, Opcode.ADD, Opcode.STOP])
 
-        from spectre.phantom.generator import GeneratedBytecode
-
         bytecode = GeneratedBytecode(
             code=code,
             strategy=GeneratorStrategy.RANDOM,
@@ -167,19 +198,55 @@ class TestDifferentialExecutor:
 
         divergences = executor.execute_differential(bytecode)
 
-        # Filter out expected divergences (gas differences might occur)
-        unexpected = [d for d in divergences if not d.is_expected()]
-
-        # Gas differences are expected between forks
-        # Only check for major divergences
+        # Gas differences are expected between forks, so only check for
+        # unexpected major divergences
         major = [
-            d
-            for d in unexpected
-            if d.divergence_type
-            in (DivergenceType.SUCCESS_MISMATCH, DivergenceType.RETURN_DATA_MISMATCH)
+            d for d in divergences if d.divergence_type in MAJOR_DIVERGENCES and not d.is_expected()
         ]
         assert len(major) == 0
 
+    def test_parallel_matches_serial(self):
+        """Test that worker processes report the same divergences in order."""
+        bytecodes = list(BytecodeGenerator().generate(count=600, seed=7))
+
+        serial = DifferentialExecutor(parallel=1).run(iter(bytecodes))
+        parallel = DifferentialExecutor(parallel=2).run(iter(bytecodes))
+
+        assert parallel.total_executions == serial.total_executions == 600
+        assert parallel.expected_divergences == serial.expected_divergences > 0
+        assert [d.description for d in parallel.divergences] == [
+            d.description for d in serial.divergences
+        ]
+
+    def test_parallel_runs_single_batch_serially(self, monkeypatch):
+        """Test that input smaller than one batch starts no worker processes."""
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("worker pool started for a single batch")
+
+        monkeypatch.setattr("spectre.phantom.executor.ProcessPoolExecutor", no_pool)
+        bytecodes = BytecodeGenerator().generate(count=100, seed=7)
+
+        result = DifferentialExecutor(parallel=4).run(bytecodes)
+
+        assert result.total_executions == 100
+
+    def test_parallel_stops_early(self):
+        """Test that closing the parallel stream stops pulling more bytecode."""
+        pulled = 0
+
+        def bytecodes():
+            nonlocal pulled
+            for bytecode in BytecodeGenerator().generate(count=100_000, seed=7):
+                pulled += 1
+                yield bytecode
+
+        executions = DifferentialExecutor(parallel=2)._execute_all(bytecodes())
+        next(executions)
+        executions.close()
+
+        assert pulled < 100_000
+
 
 class TestDeltaDebugger:
     """Tests for delta debugging minimizer."""
@@ -199,6 +266,37 @@ class TestDeltaDebugger:
         assert 0x5F in result.minimized
         assert len(result.minimized) <= len(result.original)
 
+    def test_minimize_tests_each_candidate_once(self):
+        """Test that repeated candidates are answered from the cache."""
+        calls: list[bytes] = []
+
+        def two_push2(code: bytes) -> bool:
+            calls.append(code)
+            return code.count(Opcode.PUSH2) >= 2
+
+        original = bytes.fromhex("61606161616161616060616060616061606061616061616160616161")
+        result = CustomMinimizer(two_push2).minimize(original)
+
+        assert result.minimized == bytes([Opcode.PUSH2, Opcode.PUSH2])
+        assert len(calls) == len(set(calls))
+
+    def test_minimize_single_culprit_is_logarithmic(self):
+        """Test that isolating one failing byte needs O(log n) oracle calls."""
+        calls: list[bytes] = []
+
+        def has_push0(code: bytes) -> bool:
+            calls.append(code)
+            return Opcode.PUSH0 in code
+
+        # 64 bytes: PUSH1 1 (x15), PUSH0, PUSH1 2 (x16), STOP
+        original = bytes.fromhex("6001" * 15 + "5f" + "6002" * 16 + "00")
+        result = CustomMinimizer(has_push0).minimize(original)
+
+        assert result.minimized == bytes([Opcode.PUSH0])
+        assert result.iterations < 20
+        # Twice log2(64); currently 10
+        assert len(calls) <= 12
+
     def test_minimize_empty_input(self):
         """Test minimization with empty input."""
         minimizer = CustomMinimizer(lambda x: False)
@@ -214,10 +312,23 @@ class TestDeltaDebugger:
 
         assert len(result.minimized) == 1
 
+    def test_minimize_linear_gallops_over_removable_runs(self):
+        """Test that long removable stretches cost far fewer tests than bytes."""
+
+        class PushCounter(DeltaDebugger):
+            def _test_bytecode(self, bytecode: bytes) -> bool:
+                return bytecode.count(Opcode.PUSH0) >= 2
+
+        original = bytes(
+            [Opcode.PUSH0] + [Opcode.STOP] * 500 + [Opcode.PUSH0] + [Opcode.STOP] * 500
+        )
+        result = PushCounter().minimize_linear(original)
+
+        assert result.minimized == bytes([Opcode.PUSH0, Opcode.PUSH0])
+        assert result.iterations < 100
+
     def test_reduction_percent(self):
         """Test reduction percentage calculation."""
-        from spectre.phantom.minimizer import MinimizationResult
-
         result = MinimizationResult.from_bytecodes(
             original=bytes(100),
             minimized=bytes(25),